@@ -0,0 +1,165 @@
+"""Decode time and memory of ``main_df``/``padded_df`` stored as parquet vs Arrow IPC.
+
+Builds the bundled field project once (parquet, as by default), rewrites its
+``main_df`` and one-minute ``padded_df`` as LZ4 parquet, uncompressed IPC and
+LZ4 IPC, then reads each copy in fresh processes the way pipeline steps and
+dashboard workers do: ``--readers`` times in a row, keeping every frame alive.
+
+For each format it reports the size on disk, the median time of one full read,
+and the resident memory the reads leave behind, split (on Linux) into anonymous
+memory, private to the process, and file-backed memory, which memory-mapped
+reads share with every other process mapping the same file through the OS page
+cache.
+
+Usage::
+
+    python benchmarks/ipc_vs_parquet.py [--readers 4] [--repeats 5] [--workdir DIR]
+"""
+
+import argparse
+import json
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+import polars as pl
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+FIELD_ZIP = REPO_ROOT / "examples" / "example_data_field" / "data.zip"
+TABLES = ["main_df", "padded_df@1m"]
+FORMATS = {"parquet": None, "ipc": "uncompressed", "ipc_lz4": "lz4"}
+
+
+def build_field_project(root: Path) -> Path:
+	"""Field project with main_df and a one-minute padded_df, as the e2e test builds it."""
+	import deepecohab as d
+
+	data_dir = root / "data"
+	data_dir.mkdir(parents=True)
+	with zipfile.ZipFile(FIELD_ZIP) as zf:
+		zf.extractall(data_dir)
+	config_path, _ = d.create_ecohab_project(
+		project_location=root,
+		experiment_name="bench_field",
+		data_path=data_dir,
+		light_phase_start="07:00:00",
+		dark_phase_start="20:00:00",
+		field_ecohab=True,
+		timezone="Europe/Warsaw",
+	)
+	d.get_ecohab_data_structure(
+		config_path,
+		fname_prefix="COM",
+		sanitize_animal_ids=True,
+		min_antenna_crossings=100,
+		custom_layout=True,
+		padded=["1m"],
+	)
+	return config_path
+
+
+def _memory() -> dict[str, int]:
+	"""Resident memory of this process in bytes (anonymous/file-backed on Linux)."""
+	status = Path("/proc/self/status")
+	if status.is_file():
+		fields = dict(line.split(":", 1) for line in status.read_text().splitlines())
+		return {
+			name: int(fields[name].split()[0]) * 1024 for name in ("RssAnon", "RssFile", "VmRSS")
+		}
+	return {"VmRSS": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}
+
+
+def read_many(results: Path, key: str, readers: int) -> dict[str, float | int]:
+	"""Read a table ``readers`` times, as that many consumers would; time and memory."""
+	from deepecohab.utils import results_io
+
+	location = results_io.result_location(results, key)
+	before = _memory()
+	frames, times = [], []
+	for _ in range(readers):
+		start = time.perf_counter()
+		frames.append(results_io.read_result(location))
+		times.append(time.perf_counter() - start)
+	after = _memory()
+	return {
+		"read_seconds": statistics.median(times),
+		**{f"{name}_bytes": after[name] - before[name] for name in after},
+	}
+
+
+def run(workdir: Path, readers: int, repeats: int) -> list[dict]:
+	"""Write the field tables in every format under ``workdir`` and benchmark reading them."""
+	from deepecohab.utils import results_io
+
+	config_path = build_field_project(workdir / "project")
+	source = config_path.parent / "results"
+	rows = []
+	for fmt, compression in FORMATS.items():
+		results = workdir / fmt
+		results.mkdir()
+		for key in TABLES:
+			table = results_io.read_result(results_io.result_location(source, key))
+			results_io.write_result(table.lazy(), results, key, ipc_compression=compression)
+		for key in TABLES:
+			samples = []
+			for _ in range(repeats):
+				# A fresh process per sample: nothing is left on its heap by earlier reads.
+				out = subprocess.run(
+					[sys.executable, __file__, "--read", str(results), key, str(readers)],
+					check=True,
+					capture_output=True,
+					text=True,
+				)
+				samples.append(json.loads(out.stdout))
+			row = {
+				"format": fmt,
+				"table": key,
+				"size_mb": round(
+					results_io.result_size(results_io.result_location(results, key)) / 2**20, 1
+				),
+			}
+			for field in samples[0]:
+				row[field] = statistics.median(sample[field] for sample in samples)
+			row["read_seconds"] = round(row["read_seconds"], 3)
+			rows.append(row)
+	return rows
+
+
+def report(rows: list[dict]) -> pl.DataFrame:
+	"""Results as a table, memory in MB."""
+	df = pl.DataFrame(rows)
+	return df.with_columns(
+		(pl.col(c) / 2**20).round(1).name.map(lambda c: c.replace("_bytes", "_mb"))
+		for c in df.columns
+		if c.endswith("_bytes")
+	).drop(c for c in df.columns if c.endswith("_bytes"))
+
+
+def main() -> None:
+	"""Command-line entry point; ``--read`` is the per-process reader it spawns."""
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+	parser.add_argument("--readers", type=int, default=4, help="reads per process")
+	parser.add_argument("--repeats", type=int, default=5, help="processes per format and table")
+	parser.add_argument("--workdir", type=Path, help="keep the projects here (default: temp)")
+	parser.add_argument("--read", nargs=3, help=argparse.SUPPRESS)
+	args = parser.parse_args()
+
+	if args.read:
+		results, key, readers = args.read
+		print(json.dumps(read_many(Path(results), key, int(readers))))
+		return
+
+	with tempfile.TemporaryDirectory() as tmp:
+		workdir = args.workdir or Path(tmp)
+		workdir.mkdir(parents=True, exist_ok=True)
+		with pl.Config(tbl_rows=-1, tbl_cols=-1, tbl_width_chars=200):
+			print(report(run(workdir, args.readers, args.repeats)))
+
+
+if __name__ == "__main__":
+	main()
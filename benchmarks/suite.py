@@ -0,0 +1,199 @@
+"""Time and memory of ingest and every pipeline step on synthetic data of growing size.
+
+For each scale (animals x days) raw data is written by
+``deepecohab.utils.synthetic.generate_raw_data``, once per work directory since the
+generator is deterministic. A fresh process then builds a project on it (``main_df``
+and the padded tables) and runs the whole pipeline serially, so the peak resident
+memory it reports belongs to that scale alone. The numbers are read from the
+project's profiling ledger (``results/_profile.parquet``): wall and CPU seconds,
+the process's peak RSS once the step ended, and the rows it wrote; with
+``--repeats`` the median of the runs is kept.
+
+The results are compared to a baseline (``benchmarks/baseline.json``; timings only
+compare on the machine that recorded them). A step regresses when its wall time or
+peak RSS exceeds the baseline by more than ``--tolerance`` and by more than a noise
+floor. The script exits with status 1 if any step regressed, so CI can run it, and
+``--update-baseline`` stores the new numbers instead.
+
+Usage::
+
+    python benchmarks/suite.py [--scales 8x3 15x7 30x14] [--boards 4] [--repeats 3]
+        [--baseline benchmarks/baseline.json] [--update-baseline] [--tolerance 0.25]
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import polars as pl
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+BASELINE = REPO_ROOT / "benchmarks" / "baseline.json"
+
+# Scale name -> (animals, days).
+SCALES = {
+	"8x3": (8, 3),
+	"15x7": (15, 7),
+	"30x14": (30, 14),
+	"60x30": (60, 30),
+	"60x60": (60, 60),
+}
+DEFAULT_SCALES = ["8x3", "15x7", "30x14"]
+LAYOUT_NAMES = {1: "default", 4: "field"}
+METRICS = ["wall_seconds", "cpu_seconds", "peak_rss_bytes", "rows_out"]
+
+# Differences below these are noise, whatever the ratio.
+MIN_SECONDS = 0.25
+MIN_RSS_BYTES = 64 * 2**20
+
+
+def generate(data_dir: Path, animals: int, days: int, boards: int) -> dict:
+	"""Write the raw data of one scale unless it is there already; project arguments."""
+	from deepecohab.utils.synthetic import generate_raw_data
+
+	marker = data_dir / "dataset.json"
+	if marker.is_file():
+		return json.loads(marker.read_text())
+	shutil.rmtree(data_dir, ignore_errors=True)
+	dataset = generate_raw_data(data_dir, animals=animals, days=days, boards=boards)
+	kwargs = {
+		"project": {**dataset.project_kwargs(), "data_path": str(data_dir)},
+		"structure": dataset.structure_kwargs(),
+	}
+	marker.write_text(json.dumps(kwargs))
+	return kwargs
+
+
+def run_scale(project_dir: Path, kwargs: dict) -> list[dict]:
+	"""Build a project and run the pipeline; the ledger rows of every build and step."""
+	import deepecohab as d
+
+	config_path, _ = d.create_ecohab_project(
+		project_location=project_dir, experiment_name="bench", **kwargs["project"]
+	)
+	d.get_ecohab_data_structure(config_path, **kwargs["structure"])
+	list(d.df_registry.run_pipeline(config_path))
+	ledger = d.df_registry.profile_report(config_path, raw=True)
+	return ledger.select("step", *METRICS).to_dicts()
+
+
+def measure(workdir: Path, scale: str, boards: int, repeats: int) -> dict[str, dict]:
+	"""Median of each step's metrics over ``repeats`` fresh processes."""
+	animals, days = SCALES[scale]
+	data_dir = workdir / f"{LAYOUT_NAMES[boards]}_{scale}" / "data"
+	kwargs = generate(data_dir, animals, days, boards)
+	runs = []
+	for _ in range(repeats):
+		project_dir = data_dir.parent / "project"
+		shutil.rmtree(project_dir, ignore_errors=True)
+		out = subprocess.run(
+			[sys.executable, __file__, "--run", str(project_dir), json.dumps(kwargs)],
+			check=True,
+			capture_output=True,
+			text=True,
+		)
+		runs.append(json.loads(out.stdout.splitlines()[-1]))
+	steps = {}
+	for row in runs[0]:
+		samples = [r for run in runs for r in run if r["step"] == row["step"]]
+		steps[row["step"]] = {m: statistics.median(s[m] for s in samples) for m in METRICS}
+	return steps
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> pl.DataFrame:
+	"""One row per scale and step, with the baseline and whether it regressed."""
+	rows = []
+	for scale, steps in results.items():
+		for step, current in steps.items():
+			base = baseline.get(scale, {}).get(step, {})
+			wall, rss = base.get("wall_seconds"), base.get("peak_rss_bytes")
+			slower = wall is not None and (
+				current["wall_seconds"] > wall * (1 + tolerance)
+				and current["wall_seconds"] - wall > MIN_SECONDS
+			)
+			larger = rss is not None and (
+				current["peak_rss_bytes"] > rss * (1 + tolerance)
+				and current["peak_rss_bytes"] - rss > MIN_RSS_BYTES
+			)
+			rows.append(
+				{
+					"scale": scale,
+					"step": step,
+					"wall_s": round(current["wall_seconds"], 3),
+					"base_wall_s": wall and round(wall, 3),
+					"peak_rss_mb": round(current["peak_rss_bytes"] / 2**20),
+					"base_rss_mb": rss and round(rss / 2**20),
+					"rows_out": current["rows_out"],
+					"regressed": ", ".join(
+						name for name, flag in (("time", slower), ("memory", larger)) if flag
+					),
+				}
+			)
+	return pl.DataFrame(rows)
+
+
+def environment() -> dict[str, str | int]:
+	"""What the baseline was recorded on."""
+	return {
+		"machine": platform.machine(),
+		"processor": platform.processor(),
+		"cpus": os.cpu_count(),
+		"python": platform.python_version(),
+		"polars": pl.__version__,
+	}
+
+
+def main() -> None:
+	"""Command-line entry point; ``--run`` is the per-scale process it spawns."""
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+	parser.add_argument("--scales", nargs="+", choices=SCALES, default=DEFAULT_SCALES)
+	parser.add_argument("--boards", type=int, choices=LAYOUT_NAMES, default=4)
+	parser.add_argument("--repeats", type=int, default=1, help="processes per scale")
+	parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative growth")
+	parser.add_argument("--baseline", type=Path, default=BASELINE)
+	parser.add_argument("--update-baseline", action="store_true")
+	parser.add_argument("--workdir", type=Path, help="keep data and projects here (default: temp)")
+	parser.add_argument("--run", nargs=2, help=argparse.SUPPRESS)
+	args = parser.parse_args()
+
+	if args.run:
+		project_dir, kwargs = args.run
+		print(json.dumps(run_scale(Path(project_dir), json.loads(kwargs))))
+		return
+
+	baseline = json.loads(args.baseline.read_text()) if args.baseline.is_file() else {}
+	with tempfile.TemporaryDirectory() as tmp:
+		workdir = args.workdir or Path(tmp)
+		results = {
+			f"{LAYOUT_NAMES[args.boards]}/{scale}": measure(
+				workdir, scale, args.boards, args.repeats
+			)
+			for scale in args.scales
+		}
+
+	report = compare(results, baseline.get("results", {}), args.tolerance)
+	with pl.Config(tbl_rows=-1, tbl_cols=-1, tbl_width_chars=200):
+		print(report)
+
+	if args.update_baseline:
+		baseline = {
+			"environment": environment(),
+			"results": {**baseline.get("results", {}), **results},
+		}
+		args.baseline.write_text(json.dumps(baseline, indent=1, sort_keys=True) + "\n")
+		print(f"Baseline written to {args.baseline}")
+	elif (report["regressed"] != "").any():
+		print("Regressions against the baseline:", file=sys.stderr)
+		print(report.filter(pl.col("regressed") != ""), file=sys.stderr)
+		sys.exit(1)
+
+
+if __name__ == "__main__":
+	main()
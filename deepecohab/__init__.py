@@ -1,5 +1,6 @@
 from importlib.metadata import version
 
+from deepecohab.analysis import rollups as rollups
 from deepecohab.analysis.antenna_analysis import (
 	calculate_activity as calculate_activity,
 )
@@ -9,9 +10,15 @@ from deepecohab.analysis.antenna_analysis import (
 from deepecohab.analysis.antenna_analysis import (
 	calculate_features as calculate_features,
 )
+from deepecohab.analysis.antenna_analysis import (
+	calculate_group_sizes as calculate_group_sizes,
+)
 from deepecohab.analysis.antenna_analysis import (
 	calculate_incohort_sociability as calculate_incohort_sociability,
 )
+from deepecohab.analysis.antenna_analysis import (
+	calculate_intervals as calculate_intervals,
+)
 from deepecohab.analysis.antenna_analysis import (
 	calculate_matches as calculate_matches,
 )
@@ -37,6 +44,12 @@ from deepecohab.core.registries import (
 	plot_registry as plot_registry,
 )
 from deepecohab.plotting import plot_catalog as plot_catalog
+from deepecohab.utils.artifact_store import (
+	DiskStore as DiskStore,
+)
+from deepecohab.utils.artifact_store import (
+	MemoryStore as MemoryStore,
+)
 from deepecohab.utils.auxfun import (
 	load_ecohab_data as load_ecohab_data,
 )
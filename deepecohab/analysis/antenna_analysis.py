@@ -1,109 +1,226 @@
+import math
 from typing import Any, Literal
 
+import numpy as np
 import polars as pl
 from openskill.models import PlackettLuce
 
 from deepecohab.core.registries import df_registry
-from deepecohab.utils import auxfun
+from deepecohab.utils import auxfun, phase_calendar
 
+# main_df's time_spent is rounded to 0.01 s, so a stay that touches the previous
+# one can start a few milliseconds before or after it ended.
+_TOUCH_TOLERANCE_US = 10_000
 
-def _get_activity(lf: pl.LazyFrame, cfg: dict[str, Any]) -> pl.LazyFrame:
-	"""Aggregate per-animal occupancy and visit counts for every position.
 
-	Drops tunnel directionality so the two ends of a tunnel collapse to one
-	position, then sums dwell time and counts visits per animal in each
-	position/hour cell. Interpolated reads (synthesised to bridge gaps, not real
-	antenna detections) are excluded from the visit count but still contribute
-	their time.
+def _get_intervals(lf: pl.LazyFrame, cfg: dict[str, Any]) -> pl.LazyFrame:
+	"""Merge each animal's consecutive stays in one position into occupancy bouts.
+
+	Every ``main_df`` row is a stay ``[datetime - time_spent, datetime)``. After tunnel
+	directionality is dropped, consecutive stays of an animal in the same position
+	that touch, to within the rounding of ``time_spent``, are merged into one bout.
+	Bouts are then cut at calendar segment boundaries with
+	:func:`phase_calendar.split_intervals`, so each row lies in one phase/day/hour
+	cell, and zero-length pieces are dropped.
 
 	Args:
-		lf: Padded antenna table (``padded_df``).
+		lf: ``main_df``, one stay per row.
 		cfg: Path or mapping resolved by ``read_config``.
 
 	Returns:
-		LazyFrame with ``time_in_position`` and ``visits_to_position`` per
-		phase/day/phase_count/hour/position/animal.
+		LazyFrame with ``animal_id``, ``position``, ``start`` and ``end`` (int64
+		microseconds since the epoch) and the calendar labels, sorted by position
+		and start.
 	"""
-	lf = auxfun.remove_tunnel_directionality(lf, cfg)
+	stays = (
+		auxfun.remove_tunnel_directionality(lf, cfg)
+		.select(
+			"animal_id",
+			"position",
+			(
+				pl.col("datetime")
+				- pl.duration(
+					microseconds=(pl.col("time_spent") * 1_000_000).round().cast(pl.Int64)
+				)
+			).alias("start"),
+			pl.col("datetime").alias("end"),
+		)
+		.sort("start")
+	)
+	touching = (pl.col("start") - pl.col("end").shift()).abs() < pl.duration(
+		microseconds=_TOUCH_TOLERANCE_US
+	)
+	new_bout = (pl.col("position") != pl.col("position").shift()) | ~touching
 
-	return lf.group_by(["phase", "day", "phase_count", "hour", "position", "animal_id"]).agg(
-		pl.sum("time_spent").alias("time_in_position"),
-		(~pl.col("interpolated")).sum().alias("visits_to_position"),
+	return (
+		stays.with_columns(new_bout.fill_null(True).cum_sum().over("animal_id").alias("bout"))
+		.group_by("animal_id", "bout")
+		.agg(pl.col("position").first(), pl.min("start"), pl.max("end"))
+		.pipe(phase_calendar.split_intervals, cfg)
+		.filter(pl.col("end") > pl.col("start"))
+		.select(
+			"animal_id",
+			"position",
+			pl.col("start").dt.epoch("us"),
+			pl.col("end").dt.epoch("us"),
+			*phase_calendar.CALENDAR_COLUMNS,
+		)
+		.sort("position", "start")
 	)
 
 
-def _get_time_alone(lf: pl.LazyFrame, cfg: dict[str, Any]) -> pl.LazyFrame:
-	"""Compute how long each animal occupied a position with no other animal present.
+@df_registry.register_step("intervals", requires=["main_df"], sorted_by=["position", "start"])
+def calculate_intervals(cfg: dict[str, Any], **kwargs) -> pl.LazyFrame:
+	"""Build the occupancy bouts shared by the interval-based analyses.
 
-	Uses a sweep-line over occupancy intervals: each animal's stay in a position
-	becomes an enter (+1) and a leave (-1) event, and a running ``n_active`` count
-	per position tracks how many animals are present at any instant. Spans where
-	exactly one animal is present (``n_active == 1``) are solitary; their length is
-	the time until the next event. The occupant is recovered with a second signed
-	counter (``id_active``): summing the per-animal physical codes leaves the lone
-	occupant's code standing when only one is active, which is mapped back to the
-	enum label via ``id_lookup``. ``undefined`` positions are excluded.
+	Solitary time, time in position and pairwise meetings all read these bouts
+	(see :func:`_get_intervals`) instead of rebuilding and sorting intervals from
+	``main_df`` or ``padded_df`` themselves. With day-partitioned results the
+	rows are sorted by position and start within each day.
 
 	Args:
-		lf: Padded antenna table (``padded_df``).
+	    cfg: resolved project config.
+
+	Returns:
+	    LazyFrame with one row per bout and calendar cell.
+	"""
+	return _get_intervals(auxfun._get_data(cfg, key="main_df"), cfg)
+
+
+def _get_activity(lf: pl.LazyFrame, intervals: pl.LazyFrame, cfg: dict[str, Any]) -> pl.LazyFrame:
+	"""Aggregate per-animal occupancy and visit counts for every position.
+
+	Dwell time is the summed length of the occupancy bouts in each
+	position/hour cell. Visits are counted from ``main_df`` with tunnel
+	directionality dropped, so the two ends of a tunnel collapse to one position.
+	As in ``padded_df``, a stay crossing a minute mark is interpolated rather than
+	a visit: it contributes its time but is not counted.
+
+	Args:
+		lf: ``main_df``, one stay per row (not ``padded_df``, whose pieces are not visits).
+		intervals: occupancy bouts of ``lf`` from :func:`_get_intervals`.
 		cfg: Path or mapping resolved by ``read_config``.
 
 	Returns:
-		LazyFrame with ``time_alone`` (seconds) per
+		LazyFrame with ``time_in_position`` and ``visits_to_position`` per
 		phase/day/phase_count/hour/position/animal.
 	"""
-	lf = auxfun.remove_tunnel_directionality(lf, cfg)
-	df_intervals = lf.filter(pl.col("position") != "undefined").with_columns(
-		pl.col("datetime").alias("end"),
-		(pl.col("datetime").sub(pl.col("time_spent").mul(1000_000).cast(pl.Duration("us")))).alias(
-			"start"
-		),
-		pl.col("animal_id").to_physical().cast(pl.Int64).alias("id_code"),
+	keys = ["phase", "day", "phase_count", "hour", "position", "animal_id"]
+
+	time_in_position = intervals.group_by(keys).agg(
+		((pl.col("end") - pl.col("start")).sum() / 1_000_000).alias("time_in_position")
+	)
+	visits = (
+		auxfun.remove_tunnel_directionality(lf, cfg)
+		.with_columns(
+			(
+				pl.col("datetime")
+				- pl.duration(
+					microseconds=(pl.col("time_spent") * 1_000_000).round().cast(pl.Int64)
+				)
+			).alias("start")
+		)
+		.pipe(phase_calendar.label_calendar, cfg, "start")
+		.filter(pl.col("datetime") <= pl.col("start").dt.truncate("1m") + pl.duration(minutes=1))
+		.group_by(keys)
+		.agg(pl.len().alias("visits_to_position"))
 	)
 
-	# Small lookup to restore enum labels after the sweep (one row per animal).
-	id_lookup = df_intervals.select("animal_id", "id_code").unique()
+	return (
+		time_in_position.join(visits, on=keys, how="full", coalesce=True)
+		.with_columns(pl.col("time_in_position", "visits_to_position").fill_null(0))
+		.select(*keys, "time_in_position", "visits_to_position")
+	)
+
+
+def _occupancy_events(intervals: pl.LazyFrame) -> pl.LazyFrame:
+	"""Turn occupancy bouts into the sweep-line event stream of each position.
+
+	Each bout becomes an enter (+1) and a leave (-1) event, sorted by position and
+	time with leaves before enters at equal times. A running ``n_active`` count per
+	position tracks how many animals are present from the event until
+	``time_next``, the next event in that position. ``id_active`` sums signed
+	per-animal physical codes, so when only one animal is present it holds that
+	animal's code. ``bout`` numbers the source bout, pairing each enter with its
+	leave. ``undefined`` positions are excluded.
 
-	enters = df_intervals.select(
+	Args:
+		intervals: occupancy bouts from :func:`_get_intervals`.
+
+	Returns:
+		LazyFrame of events with ``time``, ``time_next``, ``delta``, ``n_active``,
+		``id_active``, ``bout``, ``id_code``, ``position`` and the calendar labels.
+	"""
+	labels = phase_calendar.CALENDAR_COLUMNS
+	bouts = (
+		intervals.filter(pl.col("position") != "undefined")
+		.with_row_index("bout")
+		.with_columns(pl.col("animal_id").to_physical().cast(pl.Int64).alias("id_code"))
+	)
+	enters = bouts.select(
 		pl.col("start").alias("time"),
 		"position",
+		*labels,
+		"bout",
+		"id_code",
 		pl.lit(1, dtype=pl.Int32).alias("delta"),
-		pl.col("id_code").alias("id_delta"),
 	)
-	leaves = df_intervals.select(
+	leaves = bouts.select(
 		pl.col("end").alias("time"),
 		"position",
+		*labels,
+		"bout",
+		"id_code",
 		pl.lit(-1, dtype=pl.Int32).alias("delta"),
-		pl.col("id_code").neg().alias("id_delta"),
 	)
 
-	events = (
+	return (
 		pl.concat([enters, leaves])
-		.sort("position", "time")
+		.sort("position", "time", "delta")
 		.with_columns(
 			pl.col("delta").cum_sum().over("position").alias("n_active"),
-			pl.col("id_delta").cum_sum().over("position").alias("id_active"),
+			(pl.col("id_code") * pl.col("delta")).cum_sum().over("position").alias("id_active"),
 			pl.col("time").shift(-1).over("position").alias("time_next"),
 		)
 	)
 
+
+def _get_time_alone(intervals: pl.LazyFrame) -> pl.LazyFrame:
+	"""Compute how long each animal occupied a position with no other animal present.
+
+	Spans of the sweep (:func:`_occupancy_events`) where exactly one animal is
+	present (``n_active == 1``) are solitary; their length is the time until the
+	next event. The occupant is recovered from ``id_active`` and mapped back to the
+	enum label via ``id_lookup``.
+
+	Bouts are cut at every calendar boundary, so a solitary span never crosses one
+	and takes the calendar labels of the event opening it. Leaves sort before
+	enters at equal times, so at a boundary that event is the enter of the bout in
+	the new cell.
+
+	Args:
+		intervals: occupancy bouts from :func:`_get_intervals`.
+
+	Returns:
+		LazyFrame with ``time_alone`` (seconds) per
+		phase/day/phase_count/hour/position/animal.
+	"""
+	labels = phase_calendar.CALENDAR_COLUMNS
+
+	# Small lookup to restore enum labels after the sweep (one row per animal).
+	id_lookup = intervals.select(
+		"animal_id", pl.col("animal_id").to_physical().cast(pl.Int64).alias("id_code")
+	).unique()
+
 	time_alone = (
-		events.filter(
+		_occupancy_events(intervals)
+		.filter(
 			pl.col("time_next").is_not_null(),
 			(pl.col("n_active") == 1),
 			(pl.col("time_next") > pl.col("time")),
 		)
-		.select(
-			pl.col("position"),
-			pl.col("time").alias("datetime"),
-			pl.col("time_next").sub(pl.col("time")).alias("duration"),
-			pl.col("id_active").alias("id_code"),
-		)
-		.with_columns(auxfun.get_phase(cfg), auxfun.get_day(), auxfun.get_hour())
-		.sort("day", "phase")
-		.pipe(auxfun.get_phase_count)
-		.group_by("id_code", "position", "phase", "day", "phase_count", "hour")
-		.agg(pl.col("duration").sum().dt.total_seconds(fractional=True).alias("time_alone"))
+		.group_by(pl.col("id_active").alias("id_code"), "position", *labels)
+		.agg(((pl.col("time_next") - pl.col("time")).sum() / 1_000_000).alias("time_alone"))
 		.join(id_lookup, on="id_code", how="left")
 		.select("animal_id", "position", "phase", "day", "phase_count", "hour", "time_alone")
 	)
@@ -111,14 +228,82 @@ def _get_time_alone(lf: pl.LazyFrame, cfg: dict[str, Any]) -> pl.LazyFrame:
 	return time_alone
 
 
-@df_registry.register_step("activity_df", requires=["padded_df"])
+def _get_group_sizes(intervals: pl.LazyFrame, max_group: int) -> pl.LazyFrame:
+	"""Compute how long each animal spent in a position at every group size.
+
+	One pass over the sweep (:func:`_occupancy_events`) keeps, for every group size
+	``k``, the running time the position held exactly ``k`` animals. A bout spans
+	the events from its enter to its leave, so the time its animal spent in a
+	group of ``k`` is the difference of that running time between the two. The
+	``k == 1`` rows equal :func:`_get_time_alone`.
+
+	Args:
+		intervals: occupancy bouts from :func:`_get_intervals`.
+		max_group: largest group size tracked; larger groups (possible only with
+			overlapping bouts of one animal) count towards it.
+
+	Returns:
+		LazyFrame with ``time_in_group`` (seconds) per
+		phase/day/phase_count/hour/position/animal/group_size, for nonzero times.
+	"""
+	labels = phase_calendar.CALENDAR_COLUMNS
+	sizes = range(1, max_group + 1)
+	group = pl.min_horizontal("n_active", max_group)
+	span = (pl.col("time_next") - pl.col("time")).fill_null(0)
+
+	# Running time at each group size, up to (not including) the event's own span.
+	events = _occupancy_events(intervals).with_columns(
+		(
+			pl.when(group == k).then(span).otherwise(0).cum_sum().over("position")
+			- pl.when(group == k).then(span).otherwise(0)
+		).alias(str(k))
+		for k in sizes
+	)
+	per_bout = events.group_by("bout").agg(
+		pl.col("id_code").first(),
+		pl.col("position").first(),
+		*[pl.col(c).first() for c in labels],
+		*[(pl.col(str(k)) * -pl.col("delta")).sum() for k in sizes],  # leave minus enter
+	)
+
+	id_lookup = intervals.select(
+		"animal_id", pl.col("animal_id").to_physical().cast(pl.Int64).alias("id_code")
+	).unique()
+
+	return (
+		per_bout.group_by("id_code", "position", *labels)
+		.agg(pl.col(str(k)).sum() for k in sizes)
+		.unpivot(
+			index=["id_code", "position", *labels],
+			on=[str(k) for k in sizes],
+			variable_name="group_size",
+			value_name="time_in_group",
+		)
+		.filter(pl.col("time_in_group") > 0)
+		.join(id_lookup, on="id_code", how="left")
+		.select(
+			"animal_id",
+			"position",
+			"phase",
+			"day",
+			"phase_count",
+			"hour",
+			pl.col("group_size").cast(pl.UInt16),
+			(pl.col("time_in_group") / 1_000_000),
+		)
+	)
+
+
+@df_registry.register_step("activity_df", requires=["main_df", "intervals"])
 def calculate_activity(cfg: dict[str, Any], **kwargs) -> pl.LazyFrame:
 	"""Build the per-animal activity table: occupancy, visits and solitary time.
 
-	Combines two views of ``padded_df`` (per-position dwell time and visit counts
-	from :func:`_get_activity`, and solitary occupancy from :func:`_get_time_alone`)
-	and reindexes them onto the dense experiment grid, so every animal/position/hour
-	cell is present with absent cells filled with ``0``.
+	Combines visit counts from ``main_df`` with dwell and solitary time from the
+	occupancy bouts (:func:`_get_activity` and :func:`_get_time_alone`) and
+	reindexes them onto the dense experiment grid, so every animal/position/hour
+	cell is present with absent cells filled with ``0``. Bouts are read from the
+	``intervals`` step, a declared dependency: ``run_pipeline`` computes it first,
+	and a direct call raises FileNotFoundError if it has not been stored.
 
 	Args:
 	    cfg: resolved project config.
@@ -127,10 +312,11 @@ def calculate_activity(cfg: dict[str, Any], **kwargs) -> pl.LazyFrame:
 	    LazyFrame with ``time_in_position``, ``visits_to_position`` and
 	    ``time_alone`` per phase/day/phase_count/hour/position/animal.
 	"""
-	padded_df: pl.LazyFrame = auxfun._get_data(cfg, key="padded_df")
+	main_df: pl.LazyFrame = auxfun._get_data(cfg, key="main_df")
+	intervals: pl.LazyFrame = auxfun._get_data(cfg, key="intervals")
 
-	per_position_lf: pl.LazyFrame = _get_activity(padded_df, cfg)
-	time_alone: pl.LazyFrame = _get_time_alone(padded_df, cfg)
+	per_position_lf: pl.LazyFrame = _get_activity(main_df, intervals, cfg)
+	time_alone: pl.LazyFrame = _get_time_alone(intervals)
 
 	return (
 		auxfun.build_experiment_grid(cfg)
@@ -148,15 +334,100 @@ def calculate_activity(cfg: dict[str, Any], **kwargs) -> pl.LazyFrame:
 	)
 
 
+@df_registry.register_step("group_size_df", requires=["intervals"])
+def calculate_group_sizes(cfg: dict[str, Any], **kwargs) -> pl.LazyFrame:
+	"""Build the group-size occupancy histogram: time spent with 0, 1, 2, ... others.
+
+	Runs one sweep over the occupancy bouts (:func:`_get_group_sizes`), so crowding
+	at every group size comes from the same sort time alone already pays for.
+	``group_size`` counts the animal itself, so ``group_size == 1`` is time alone.
+
+	Args:
+	    cfg: resolved project config.
+
+	Returns:
+	    LazyFrame with ``time_in_group`` (seconds) per
+	    phase/day/phase_count/hour/position/animal/group_size.
+	"""
+	intervals: pl.LazyFrame = auxfun._get_data(cfg, key="intervals")
+	return _get_group_sizes(intervals, max_group=len(cfg["animal_ids"]))
+
+
+def _plackett_luce_1v1(
+	mu_winner: np.ndarray,
+	sigma_winner: np.ndarray,
+	mu_loser: np.ndarray,
+	sigma_loser: np.ndarray,
+	model: PlackettLuce,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+	"""Closed-form Plackett-Luce update for one-on-one matches, over arrays.
+
+	Reproduces ``model.rate([[loser], [winner]], ranks=[1, 0])`` for a model built
+	with ``limit_sigma=True, balance=True``: with one player per team the balance
+	weight is 1, and the two-team sums of Weng & Lin's Algorithm 4 collapse to the
+	winner's win probability ``p``. Each element is an independent match.
+
+	Args:
+		mu_winner: Winner ``mu`` per match.
+		sigma_winner: Winner ``sigma`` per match.
+		mu_loser: Loser ``mu`` per match.
+		sigma_loser: Loser ``sigma`` per match.
+		model: Source of the ``beta``/``tau``/``kappa`` hyperparameters.
+
+	Returns:
+		Updated ``(mu_winner, sigma_winner, mu_loser, sigma_loser)``.
+	"""
+	var_winner = sigma_winner**2 + model.tau**2
+	var_loser = sigma_loser**2 + model.tau**2
+	c = np.sqrt(var_winner + var_loser + 2 * model.beta**2)
+	p = 1 / (1 + np.exp((mu_loser - mu_winner) / c))
+
+	def _sigma(sigma: np.ndarray, var: np.ndarray) -> np.ndarray:
+		# gamma = sqrt(var) / c scales delta; limit_sigma forbids any increase.
+		delta = var / c**2 * np.sqrt(var) / c * p * (1 - p)
+		return np.minimum(sigma, np.sqrt(var) * np.sqrt(np.maximum(1 - delta, model.kappa)))
+
+	return (
+		mu_winner + var_winner / c * (1 - p),
+		_sigma(sigma_winner, var_winner),
+		mu_loser - var_loser / c * (1 - p),
+		_sigma(sigma_loser, var_loser),
+	)
+
+
+def _independent_rounds(winners: np.ndarray, losers: np.ndarray, n_animals: int) -> np.ndarray:
+	"""Assign each match to the earliest round after every earlier match of its animals.
+
+	Matches within a round share no animal, so they can be rated together without
+	changing the sequential result.
+	"""
+	last = [0] * n_animals
+	rounds = np.empty(len(winners), dtype=np.int64)
+	for k, (win, lose) in enumerate(zip(winners.tolist(), losers.tolist(), strict=True)):
+		r = max(last[win], last[lose])
+		rounds[k] = r
+		last[win] = last[lose] = r + 1
+	return rounds
+
+
 @df_registry.register_step("ranking", requires=["match_df"])
-def calculate_ranking(cfg: dict[str, Any], **kwargs) -> pl.LazyFrame:
+def calculate_ranking(
+	cfg: dict[str, Any],
+	prev_ranking: pl.LazyFrame | pl.DataFrame | None = None,
+	**kwargs,
+) -> pl.LazyFrame:
 	"""Estimate a dominance ranking by replaying chasing events as Plackett-Luce matches.
 
 	Each chasing event in ``match_df`` is treated as a one-on-one match (winner
-	beats loser) and replayed in chronological order, updating every animal's
-	skill rating (``mu``/``sigma`` and its derived ``ordinal``) after each match.
-	One row per animal is emitted after every match, so the result is the full
-	rating trajectory over time, not just the final standings.
+	beats loser) and replayed in chronological order, updating the winner's and
+	loser's skill rating (``mu``/``sigma`` and its derived ``ordinal``). Ratings
+	are updated with :func:`_plackett_luce_1v1`; matches that share no animal are
+	rated together in rounds.
+
+	The table is sparse: ``match_id`` ``0`` holds every animal's starting rating,
+	and each later match contributes only its two changed rows. Use
+	:func:`densify_ranking` for the full trajectory with one row per animal after
+	every match.
 
 	Args:
 	    cfg: resolved project config.
@@ -167,55 +438,97 @@ def calculate_ranking(cfg: dict[str, Any], **kwargs) -> pl.LazyFrame:
 	        :func:`get_prev_ranking`.
 
 	Returns:
-	    LazyFrame with ``mu``, ``sigma``, ``ordinal`` and ``datetime`` per animal,
-	    one row per animal after each match.
+	    LazyFrame with ``mu``, ``sigma``, ``ordinal``, ``datetime`` and
+	    ``match_id``, one row per animal at ``match_id`` ``0`` and one row per
+	    player after each match.
 	"""
-	prev_ranking = kwargs.get("prev_ranking")
 	animal_ids: list[str] = cfg["animal_ids"]
+	index = {name: i for i, name in enumerate(animal_ids)}
 
 	model = PlackettLuce(limit_sigma=True, balance=True)
 	# Every animal starts at the model default; animals present in prev_ranking
 	# resume from their previously estimated mu/sigma instead.
-	ranking = {player: model.rating() for player in animal_ids}
+	initial_mu = np.full(len(animal_ids), model.mu)
+	initial_sigma = np.full(len(animal_ids), model.sigma)
 
 	if prev_ranking is not None:
 		if isinstance(prev_ranking, pl.LazyFrame):
 			prev_ranking = prev_ranking.collect()
-		for name, mu, sigma in prev_ranking.select("animal_id", "mu", "sigma").iter_rows():
-			ranking[name] = model.rating(mu=mu, sigma=sigma)
+		for name, prev_mu, prev_sigma in prev_ranking.select(
+			"animal_id", "mu", "sigma"
+		).iter_rows():
+			if name in index:
+				initial_mu[index[name]] = prev_mu
+				initial_sigma[index[name]] = prev_sigma
 
 	match_df: pl.DataFrame = (
 		auxfun._get_data(cfg, "match_df")
-		.select("loser", "winner", "datetime")
-		.sort("datetime")
+		.select(
+			pl.col("loser").cast(pl.String).replace_strict(index, return_dtype=pl.Int64),
+			pl.col("winner").cast(pl.String).replace_strict(index, return_dtype=pl.Int64),
+			"datetime",
+		)
+		.sort("datetime", maintain_order=True)
 		.collect()
 	)
-	rows: list[dict[str, Any]] = []
-
-	for loser_name, winner_name, dtime in match_df.iter_rows():
-		new_ratings = model.rate(
-			[[ranking[loser_name]], [ranking[winner_name]]],
-			ranks=[1, 0],
+	losers = match_df["loser"].to_numpy()
+	winners = match_df["winner"].to_numpy()
+
+	# Current ratings, and each match's post-match ratings in match order.
+	mu, sigma = initial_mu.copy(), initial_sigma.copy()
+	mu_w, sigma_w = np.empty(match_df.height), np.empty(match_df.height)
+	mu_l, sigma_l = np.empty(match_df.height), np.empty(match_df.height)
+
+	rounds = _independent_rounds(winners, losers, len(animal_ids))
+	order = np.argsort(rounds, kind="stable")
+	for batch in np.split(order, np.flatnonzero(np.diff(rounds[order])) + 1):
+		win, lose = winners[batch], losers[batch]
+		mu_w[batch], sigma_w[batch], mu_l[batch], sigma_l[batch] = _plackett_luce_1v1(
+			mu[win], sigma[win], mu[lose], sigma[lose], model
 		)
+		mu[win], sigma[win] = mu_w[batch], sigma_w[batch]
+		mu[lose], sigma[lose] = mu_l[batch], sigma_l[batch]
+
+	# Starting ratings as match 0, stamped with the first match time, followed by
+	# the loser and winner rows of every match.
+	start = pl.DataFrame(
+		{
+			"animal_id": animal_ids,
+			"mu": initial_mu,
+			"sigma": initial_sigma,
+			"datetime": pl.Series(
+				[match_df["datetime"].first()] * len(animal_ids),
+				dtype=match_df.schema["datetime"],
+			),
+			"match_id": pl.Series([0] * len(animal_ids), dtype=pl.UInt32),
+		}
+	)
+	rows = np.arange(match_df.height).repeat(2)
+	changed = pl.DataFrame(
+		{
+			"animal_id": pl.Series(animal_ids, dtype=pl.String).gather(
+				np.column_stack([losers, winners]).ravel()
+			),
+			"mu": np.column_stack([mu_l, mu_w]).ravel(),
+			"sigma": np.column_stack([sigma_l, sigma_w]).ravel(),
+			"datetime": match_df["datetime"].gather(rows),
+			"match_id": pl.Series(rows + 1, dtype=pl.UInt32),
+		}
+	)
 
-		ranking[loser_name] = new_ratings[0][0]
-		ranking[winner_name] = new_ratings[1][0]
-
-		for animal, rating in ranking.items():
-			rows.append(
-				{
-					"animal_id": animal,
-					"mu": rating.mu,
-					"sigma": rating.sigma,
-					"ordinal": round(rating.ordinal(), 3),
-					"datetime": dtime,
-				}
-			)
-
-	ranking_df = pl.LazyFrame(rows).with_columns(
-		auxfun.get_phase(cfg),
-		auxfun.get_day(),
-		auxfun.get_hour(),
+	ranking_df = (
+		pl.concat([start, changed])
+		.lazy()
+		.select(
+			"animal_id",
+			"mu",
+			"sigma",
+			(pl.col("mu") - 3 * pl.col("sigma")).round(3).alias("ordinal"),
+			"datetime",
+			"match_id",
+		)
+		.pipe(phase_calendar.label_calendar, cfg)
+		.drop("phase_count")
 	)
 
 	return ranking_df
@@ -224,8 +537,9 @@ def calculate_ranking(cfg: dict[str, Any], **kwargs) -> pl.LazyFrame:
 def get_prev_ranking(ranking: pl.LazyFrame | pl.DataFrame) -> pl.LazyFrame:
 	"""Collapse a ``ranking`` trajectory to each animal's latest rating.
 
-	``calculate_ranking`` emits one row per animal after every match; this keeps
-	only the chronologically last ``mu``/``sigma`` per animal, yielding exactly
+	``calculate_ranking`` emits each animal's starting rating and a row per player
+	after every match (sparse or densified alike); this keeps only the
+	chronologically last ``mu``/``sigma`` per animal, yielding exactly
 	the ``animal_id``/``mu``/``sigma`` frame that ``calculate_ranking`` accepts as
 	its ``prev_ranking`` argument. Feed it back to continue ranking the same
 	animals from where a previous recording left off.
@@ -239,12 +553,52 @@ def get_prev_ranking(ranking: pl.LazyFrame | pl.DataFrame) -> pl.LazyFrame:
 	"""
 	return (
 		ranking.lazy()
-		.sort("datetime")
+		.sort("datetime", maintain_order=True)
 		.group_by("animal_id", maintain_order=True)
 		.agg(pl.last("mu"), pl.last("sigma"))
 	)
 
 
+def densify_ranking(ranking: pl.LazyFrame | pl.DataFrame) -> pl.LazyFrame:
+	"""Expand a sparse ``ranking`` into the full rating trajectory.
+
+	``calculate_ranking`` stores each animal's starting rating (``match_id`` 0)
+	and only the two rows changed by each match. This rebuilds one row per animal
+	after every match by carrying each animal's latest rating forward, i.e. the
+	``n_matches x n_animals`` table, ordered by match.
+
+	Args:
+	    ranking: a sparse ``ranking`` result (LazyFrame or DataFrame).
+
+	Returns:
+	    LazyFrame with the same columns as ``ranking``, one row per animal per
+	    match.
+	"""
+	ranking = ranking.lazy()
+	columns = ranking.collect_schema().names()
+
+	matches = (
+		ranking.filter(pl.col("match_id") > 0)
+		.select("match_id", "datetime", "phase", "day", "hour")
+		.unique("match_id", keep="first")
+		.sort("match_id")
+	)
+	animals = ranking.filter(pl.col("match_id") == 0).select("animal_id")
+	ratings = ranking.select("animal_id", "match_id", "mu", "sigma", "ordinal").sort("match_id")
+
+	return (
+		matches.join(animals, how="cross", maintain_order="left_right")
+		.join_asof(
+			ratings,
+			on="match_id",
+			by="animal_id",
+			strategy="backward",
+			check_sortedness=False,
+		)
+		.select(columns)
+	)
+
+
 @df_registry.register_step("match_df", requires=["main_df"])
 def calculate_matches(
 	cfg: dict[str, Any],
@@ -258,6 +612,12 @@ def calculate_matches(
 	This table is the shared input for both ``chasings_df`` (per-hour counts) and
 	``ranking`` (sequential match outcomes), so it is computed once here.
 
+	Candidate pairs come from a time-bounded range join per tunnel: winner
+	entries are sorted by tunnel and entry time, and two as-of searches give,
+	for each tunnel read, the index range of entries that fall inside the
+	window. Only near-coincident reads are paired, and chases straddling an
+	hour or phase boundary are kept; they are attributed to the loser's read.
+
 	Args:
 	    cfg: resolved project config.
 	    chasing_time_window: min and max length of the chasing event in seconds.
@@ -271,25 +631,73 @@ def calculate_matches(
 
 	cages: list[str] = cfg["cages"]
 	tunnels: list[str] = cfg["tunnels"]
+	min_length, max_length = chasing_time_window
 
+	# Search bounds are widened to whole microseconds; the exact open window is
+	# applied on the chasing length below.
 	chased = lf.filter(
 		pl.col("position").is_in(tunnels),
+	).with_columns(
+		(pl.col("datetime") - pl.duration(microseconds=math.ceil(max_length * 1e6))).alias(
+			"window_start"
+		),
+		(pl.col("datetime") - pl.duration(microseconds=math.floor(min_length * 1e6))).alias(
+			"window_end"
+		),
 	)
-	chasing = lf.with_columns(
-		pl.col("datetime").shift(1).over("animal_id").alias("tunnel_entry"),
-		pl.col("position").shift(1).over("animal_id").alias("prev_position"),
+	chasing = (
+		lf.with_columns(
+			pl.col("datetime").shift(1).over("animal_id").alias("tunnel_entry"),
+			pl.col("position").shift(1).over("animal_id").alias("prev_position"),
+		)
+		.filter(
+			pl.col("position").is_in(tunnels),
+			pl.col("prev_position").is_in(cages),
+		)
+		.sort("position", "tunnel_entry")
+		.with_row_index("entry_idx")
 	)
+	entries = chasing.select("entry_idx", "position", "tunnel_entry").sort("tunnel_entry")
 
-	intermediate = chased.join(
-		chasing, on=["phase", "day", "hour", "phase_count"], suffix="_chasing"
-	).filter(
-		pl.col("animal_id") != pl.col("animal_id_chasing"),
-		pl.col("position") == pl.col("position_chasing"),
-		pl.col("prev_position").is_in(cages),
-		(pl.col("datetime") - pl.col("tunnel_entry"))
-		.dt.total_seconds(fractional=True)
-		.is_between(*chasing_time_window, closed="none"),
-		pl.col("datetime") < pl.col("datetime_chasing"),
+	intermediate = (
+		chased.sort("window_start")
+		.join_asof(
+			entries.rename({"entry_idx": "first_idx"}),
+			left_on="window_start",
+			right_on="tunnel_entry",
+			by="position",
+			strategy="forward",
+			check_sortedness=False,
+		)
+		.drop("tunnel_entry")
+		.sort("window_end")
+		.join_asof(
+			entries.rename({"entry_idx": "last_idx"}),
+			left_on="window_end",
+			right_on="tunnel_entry",
+			by="position",
+			strategy="backward",
+			check_sortedness=False,
+		)
+		.drop("tunnel_entry")
+		.with_columns(pl.int_ranges("first_idx", pl.col("last_idx") + 1).alias("entry_idx"))
+		.explode("entry_idx", empty_as_null=False, keep_nulls=False)
+		.join(
+			chasing.select(
+				"entry_idx",
+				pl.col("animal_id").alias("animal_id_chasing"),
+				pl.col("datetime").alias("datetime_chasing"),
+				"tunnel_entry",
+			),
+			on="entry_idx",
+		)
+		.filter(
+			pl.col("animal_id") != pl.col("animal_id_chasing"),
+			(pl.col("datetime") - pl.col("tunnel_entry"))
+			.dt.total_seconds(fractional=True)
+			.is_between(*chasing_time_window, closed="none"),
+			pl.col("datetime") < pl.col("datetime_chasing"),
+		)
 	)
 
 	# Event-level table. Grid columns are kept so chasings_df can aggregate it
@@ -309,12 +717,17 @@ def calculate_matches(
 	)
 
 
-@df_registry.register_step("chasings_df", requires=["match_df"])
+@df_registry.register_step(
+	"chasings_df",
+	requires=["match_df"],
+	grid={"columns": ["chaser", "chased"], "ordered": True, "positions": "tunnels_directional"},
+)
 def calculate_chasings(cfg: dict[str, Any], **kwargs) -> pl.LazyFrame:
 	"""Count chasing events per ordered pair of animals for each tunnel and hour.
 
-	Per-hour aggregation of the event-level ``match_df``, reindexed onto the dense
-	grid so every chaser/chased/tunnel/hour cell is present (absent cells are ``0``).
+	Per-hour aggregation of the event-level ``match_df``, stored sparse: only
+	chaser/chased/tunnel/hour cells with a chasing are kept. ``auxfun.densify``
+	restores the dense grid (absent cells are ``0``) where a reader needs it.
 	The match-level ``winner``/``loser`` are renamed to ``chaser``/``chased`` here,
 	since in a chasing the winner is the chaser and the loser is the chased.
 
@@ -322,26 +735,22 @@ def calculate_chasings(cfg: dict[str, Any], **kwargs) -> pl.LazyFrame:
 	    cfg: resolved project config.
 
 	Returns:
-	    LazyFrame with a ``chasings`` count per chaser/chased/tunnel/hour.
+	    LazyFrame with a ``chasings`` count per observed chaser/chased/tunnel/hour.
 	"""
 	matches: pl.LazyFrame = auxfun._get_data(cfg, key="match_df")
 
-	chasings = (
+	return (
 		matches.group_by(["phase", "day", "phase_count", "hour", "position", "winner", "loser"])
 		.len(name="chasings")
 		.rename({"winner": "chaser", "loser": "chased"})
 	)
 
-	return auxfun.reindex_onto_grid(
-		chasings,
-		cfg,
-		("chaser", "chased"),
-		ordered=True,
-		positions=auxfun.get_positions(cfg, "tunnels_directional"),
-	)
-
 
-@df_registry.register_step("tube_test_df", requires=["main_df"])
+@df_registry.register_step(
+	"tube_test_df",
+	requires=["main_df"],
+	grid={"columns": ["winner", "loser"], "ordered": True, "positions": None},
+)
 def calculate_tube_test(
 	cfg: dict[str, Any],
 	winner_behavior: Literal["CHASE", "GUARD", "BOTH"] = "BOTH",
@@ -370,7 +779,8 @@ def calculate_tube_test(
 	        overlaps. Defaults to 10.0.
 
 	Returns:
-	    LazyFrame of tube test events
+	    LazyFrame with a ``tube_test`` count per observed winner/loser/hour
+	    (sparse; see ``auxfun.densify``).
 	"""
 	lf: pl.LazyFrame = auxfun._get_data(cfg, key="main_df")
 
@@ -426,7 +836,7 @@ def calculate_tube_test(
 		case "BOTH":
 			intermediate = intermediate.filter(chase | guard)
 
-	tube_test = (
+	return (
 		intermediate.group_by(
 			["phase", "day", "phase_count", "hour", "animal_id", "animal_id_winner"]
 		)
@@ -434,45 +844,23 @@ def calculate_tube_test(
 		.rename({"animal_id": "loser", "animal_id_winner": "winner"})
 	)
 
-	return auxfun.reindex_onto_grid(tube_test, cfg, ("winner", "loser"), ordered=True)
 
+def _pair_overlaps_join(lf: pl.LazyFrame) -> pl.LazyFrame:
+	"""Reference pair-overlap engine: self-join every stay within a cage-phase.
 
-@df_registry.register_step("pairwise_meetings", requires=["padded_df"])
-def calculate_pairwise_meetings(
-	cfg: dict[str, Any],
-	minimum_time: int | float | None = 2,
-	**kwargs,
-) -> pl.LazyFrame:
-	"""Count co-occurrences and shared time for every pair of animals per cage and hour.
-
-	Self-joins cage occupancy intervals and, for each unordered pair sharing a
-	cage, measures the temporal overlap of their stays. Overlaps shorter than
-	``minimum_time`` are discarded, then the survivors are summed into shared time
-	and meeting counts and reindexed onto the dense grid. Slow, because it
-	materialises every overlapping interval pair before aggregating.
+	Materialises every pair of stays sharing ``phase/day/phase_count/position``
+	(quadratic in visits per cage-phase) and keeps the unordered animal pairs.
+	Kept as the ground truth for :func:`_pair_overlaps_sweep`.
 
 	Args:
-	    cfg: resolved project config.
-	    minimum_time: minimum overlap, in seconds, for a co-occurrence to count as
-	        a meeting; shorter overlaps are dropped. Defaults to 2.
+		lf: Cage stays with ``event_start``/``event_end`` columns.
 
 	Returns:
-	    LazyFrame with ``time_together`` (seconds) and ``pairwise_encounters`` per
-	    pair/cage/hour.
+		LazyFrame with ``overlap_start``, ``overlap_end`` and ``overlap_duration``
+		(seconds, may be non-positive) per pair of stays, ``hour`` taken from the
+		``animal_id`` side.
 	"""
-	padded_df = auxfun._get_data(cfg, key="padded_df")
-
-	cages: list[str] = cfg["cages"]
-
-	lf = (
-		padded_df.filter(pl.col("position").is_in(cages))
-		.with_columns(
-			(pl.col("datetime") - pl.duration(seconds=pl.col("time_spent"))).alias("event_start")
-		)
-		.rename({"datetime": "event_end"})
-	)
-
-	joined = (
+	return (
 		lf.join(
 			lf,
 			on=["phase", "day", "phase_count", "position"],
@@ -483,34 +871,179 @@ def calculate_pairwise_meetings(
 			pl.col("animal_id") < pl.col("animal_id_2"),
 		)
 		.with_columns(
-			(
-				pl.min_horizontal(["event_end", "event_end_2"])
-				- pl.max_horizontal(["event_start", "event_start_2"])
-			)
+			pl.max_horizontal(["event_start", "event_start_2"]).alias("overlap_start"),
+			pl.min_horizontal(["event_end", "event_end_2"]).alias("overlap_end"),
+		)
+		.with_columns(
+			(pl.col("overlap_end") - pl.col("overlap_start"))
 			.dt.total_seconds(fractional=True)
 			.round(3)
 			.alias("overlap_duration")
 		)
-		.filter(pl.col("overlap_duration") > minimum_time)
 	)
 
-	pairwise_meetings = (
-		joined.group_by(
-			"phase", "day", "phase_count", "hour", "position", "animal_id", "animal_id_2"
-		).agg(
-			pl.sum("overlap_duration").alias("time_together"),
-			pl.len().alias("pairwise_encounters"),
+
+def _pair_overlaps_sweep(lf: pl.LazyFrame, presorted: bool = False) -> pl.LazyFrame:
+	"""Sweep-line pair-overlap engine: emit only stays that actually overlap.
+
+	Stays are sorted by ``event_start`` within each cage-phase. Sweeping in that
+	order, the stays still active when stay ``i`` ends are exactly the later stays
+	starting before ``event_end`` of ``i``; a ``search_sorted`` gives that index
+	range, so every positively overlapping pair is emitted once, from its earlier
+	starting member. Cost is O(n log n) plus the number of overlapping pairs,
+	instead of every pair in the cage-phase. The pair is then oriented like the
+	join (``animal_id < animal_id_2``, ``hour`` from the ``animal_id`` side).
+
+	Args:
+		lf: Cage stays with ``event_start``/``event_end`` columns.
+		presorted: ``lf`` already holds each cage-phase's stays together and in
+			``event_start`` order (as the ``intervals`` table stores them), so the
+			sort is skipped.
+
+	Returns:
+		LazyFrame with the same columns as :func:`_pair_overlaps_join`, restricted
+		to pairs with a positive overlap.
+	"""
+	keys = ["phase", "day", "phase_count", "position"]
+	stays = lf.select(*keys, "hour", "animal_id", "event_start", "event_end")
+	if not presorted:
+		stays = stays.sort(*keys, "event_start")
+	stays = stays.with_row_index("idx").with_columns(
+		(
+			pl.col("idx").min().over(keys)
+			+ pl.col("event_start").search_sorted(pl.col("event_end")).over(keys)
+		).alias("idx_stop")
+	)
+	other = stays.select(
+		pl.col("idx").alias("idx_2"),
+		pl.col("hour").alias("hour_2"),
+		pl.col("animal_id").alias("animal_id_2"),
+		pl.col("event_start").alias("event_start_2"),
+		pl.col("event_end").alias("event_end_2"),
+	)
+
+	first = pl.col("animal_id") < pl.col("animal_id_2")
+	return (
+		stays.with_columns(pl.int_ranges(pl.col("idx") + 1, pl.col("idx_stop")).alias("idx_2"))
+		.explode("idx_2", empty_as_null=False, keep_nulls=False)
+		.join(other, on="idx_2", how="inner")
+		.filter(pl.col("animal_id") != pl.col("animal_id_2"))
+		.select(
+			*keys,
+			pl.when(first).then(pl.col("hour")).otherwise(pl.col("hour_2")).alias("hour"),
+			pl.when(first)
+			.then(pl.col("animal_id"))
+			.otherwise(pl.col("animal_id_2"))
+			.alias("animal_id"),
+			pl.when(first)
+			.then(pl.col("animal_id_2"))
+			.otherwise(pl.col("animal_id"))
+			.alias("animal_id_2"),
+			pl.max_horizontal(["event_start", "event_start_2"]).alias("overlap_start"),
+			pl.min_horizontal(["event_end", "event_end_2"]).alias("overlap_end"),
 		)
-	).sort(["phase", "day", "phase_count", "hour", "position", "animal_id", "animal_id_2"])
+		.with_columns(
+			(pl.col("overlap_end") - pl.col("overlap_start"))
+			.dt.total_seconds(fractional=True)
+			.round(3)
+			.alias("overlap_duration")
+		)
+	)
 
-	return auxfun.reindex_onto_grid(
-		pairwise_meetings,
-		cfg,
-		("animal_id", "animal_id_2"),
-		ordered=False,
-		positions=auxfun.get_positions(cfg, "all"),
+
+def _minute_meetings(overlaps: pl.LazyFrame, minimum_time: int | float | None) -> pl.LazyFrame:
+	"""Cut each overlap at minute marks and keep the pieces longer than ``minimum_time``.
+
+	A meeting is a minute's piece of an overlap, as when stays were minute-padded
+	before overlapping. Pieces are counted in closed form: the partial first and
+	last minute are measured and the full minutes in between all have the same
+	length. Non-positive overlaps (only the join emits them) stay one piece.
+
+	Returns:
+		``overlaps`` with ``time_together`` (seconds in kept pieces) and
+		``pairwise_encounters`` (number of kept pieces) per overlap.
+	"""
+	minute = 60_000_000
+	start = pl.col("overlap_start").cast(pl.Datetime("us")).to_physical()
+	end = pl.col("overlap_end").cast(pl.Datetime("us")).to_physical()
+	first_mark = (start // minute + 1) * minute
+	last_mark = end // minute * minute
+	split = first_mark < end
+
+	first = ((pl.min_horizontal(end, first_mark) - start) / 1_000_000).round(3)
+	last = pl.when(split).then(((end - last_mark) / 1_000_000).round(3)).otherwise(0.0)
+	full = pl.when(split).then((last_mark - first_mark) // minute).otherwise(0)
+
+	kept = [(first, 1), (last, 1), (pl.lit(60.0), full)]
+	return overlaps.with_columns(
+		pl.sum_horizontal(
+			pl.when(length > minimum_time).then(length * count).otherwise(0.0)
+			for length, count in kept
+		).alias("time_together"),
+		pl.sum_horizontal(
+			pl.when(length > minimum_time).then(count).otherwise(0) for length, count in kept
+		).alias("pairwise_encounters"),
+	).filter(pl.col("pairwise_encounters") > 0)
+
+
+@df_registry.register_step(
+	"pairwise_meetings",
+	requires=["intervals"],
+	grid={"columns": ["animal_id", "animal_id_2"], "ordered": False, "positions": "all"},
+)
+def calculate_pairwise_meetings(
+	cfg: dict[str, Any],
+	minimum_time: int | float | None = 2,
+	overlap_method: Literal["sweep", "join"] = "sweep",
+	**kwargs,
+) -> pl.LazyFrame:
+	"""Count co-occurrences and shared time for every pair of animals per cage and hour.
+
+	For each unordered pair sharing a cage, measures the temporal overlap of their
+	occupancy bouts and cuts it at minute marks (:func:`_minute_meetings`). Pieces
+	shorter than ``minimum_time`` are discarded, then the survivors are summed into
+	shared time and meeting counts, stored for observed cells only. Overlapping
+	bouts are found with a sweep over the bouts per cage-phase
+	(:func:`_pair_overlaps_sweep`), which the ``intervals`` table already stores in
+	sweep order; the original self-join is kept as a reference. Bouts are read
+	from the ``intervals`` step, a declared dependency: ``run_pipeline`` computes
+	it first, and a direct call raises FileNotFoundError if it has not been stored.
+
+	Args:
+	    cfg: resolved project config.
+	    minimum_time: minimum overlap, in seconds, for a co-occurrence to count as
+	        a meeting; shorter overlaps are dropped. Defaults to 2.
+	    overlap_method: ``"sweep"`` (default) or ``"join"``, the quadratic self-join
+	        the sweep reproduces. A negative ``minimum_time`` also counts
+	        non-overlapping stays, which only the join enumerates, so it always
+	        uses the join.
+
+	Returns:
+	    LazyFrame with ``time_together`` (seconds) and ``pairwise_encounters`` per
+	    observed pair/cage/hour (sparse; see ``auxfun.densify``).
+	"""
+	intervals: pl.LazyFrame = auxfun._get_data(cfg, key="intervals")
+
+	cages: list[str] = cfg["cages"]
+
+	lf = intervals.filter(pl.col("position").is_in(cages)).with_columns(
+		pl.col("start").cast(pl.Datetime("us")).alias("event_start"),
+		pl.col("end").cast(pl.Datetime("us")).alias("event_end"),
 	)
 
+	if overlap_method == "join" or (minimum_time is not None and minimum_time < 0):
+		overlaps = _pair_overlaps_join(lf)
+	elif overlap_method == "sweep":
+		overlaps = _pair_overlaps_sweep(lf, presorted=True)
+	else:
+		raise ValueError(f"Unknown overlap_method {overlap_method!r}; use 'sweep' or 'join'.")
+
+	return (
+		overlaps.pipe(_minute_meetings, minimum_time)
+		.group_by("phase", "day", "phase_count", "hour", "position", "animal_id", "animal_id_2")
+		.agg(pl.sum("time_together"), pl.sum("pairwise_encounters").cast(pl.UInt32))
+	).sort(["phase", "day", "phase_count", "hour", "position", "animal_id", "animal_id_2"])
+
 
 @df_registry.register_step(
 	"incohort_sociability", requires=["pairwise_meetings", "activity_df", "phase_durations"]
@@ -539,10 +1072,16 @@ def calculate_incohort_sociability(cfg: dict[str, Any], **kwargs) -> pl.LazyFram
 	core_columns = ["phase", "day", "phase_count", "animal_id", "animal_id_2"]
 	cages: list[str] = cfg["cages"]
 
-	# Collapse the hourly pairwise grid to phase level so the per-row chance term
-	# below is not summed once per hour.
-	time_together_df = time_together_df.group_by([*core_columns, "position"]).agg(
-		pl.sum("time_together")
+	# Collapse the hourly pairwise table to phase level so the per-row chance term
+	# below is not summed once per hour, then fill in the pairs that never met in a
+	# cage: they still contribute their chance term.
+	time_together_df = auxfun.densify(
+		time_together_df.group_by([*core_columns, "position"]).agg(pl.sum("time_together")),
+		cfg,
+		("animal_id", "animal_id_2"),
+		ordered=False,
+		positions="cages",
+		time_columns=["phase", "day", "phase_count"],
 	)
 
 	activity_per_phase = (
@@ -653,15 +1192,19 @@ def calculate_features(cfg: dict[str, Any], **kwargs) -> pl.LazyFrame:
 		)
 		.drop("_drop")
 		.group_by("phase", "phase_count", "day", "col")
-		.agg(pl.sum("time_together"), pl.sum("pairwise_encounters"))
+		.agg(pl.sum("time_together"), pl.sum("pairwise_encounters").cast(pl.UInt32))
 		.rename({"col": "animal_id"})
 	)
 
 	lfs = [n_chasing, n_chased, n_wins, n_loses, activity, pairwise_meetings]
 
 	feature_lf = (
-		pl.concat(lfs, how="align")
-		.fill_null(0)
+		auxfun.densify(
+			pl.concat(lfs, how="align"),
+			cfg,
+			"animal_id",
+			time_columns=["phase", "day", "phase_count"],
+		)
 		.with_columns(
 			[((pl.col(col) - pl.col(col).mean()) / pl.col(col).std()).alias(col) for col in columns]
 		)
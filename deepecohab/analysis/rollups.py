@@ -0,0 +1,143 @@
+from typing import Any
+
+import polars as pl
+
+from deepecohab.core.registries import df_registry
+from deepecohab.utils import auxfun
+
+
+def _day_rollup(lf: pl.LazyFrame, keys: list[str], values: list[str]) -> pl.LazyFrame:
+	"""Collapse an hourly table to one row per day x phase x ``keys`` with prefix sums.
+
+	Sums ``values`` over the hours (and phase occurrences) of each day and counts
+	the source rows in ``hours``. Sparse sources are densified first
+	(``auxfun.densify``), so ``hours`` counts every grid hour, observed or not. The result is reindexed onto every day of the
+	experiment for each observed phase/key combination (absent days are ``0``),
+	so ``<value>_cum``, the running total over days, can answer any day range as
+	``cum[last] - cum[first - 1]``.
+
+	Args:
+		lf: hourly source table with ``day`` and ``phase`` columns.
+		keys: animal/pair/position columns to keep.
+		values: additive columns to total.
+
+	Returns:
+		LazyFrame with ``day``, ``phase``, ``keys``, ``values``, ``hours`` and a
+		``<value>_cum`` column per value, sorted by key and day.
+	"""
+	group = ["phase", *keys]
+	totals = lf.group_by("day", *group).agg(
+		*[pl.col(v).sum() for v in values], pl.len().cast(pl.UInt32).alias("hours")
+	)
+	days = lf.select(
+		pl.int_range(pl.min("day"), pl.max("day") + 1, dtype=lf.collect_schema()["day"]).alias(
+			"day"
+		)
+	)
+	cumulative = [*values, "hours"]
+
+	return (
+		days.join(totals.select(group).unique(), how="cross")
+		.join(totals, on=["day", *group], how="left")
+		.with_columns(pl.col(cumulative).fill_null(0))
+		.sort(*group, "day")
+		.with_columns(pl.col(cumulative).cum_sum().over(group).name.suffix("_cum"))
+	)
+
+
+@df_registry.register_step("activity_rollup", requires=["activity_df"])
+def calculate_activity_rollup(cfg: dict[str, Any], **kwargs) -> pl.LazyFrame:
+	"""Daily activity per animal and position, with per-day prefix sums.
+
+	Args:
+		cfg: resolved project config.
+
+	Returns:
+		LazyFrame with daily ``time_in_position``, ``visits_to_position`` and
+		``time_alone`` per phase/day/position/animal (see :func:`_day_rollup`).
+	"""
+	activity: pl.LazyFrame = auxfun._get_data(cfg, key="activity_df")
+
+	return _day_rollup(
+		activity,
+		["animal_id", "position"],
+		["time_in_position", "visits_to_position", "time_alone"],
+	)
+
+
+@df_registry.register_step("chasings_rollup", requires=["chasings_df"])
+def calculate_chasings_rollup(cfg: dict[str, Any], **kwargs) -> pl.LazyFrame:
+	"""Daily chasings per ordered chaser/chased pair, summed over tunnels.
+
+	Args:
+		cfg: resolved project config.
+
+	Returns:
+		LazyFrame with daily ``chasings`` per phase/day/chaser/chased (see
+		:func:`_day_rollup`).
+	"""
+	chasings: pl.LazyFrame = auxfun.densify(
+		auxfun._get_data(cfg, key="chasings_df"), cfg, **df_registry.grid("chasings_df")
+	)
+
+	return _day_rollup(chasings, ["chaser", "chased"], ["chasings"])
+
+
+@df_registry.register_step("pairwise_rollup", requires=["pairwise_meetings"])
+def calculate_pairwise_rollup(cfg: dict[str, Any], **kwargs) -> pl.LazyFrame:
+	"""Daily time together and encounters per pair of animals and cage.
+
+	Args:
+		cfg: resolved project config.
+
+	Returns:
+		LazyFrame with daily ``time_together`` and ``pairwise_encounters`` per
+		phase/day/position/pair (see :func:`_day_rollup`).
+	"""
+	pairwise: pl.LazyFrame = auxfun.densify(
+		auxfun._get_data(cfg, key="pairwise_meetings"), cfg, **df_registry.grid("pairwise_meetings")
+	)
+
+	return _day_rollup(
+		pairwise,
+		["animal_id", "animal_id_2", "position"],
+		["time_together", "pairwise_encounters"],
+	)
+
+
+@df_registry.register_step("tube_test_rollup", requires=["tube_test_df"])
+def calculate_tube_test_rollup(cfg: dict[str, Any], **kwargs) -> pl.LazyFrame:
+	"""Daily tube test outcomes per ordered winner/loser pair.
+
+	Args:
+		cfg: resolved project config.
+
+	Returns:
+		LazyFrame with daily ``tube_test`` per phase/day/winner/loser (see
+		:func:`_day_rollup`).
+	"""
+	tube_test: pl.LazyFrame = auxfun.densify(
+		auxfun._get_data(cfg, key="tube_test_df"), cfg, **df_registry.grid("tube_test_df")
+	)
+
+	return _day_rollup(tube_test, ["winner", "loser"], ["tube_test"])
+
+
+@df_registry.register_step("detections_rollup", requires=["main_df"])
+def calculate_detections_rollup(cfg: dict[str, Any], **kwargs) -> pl.LazyFrame:
+	"""Antenna detections per animal and hour of each day.
+
+	The dashboard's activity line only needs these counts, so it reads this
+	table instead of scanning every row of ``main_df``.
+
+	Args:
+		cfg: resolved project config.
+
+	Returns:
+		LazyFrame with ``n_detections`` per day/hour/animal (observed cells only).
+	"""
+	main_df: pl.LazyFrame = auxfun._get_data(cfg, key="main_df")
+
+	return main_df.group_by("day", "hour", "animal_id").agg(
+		pl.len().cast(pl.UInt32).alias("n_detections")
+	)
@@ -105,6 +105,10 @@ def generate_cohort_card():
 												id="progress-text",
 												className="progress-print",
 											),
+											html.Ul(
+												id="step-timings",
+												className="progress-print",
+											),
 											dcc.Interval(
 												id="progress-interval",
 												interval=200,
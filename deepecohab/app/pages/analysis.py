@@ -1,3 +1,4 @@
+import os
 import time
 from typing import Any
 
@@ -8,6 +9,7 @@ from dash import (
 	State,
 	callback,
 	clientside_callback,
+	html,
 	no_update,
 )
 
@@ -51,18 +53,24 @@ def start_analysis(
 		minimum_time=min_time,
 		chasing_time_window=chasing_window,
 		overwrite=overwrite,
+		jobs=os.cpu_count() or 1,
 	)
 
+	timings: list[tuple[str, float | None]] = []
 	for step_name, current, total in pipeline_generator:
 		percent = int((current / total) * 100)
+		# Steps absent from the report's timings were cached.
+		timings.append((step_name, df_registry.last_report.step_seconds.get(step_name)))
 
 		cache_config.launch_cache.set(
-			"analysis_status", {"percent": percent, "msg": f"Running {step_name}..."}
+			"analysis_status",
+			{"percent": percent, "msg": f"Running {step_name}...", "timings": timings},
 		)
 
-	cache_config.launch_cache.set("analysis_status", {"percent": 100, "msg": "Analysis Complete"})
+	cache_config.launch_cache.set(
+		"analysis_status", {"percent": 100, "msg": "Analysis Complete", "timings": timings}
+	)
 	time.sleep(0.5)
-	cache_config.get_project_data(config)
 
 	return True, True
 
@@ -73,18 +81,19 @@ def start_analysis(
 		Output("analysis-progress", "label"),
 		Output("analysis-progress", "color"),
 		Output("progress-text", "children"),
+		Output("step-timings", "children"),
 		Output("progress-interval", "disabled", allow_duplicate=True),
 	],
 	Input("progress-interval", "n_intervals"),
 	prevent_initial_call=True,
 )
-def update_progress_bar(n_clicks: int) -> tuple[float, str, str, str, bool]:
+def update_progress_bar(n_clicks: int) -> tuple[float, str, str, str, list, bool]:
 	"""Progress bar update logic based on number of steps."""
 	status = cache_config.launch_cache.get("analysis_status")
 
 	if not status:
 		# Dash no_update keeps the interval enabled while waiting for analysis to start.
-		return 0, "", "primary", "Waiting for analysis to start...", no_update  # ty: ignore[invalid-return-type]
+		return 0, "", "primary", "Waiting for analysis to start...", [], no_update  # ty: ignore[invalid-return-type]
 
 	percent = status.get("percent", 0)
 	msg = status.get("msg", "")
@@ -92,8 +101,12 @@ def update_progress_bar(n_clicks: int) -> tuple[float, str, str, str, bool]:
 	is_finished = percent >= 100
 	color = "success" if is_finished else "primary"
 	label = f"{percent}%" if percent > 5 else ""
+	timings = [
+		html.Li(f"{step}: {'cached' if seconds is None else f'{seconds:.2f} s'}")
+		for step, seconds in status.get("timings", [])
+	]
 
-	return percent, label, color, msg, is_finished
+	return percent, label, color, msg, timings, is_finished
 
 
 clientside_callback(
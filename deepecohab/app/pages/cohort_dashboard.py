@@ -142,9 +142,6 @@ def update_plots(
 
 	phase_list: list[str] = [phase_type] if phase_type != "all" else ["dark_phase", "light_phase"]
 
-	cfg_tuple = tuple(sorted(cfg.items())) if cfg else ()
-	store = cache_config.get_project_data(cfg_tuple)
-
 	store = cache_config.get_project_data(cfg)
 	animals = cfg["animal_ids"]
 	animal_colors = auxfun_plots.color_sampling(animals)
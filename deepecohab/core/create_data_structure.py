@@ -1,14 +1,154 @@
 import datetime as dt
+from collections.abc import Sequence
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Literal
 from zoneinfo import ZoneInfo, available_timezones
 
 import polars as pl
+import toml
 from polars.exceptions import ComputeError
 from tzlocal import get_localzone
 
 from deepecohab.core.registries import df_registry
-from deepecohab.utils import auxfun
+from deepecohab.utils import auxfun, phase_calendar, profiling, results_io
+
+# Ingest manifest: one row per raw file already folded into main_df. Lives next
+# to the results but is not a registered data key.
+MANIFEST_FILE = "_ingest_manifest.parquet"
+
+# Raw registration columns of main_df, i.e. everything that is not derived.
+RAW_COLUMNS = ["antenna", "time_under", "animal_id", "datetime"]
+
+
+@dataclass(frozen=True)
+class RawStats:
+	"""Statistics of freshly parsed raw files, gathered in one pass.
+
+	Attributes:
+		animal_counts: registrations per ``animal_id`` (``len``), before any filtering.
+		file_rows: rows per raw file name (``file``, ``n_rows``).
+		boards: distinct ``COM`` values parsed from the file names.
+	"""
+
+	animal_counts: pl.DataFrame
+	file_rows: pl.DataFrame
+	boards: list[str]
+
+
+def _list_raw_files(data_path: Path, fname_prefix: str) -> list[Path]:
+	"""Sorted raw ``<fname_prefix>*.txt`` files under ``data_path``."""
+	return sorted(data_path.glob(f"{fname_prefix}*.txt"))
+
+
+def _scan_raw_files(source: Path | list[Path]) -> pl.LazyFrame:
+	"""Scan raw registration files as one tab-separated source.
+
+	``source`` is either a glob path or an explicit list of files. Each row keeps
+	the path of the file it came from in a ``file`` column.
+	"""
+	return pl.scan_csv(
+		source=source,
+		separator="\t",
+		has_header=False,
+		new_columns=["ind", "date", "time", "antenna", "time_under", "animal_id"],
+		include_file_paths="file",
+		glob=True,
+		schema={
+			"ind": pl.Int64,
+			"date": pl.String,
+			"time": pl.String,
+			"antenna": pl.Int64,
+			"time_under": pl.Int64,
+			"animal_id": pl.String,
+		},
+		truncate_ragged_lines=True,
+	)
+
+
+def _read_raw_files(source: Path | list[Path]) -> tuple[pl.DataFrame, RawStats]:
+	"""Parse raw registration files into memory, once, together with their stats.
+
+	Every later step of a build (id inference, board split, DST fix, bounds) works
+	on the returned frame, so the files are read a single time per build.
+
+	Returns:
+		The registrations with a ``COM`` board column, and their :class:`RawStats`.
+	"""
+	raw = (
+		_scan_raw_files(source)
+		.with_columns(pl.col("file").str.extract(r"([^/\\]+)$"))
+		.pipe(_get_board)
+		.collect()
+	)
+	lf = raw.lazy()
+	animal_counts, file_rows, boards = pl.collect_all(
+		[
+			lf.group_by("animal_id").len(),
+			lf.group_by("file").len(name="n_rows"),
+			lf.select(pl.col("COM").unique().sort()),
+		]
+	)
+	stats = RawStats(animal_counts, file_rows, boards["COM"].to_list())
+	return raw.drop("file"), stats
+
+
+def _get_board(lf: pl.LazyFrame) -> pl.LazyFrame:
+	"""Add the ``COM`` board parsed from the ``file`` column's file name."""
+	return lf.with_columns(
+		pl.col("file").str.extract(r"([^/\\]+)$").str.split("_").list.get(0).alias("COM")
+	).drop("ind")
+
+
+def _file_stats(files: list[Path]) -> pl.DataFrame:
+	"""Name, size and modification time of each raw file."""
+	stats = [f.stat() for f in files]
+	return pl.DataFrame(
+		{
+			"file": [f.name for f in files],
+			"size": [st.st_size for st in stats],
+			"mtime": [st.st_mtime for st in stats],
+		},
+		schema={"file": pl.String, "size": pl.Int64, "mtime": pl.Float64},
+	)
+
+
+def _file_manifest(files: list[Path], file_rows: pl.DataFrame) -> pl.DataFrame:
+	"""File stats of each raw file (see ``_file_stats``) plus its row count.
+
+	Row counts are taken from ``file_rows`` (see :class:`RawStats`) of the parse
+	that ingested the files.
+	"""
+	stats = _file_stats(files)
+	counts = file_rows.with_columns(pl.col("n_rows").cast(pl.UInt32))
+	return stats.join(counts, on="file", how="left").with_columns(pl.col("n_rows").fill_null(0))
+
+
+def _write_manifest(results_path: Path, manifest: pl.DataFrame, timeline_inferred: bool) -> None:
+	"""Persist the ingest manifest, with whether the timeline came from data as metadata."""
+	manifest.sort("file").write_parquet(
+		results_path / MANIFEST_FILE,
+		metadata={"timeline_inferred": str(timeline_inferred).lower()},
+	)
+
+
+def _forget_inferred_timeline(config_path: str | Path) -> None:
+	"""Drop a timeline and day range inferred from data, so a rebuild infers them anew.
+
+	Used when an append falls back to a full rebuild: the new files may run past
+	the finish date the previous build inferred.
+	"""
+	cfg: dict[str, Any] = auxfun.read_config(config_path)
+	manifest_path = Path(cfg["project_location"]) / "results" / MANIFEST_FILE
+	if not manifest_path.is_file():
+		return
+	if pl.read_parquet_metadata(manifest_path).get("timeline_inferred") != "true":
+		return
+
+	cfg.pop("experiment_timeline", None)
+	cfg.pop("days_range", None)
+	with open(config_path, "w") as config:
+		toml.dump(cfg, config)
 
 
 def load_data(
@@ -19,57 +159,62 @@ def load_data(
 	min_antenna_crossings: int,
 	animal_ids: list | None = None,
 ) -> pl.LazyFrame:
-	"""Load and combine the raw EcoHab ``.txt`` files into a single LazyFrame.
+	"""Load and combine the raw EcoHab ``.txt`` files into a single in-memory frame.
 
-	Globs every ``<fname_prefix>*.txt`` under the configured ``data_path`` and reads
-	them as one tab-separated source, tagging each row with the COM port (board)
-	extracted from its filename. Animal ids are resolved (and ghost tags optionally
-	dropped) via ``auxfun.set_animal_ids``, and antennas are remapped when a custom
-	layout is in use.
+	Globs every ``<fname_prefix>*.txt`` under the configured ``data_path`` and parses
+	them once as one tab-separated source, tagging each row with the COM port
+	(board) extracted from its filename. Animal ids are resolved (and ghost tags
+	optionally dropped) via ``auxfun.set_animal_ids`` from the parse's stats, and
+	antennas are remapped when a custom layout is in use.
 
 	Raises:
 	    FileNotFoundError: No matching ``.txt`` files were found under ``data_path``.
 
 	Returns:
-	    A LazyFrame with the combined registrations and a ``COM`` board column.
+	    A LazyFrame over the parsed registrations with a ``COM`` board column.
+	"""
+	lf, _ = load_data_with_stats(
+		config_path,
+		fname_prefix,
+		custom_layout,
+		sanitize_animal_ids,
+		min_antenna_crossings,
+		animal_ids,
+	)
+	return lf
+
+
+def load_data_with_stats(
+	config_path: str | Path,
+	fname_prefix: str,
+	custom_layout: bool,
+	sanitize_animal_ids: bool,
+	min_antenna_crossings: int,
+	animal_ids: list | None = None,
+) -> tuple[pl.LazyFrame, RawStats]:
+	"""Same as :func:`load_data`, also returning the :class:`RawStats` of the parse.
+
+	Builds take the row counts of the ingest manifest from the stats, so the raw
+	files are not read again for them.
 	"""
 	cfg: dict[str, Any] = auxfun.read_config(config_path)
 	data_path = Path(cfg["data_path"])
 
 	try:
-		lf = pl.scan_csv(
-			source=data_path / f"{fname_prefix}*.txt",
-			separator="\t",
-			has_header=False,
-			new_columns=["ind", "date", "time", "antenna", "time_under", "animal_id"],
-			include_file_paths="file",
-			glob=True,
-			schema={
-				"ind": pl.Int64,
-				"date": pl.String,
-				"time": pl.String,
-				"antenna": pl.Int64,
-				"time_under": pl.Int64,
-				"animal_id": pl.String,
-			},
-			truncate_ragged_lines=True,
-		)
-	except ComputeError as e:
+		raw, stats = _read_raw_files(data_path / f"{fname_prefix}*.txt")
+	except (ComputeError, FileNotFoundError) as e:
 		# NOTE: maybe we should catch lack fo data earlier? otherwise this error is fragile and can be false
 		raise FileNotFoundError(
 			f"No .txt files found at {data_path} with prefix '{fname_prefix}'"
 		) from e
 
-	lf = lf.with_columns(
-		pl.col("file").str.extract(r"([^/\\]+)$").str.split("_").list.get(0).alias("COM")
-	).drop(["ind", "file"])
-
 	lf = auxfun.set_animal_ids(
 		config_path,
-		lf=lf,
+		lf=raw.lazy(),
 		sanitize_animal_ids=sanitize_animal_ids,
 		min_antenna_crossings=min_antenna_crossings,
 		animal_ids=animal_ids,
+		animal_detections=stats.animal_counts,
 	)
 
 	if custom_layout:
@@ -78,7 +223,7 @@ def load_data(
 
 	auxfun.add_cages_to_config(config_path)
 
-	return lf
+	return lf, stats
 
 
 def calculate_time_spent(lf: pl.LazyFrame) -> pl.LazyFrame:
@@ -99,25 +244,52 @@ def calculate_time_spent(lf: pl.LazyFrame) -> pl.LazyFrame:
 	return lf.with_columns(time_spent.alias("time_spent"))
 
 
-def get_animal_position(lf: pl.LazyFrame, antenna_pairs: dict) -> pl.LazyFrame:
+def _position_table(
+	antenna_pairs: dict[str, str], positions: pl.Enum | None = None
+) -> tuple[int, pl.Series]:
+	"""Compile ``"<prev>_<curr>"`` antenna pairs into a dense lookup table.
+
+	Returns:
+		``K`` (largest antenna + 1) and a ``K * K`` Series whose entry
+		``prev * K + curr`` is the position of that antenna pair, as ``positions``
+		(by default an Enum of the mapped positions plus ``"undefined"``, used for
+		unmapped pairs).
+	"""
+	pairs = {
+		tuple(int(antenna) for antenna in key.split("_")): position
+		for key, position in antenna_pairs.items()
+	}
+	k = max((max(pair) for pair in pairs), default=0) + 1
+	table = ["undefined"] * (k * k)
+	for (prev, curr), position in pairs.items():
+		table[prev * k + curr] = position
+
+	if positions is None:
+		positions = pl.Enum(sorted(set(pairs.values()) | {"undefined"}))
+	return k, pl.Series("position", table, dtype=positions)
+
+
+def get_animal_position(
+	lf: pl.LazyFrame, antenna_pairs: dict, positions: pl.Enum | None = None
+) -> pl.LazyFrame:
 	"""Derive each row's ``position`` from its antenna and the previous one.
 
-	Per animal, the previous and current antenna are joined as a ``"<prev>_<curr>"``
-	key and looked up in ``antenna_pairs`` to name the position (cage or directional
-	tunnel). The first reading of each animal has no predecessor, so a ``0`` previous
-	antenna is used; unmapped pairs become ``"undefined"``.
+	Per animal, the previous and current antenna form a pair that is looked up in
+	``antenna_pairs`` (keyed ``"<prev>_<curr>"``) to name the position (cage or
+	directional tunnel). The mapping is compiled once into a dense table indexed by
+	``prev * K + curr``, so the lookup is an integer gather and ``position`` an Enum
+	(``positions``, normally the project's :func:`auxfun.get_position_enum`). The
+	first reading of each animal has no predecessor, so a ``0`` previous antenna is
+	used; unmapped pairs become ``"undefined"``.
 	"""
-	prev_ant = pl.col("antenna").shift(1).over("animal_id").fill_null(0).cast(pl.Utf8)
-	curr_ant = pl.col("antenna").cast(pl.Utf8)
+	k, table = _position_table(antenna_pairs, positions)
+	prev_ant = pl.col("antenna").shift(1).over("animal_id").fill_null(0).cast(pl.UInt32)
+	curr_ant = pl.col("antenna").cast(pl.UInt32)
 
-	pair = pl.concat_str([prev_ant, pl.lit("_"), curr_ant])
+	index = pl.when((prev_ant < k) & (curr_ant < k)).then(prev_ant * k + curr_ant)
 
 	return lf.with_columns(
-		[
-			pair.replace_strict(antenna_pairs, default="undefined")
-			.alias("position")
-			.cast(pl.Categorical)
-		]
+		pl.lit(table).gather(index).fill_null("undefined").alias("position"),
 	)
 
 
@@ -133,13 +305,16 @@ def _rename_antennas(lf: pl.LazyFrame, rename_dicts: dict) -> pl.LazyFrame:
 	return lf
 
 
-def _prepare_columns(cfg: dict, lf: pl.LazyFrame, timezone: str) -> pl.LazyFrame:
+def _prepare_columns(
+	cfg: dict, lf: pl.LazyFrame, timezone: str, by: str | None = "COM"
+) -> pl.LazyFrame:
 	"""Cast raw columns to their final types and build the ``datetime`` column.
 
 	Animal ids become an enum, antennas a small int and ``time_under`` a duration.
-	The separate date/time strings are combined into a single timezone-aware
-	``datetime`` (offset by ``time_under`` so it marks the end of the reading), and
-	duplicate (datetime, animal) rows are dropped.
+	The separate date/time strings are combined into a wall-clock ``datetime``
+	(offset by ``time_under`` so it marks the end of the reading), localized to
+	``timezone`` per ``by`` group with :func:`apply_timezone_fix`, and duplicate
+	(datetime, animal) rows are dropped.
 	"""
 	animal_ids: list[str] = cfg["animal_ids"]
 	return (
@@ -151,38 +326,64 @@ def _prepare_columns(cfg: dict, lf: pl.LazyFrame, timezone: str) -> pl.LazyFrame
 		.with_columns(
 			(
 				pl.concat_str([pl.col("date"), pl.col("time")], separator=" ").str.to_datetime(
-					"%Y.%m.%d %H:%M:%S%.f",
-					time_unit="us",
-					time_zone=timezone,
+					"%Y.%m.%d %H:%M:%S%.f", time_unit="us"
 				)
 				+ pl.col("time_under")
 			).alias("datetime"),
 		)
 		.drop(["date", "time"])
+		.pipe(apply_timezone_fix, timezone, by)
 		.unique(subset=["datetime", "animal_id"], keep="first")
 	)
 
 
-def apply_timezone_fix(frame: pl.DataFrame | pl.LazyFrame, timezone: ZoneInfo) -> pl.DataFrame:
-	"""Auxfun to handle winter DST due to time ambiguity. Finds a pivot point (time suddenly going backwards) and establishes it as DST onset."""
-	df = frame.collect() if isinstance(frame, pl.LazyFrame) else frame
+def apply_timezone_fix(lf: pl.LazyFrame, timezone: str, by: str | None = None) -> pl.LazyFrame:
+	"""Localize the wall-clock ``datetime`` column, resolving autumn DST ambiguity.
 
-	diffs = df["datetime"].diff().fill_null(dt.timedelta(microseconds=0))
+	When clocks fall back, an hour of wall-clock times occurs twice and a board's
+	reads jump backwards. Reads are taken in recorded order within each ``by``
+	group (e.g. a ``COM`` board, since every board keeps its own clock), so each
+	backwards step onto an ambiguous time marks a transition: ambiguous reads from
+	it to the end of that date get the later (standard time) instant, all other
+	ambiguous reads the earlier one. Every transition of a multi-month recording is
+	resolved in one lazy pass.
 
-	if diffs.min() >= dt.timedelta(microseconds=0):  # ty: ignore[unsupported-operator] — Series.min on a Duration column is typed as a broad union.
-		return df.with_columns(pl.col("datetime").dt.replace_time_zone(timezone.key))
+	Args:
+		lf: frame with a timezone-naive ``datetime`` column, in recorded order.
+		timezone: IANA timezone the reads were recorded in.
+		by: column whose groups carry independent clocks, or None for one clock.
 
-	pivot_index = diffs.arg_min()
+	Returns:
+		``lf`` with ``datetime`` localized to ``timezone``.
+	"""
+
+	def per_clock(expr: pl.Expr) -> pl.Expr:
+		return expr.over(by) if by is not None else expr
+
+	wall = pl.col("datetime")
+	earliest = wall.dt.replace_time_zone(timezone, ambiguous="earliest")
+	latest = wall.dt.replace_time_zone(timezone, ambiguous="latest")
 
 	return (
-		df.with_row_index()
-		.with_columns(pl.col("index").ge(pivot_index).alias("is_after_jump"))
+		lf.with_columns(
+			earliest.alias("__earliest"),
+			latest.alias("__latest"),
+			(earliest != latest).alias("__ambiguous"),
+		)
 		.with_columns(
-			pl.when(pl.col("is_after_jump"))
-			.then(pl.col("datetime").dt.replace_time_zone(timezone.key, ambiguous="latest"))
-			.otherwise(pl.col("datetime").dt.replace_time_zone(timezone.key, ambiguous="earliest")),
+			per_clock(
+				pl.when((wall.diff() < 0) & pl.col("__ambiguous"))
+				.then(wall.dt.date())
+				.forward_fill()
+			).alias("__fall_back_date")
 		)
-		.drop("is_after_jump", "index")
+		.with_columns(
+			pl.when(pl.col("__ambiguous") & (pl.col("__fall_back_date") == wall.dt.date()))
+			.then(pl.col("__latest"))
+			.otherwise(pl.col("__earliest"))
+			.alias("datetime")
+		)
+		.drop("__earliest", "__latest", "__ambiguous", "__fall_back_date")
 	)
 
 
@@ -204,8 +405,12 @@ def extrapolate_last_position(lf: pl.LazyFrame) -> pl.LazyFrame:
 	"""Extrapolate the last position for each animal to the experiment end.
 
 	This allows better calculation of time spent in positions and cage
-	occupancy in experiments with low activity.
+	occupancy in experiments with low activity. The synthesised rows are flagged
+	``extrapolated=True`` so an incremental ingest can drop them once newer reads
+	arrive; real registrations are ``extrapolated=False``.
 	"""
+	lf = lf.select(RAW_COLUMNS)
+
 	last_rows_lf = lf.group_by("animal_id").agg(pl.all().sort_by("datetime").last())
 
 	global_last_lf = lf.select(pl.col("datetime").max().alias("global_last_dt"))
@@ -215,13 +420,253 @@ def extrapolate_last_position(lf: pl.LazyFrame) -> pl.LazyFrame:
 		.filter(pl.col("datetime") != pl.col("global_last_dt"))
 		.with_columns(pl.col("global_last_dt").alias("datetime"))
 		.drop("global_last_dt")
-		.select(["antenna", "time_under", "animal_id", "datetime"])
+		.select(RAW_COLUMNS)
 	)
 
-	return pl.concat([lf, artificial_rows]).sort("datetime")
+	return pl.concat(
+		[
+			lf.with_columns(pl.lit(False).alias("extrapolated")),
+			artificial_rows.with_columns(pl.lit(True).alias("extrapolated")),
+		]
+	).sort("datetime")
+
+
+def _remove_padding(results_path: Path, keep: Sequence[str]) -> None:
+	"""Delete stored padded tables at resolutions other than ``keep``."""
+	for resolution in auxfun.stored_resolutions(results_path):
+		if resolution not in keep:
+			results_io.remove_result(results_path, auxfun.padding_key(resolution))
+	# Projects built before padding was keyed by resolution hold a plain padded_df.
+	results_io.remove_result(results_path, auxfun.PADDED_KEY)
+
+
+def _append_new_files(
+	config_path: str | Path,
+	fname_prefix: str,
+	custom_layout: bool,
+	save_data: bool,
+	resolutions: Sequence[str] = (auxfun.DEFAULT_PADDING,),
+) -> pl.LazyFrame | None:
+	"""Fold raw files that arrived since the last build into main_df and padded tables.
+
+	Files are compared against the ingest manifest by name, size and modification
+	time. New files, and files that only grew (the rig was still writing them), are
+	parsed; everything else is reused from the stored tables. Because
+	``calculate_time_spent``, ``get_animal_position`` and ``extrapolate_last_position``
+	depend on each animal's previous row, the stored tables are rewound to the
+	earliest new timestamp: rows before it are kept as they are, rows after it are
+	recomputed together with the new reads, and each animal's last kept row serves as
+	the context its first new row is measured against. Phases, days and
+	``phase_count`` come from the experiment calendar, so they continue on their own.
+	A ``padded_df@<resolution>`` table is maintained for each of ``resolutions``;
+	stored ones at other resolutions are removed.
+
+	Returns:
+	    The updated ``main_df``, or ``None`` when an incremental update is not
+	    possible (no previous build or manifest, a requested padded table that was
+	    never built, or ingested files were modified or removed) and the data
+	    structure has to be rebuilt from scratch.
+	"""
+	cfg: dict[str, Any] = auxfun.read_config(config_path)
+	results_path = Path(cfg["project_location"]) / "results"
+	manifest_path = results_path / MANIFEST_FILE
+
+	main_df: pl.LazyFrame | None = auxfun.load_ecohab_data(config_path, "main_df")
+	stored_padded: dict[str, pl.LazyFrame | None] = {
+		resolution: auxfun.load_ecohab_data(config_path, auxfun.padding_key(resolution))
+		for resolution in resolutions
+	}
+	if main_df is None or not manifest_path.is_file():
+		print("No previous ingest found. Building the data structure from scratch...")
+		return None
+	for resolution, stored in stored_padded.items():
+		if stored is None:
+			print(
+				f"No previous {auxfun.padding_key(resolution)} found. "
+				"Building the data structure from scratch..."
+			)
+			return None
+	if save_data:
+		_remove_padding(results_path, keep=resolutions)
+
+	manifest = pl.read_parquet(manifest_path)
+	timeline_inferred = pl.read_parquet_metadata(manifest_path).get("timeline_inferred") == "true"
+
+	files = {f.name: f for f in _list_raw_files(Path(cfg["data_path"]), fname_prefix)}
+	compared = _file_stats(list(files.values())).join(
+		manifest, on="file", how="full", suffix="_ingested", coalesce=True
+	)
+
+	was_ingested = pl.col("size_ingested").is_not_null()
+	removed = compared.filter(pl.col("size").is_null())
+	modified = compared.filter(
+		was_ingested,
+		(pl.col("size") < pl.col("size_ingested"))
+		| (
+			(pl.col("size") == pl.col("size_ingested"))
+			& (pl.col("mtime") != pl.col("mtime_ingested"))
+		),
+	)
+	if not removed.is_empty() or not modified.is_empty():
+		changed = sorted([*removed["file"], *modified["file"]])
+		print(
+			f"Already ingested files were modified or removed: {changed}. Rebuilding from scratch..."
+		)
+		return None
+
+	pending = compared.filter(~was_ingested | (pl.col("size") > pl.col("size_ingested")))
+	if pending.is_empty():
+		print("No new files to ingest.")
+		return main_df
+
+	pending_files = [files[name] for name in pending["file"]]
+	print(f"Ingesting {len(pending_files)} new file(s)...")
+
+	timezone = sanitize_timezone(cfg["timezone"])
+	parsed, stats = _read_raw_files(pending_files)
+	raw = parsed.lazy().filter(pl.col("animal_id").is_in(cfg["animal_ids"]))
+	if custom_layout:
+		raw = _rename_antennas(raw, cfg["antenna_rename_scheme"])
+	new = _prepare_columns(cfg, raw, str(timezone)).drop("COM").collect()
+
+	start_date = dt.datetime.fromisoformat(cfg["experiment_timeline"]["start_date"]).astimezone(
+		timezone
+	)
+	finish_date = dt.datetime.fromisoformat(cfg["experiment_timeline"]["finish_date"]).astimezone(
+		timezone
+	)
+	new = new.filter(pl.col("datetime") >= start_date)
+	if timeline_inferred and not new.is_empty() and new["datetime"].max() > finish_date:
+		finish_date = new["datetime"].max()
+	new = new.filter(pl.col("datetime") <= finish_date)
+
+	manifest = manifest.filter(~pl.col("file").is_in(pending["file"].implode())).vstack(
+		_file_manifest(pending_files, stats.file_rows)
+	)
+
+	if new.is_empty():
+		print("New files hold no registrations inside the experiment window.")
+		if save_data:
+			_write_manifest(results_path, manifest, timeline_inferred)
+		return main_df
+
+	cutoff: dt.datetime = new["datetime"].min()
+
+	# Row numbers must follow the stored row order that padded row_ids point at,
+	# which is chronological however the table is laid out on disk.
+	main_df = main_df.sort("datetime", maintain_order=True).with_row_index("__row")
+	is_kept = (pl.col("datetime") < cutoff) & ~pl.col("extrapolated")
+	kept = main_df.filter(is_kept)
+	n_kept: int = kept.select(pl.len()).collect().item()
+	if n_kept == 0:
+		print("New files precede the ingested data. Rebuilding from scratch...")
+		return None
+
+	redo = main_df.filter(~is_kept, ~pl.col("extrapolated")).select(RAW_COLUMNS).collect()
+	context = (
+		kept.select(RAW_COLUMNS)
+		.group_by("animal_id")
+		.agg(pl.all().sort_by("datetime").last())
+		.select(RAW_COLUMNS)
+		.collect()
+	)
+
+	suffix = pl.concat([redo, new.select(RAW_COLUMNS)]).unique(
+		subset=["datetime", "animal_id"], keep="first"
+	)
+	suffix = (
+		pl.concat([context, suffix])
+		.lazy()
+		.sort("datetime")
+		.pipe(extrapolate_last_position)
+		.pipe(phase_calendar.label_calendar, cfg, finish=finish_date)
+		.pipe(calculate_time_spent)
+		.pipe(get_animal_position, cfg["antenna_combinations"], auxfun.get_position_enum(cfg))
+		.filter(pl.col("datetime") >= cutoff)
+		.select(main_df.drop("__row").collect_schema().names())
+		.collect()
+	)
+
+	lf = pl.concat([kept.drop("__row"), suffix.lazy()])
+
+	# Padded pieces carry the main_df row they came from; kept rows are renumbered
+	# in case extrapolated rows were interleaved with them, new rows follow on.
+	kept_rows = kept.select(pl.col("__row").alias("row_id")).with_row_index("__new_row_id")
+	padded_new: dict[str, pl.LazyFrame] = {}
+	padded_lfs: dict[str, pl.LazyFrame] = {}
+	for resolution, stored in stored_padded.items():
+		padded_columns = stored.collect_schema().names()
+		padded_kept = (
+			stored.join(kept_rows, on="row_id", how="inner")
+			.with_columns(pl.col("__new_row_id").cast(pl.UInt32).alias("row_id"))
+			.select(padded_columns)
+		)
+		padded_new[resolution] = (
+			auxfun._get_padding(suffix.lazy(), cfg, resolution, finish_date)
+			.with_columns((pl.col("row_id") + n_kept).cast(pl.UInt32))
+			.select(padded_columns)
+		)
+		padded_lfs[resolution] = pl.concat([padded_kept, padded_new[resolution]])
+
+	last_day: int = suffix["day"].max()
+	auxfun.extend_experiment_in_config(
+		config_path,
+		last_day=last_day,
+		finish_date=str(finish_date) if timeline_inferred else None,
+	)
+
+	if not save_data:
+		return lf
+
+	# With day-partitioned results only the days from the first changed row onwards
+	# are rewritten: rows after the first dropped one are recomputed, and padded
+	# pieces past it are renumbered.
+	first_dropped: int = main_df.filter(~is_kept).select(pl.min("__row")).collect().item()
+	touched = [main_df.filter(pl.col("__row") >= first_dropped), suffix.lazy()]
+	for resolution, stored in stored_padded.items():
+		touched += [stored.filter(pl.col("row_id") >= first_dropped), padded_new[resolution]]
+	changed = pl.collect_all(
+		[
+			frame.select(pl.min("day").alias("first"), pl.max("day").alias("last"))
+			for frame in touched
+		]
+	)
+	changed_days = pl.concat(changed)
+	days = range(changed_days["first"].min(), changed_days["last"].max() + 1)
+
+	# Padded tables are rebuilt from both previous tables and main_df only from itself,
+	# so write them first; each table is swapped in once it is fully written.
+	partitioned = cfg.get("partition_results", False)
+	for resolution, padded_lf in padded_lfs.items():
+		key = auxfun.padding_key(resolution)
+		results_io.write_result(
+			padded_lf,
+			results_path,
+			key,
+			partitioned,
+			days=days,
+			ipc_compression=results_io.ipc_compression(cfg, key),
+		)
+	results_io.write_result(
+		lf,
+		results_path,
+		"main_df",
+		partitioned,
+		days=days,
+		ipc_compression=results_io.ipc_compression(cfg, "main_df"),
+	)
+
+	cfg = auxfun.read_config(config_path)
+	auxfun.get_phase_durations(cfg).sink_parquet(
+		results_path / "phase_durations.parquet", engine="streaming"
+	)
+	_write_manifest(results_path, manifest, timeline_inferred)
+
+	return auxfun.load_ecohab_data(config_path, "main_df")
 
 
 @df_registry.register("main_df")
+@profiling.buffered()
 def get_ecohab_data_structure(
 	config_path: str,
 	fname_prefix: Literal["COM", "20"] = "COM",
@@ -230,6 +675,8 @@ def get_ecohab_data_structure(
 	custom_layout: bool = False,
 	overwrite: bool = False,
 	save_data: bool = True,
+	append: bool = False,
+	padded: bool | Sequence[str] = True,
 ) -> pl.LazyFrame:
 	"""Build the main EcoHab data structure (``main_df``) from raw registrations.
 
@@ -241,6 +688,14 @@ def get_ecohab_data_structure(
 	written as side effects. The result is cached as ``results/main_df.parquet`` and
 	reused on subsequent calls unless ``overwrite`` is set.
 
+	Raw files are parsed once into memory, and the ids, boards, row counts and bounds
+	the config needs are all taken from that parse. Every build records the raw files
+	it read in ``results/_ingest_manifest.parquet``, and its time, memory and row
+	counts in ``results/_profile.parquet`` (see ``df_registry.profile_report``).
+	With ``append`` set, only files that are not in the manifest yet are parsed and
+	folded into the stored ``main_df`` and padded tables, so a running experiment can be
+	updated hour by hour without re-reading all of its data.
+
 	Args:
 	    config_path: Path to the project config file.
 	    fname_prefix: Prefix of the raw data files, used to locate them in
@@ -253,10 +708,44 @@ def get_ecohab_data_structure(
 	        non-default locations, so ``antenna_rename_scheme`` is applied.
 	    overwrite: Rebuild and overwrite the cached data file instead of loading it.
 	    save_data: Whether to persist the resulting parquet files.
+	    append: Ingest only newly arrived raw files into the existing data structure.
+	        Falls back to a full rebuild when there is nothing to append onto or when
+	        already ingested files were modified or removed.
+	    padded: Padding resolutions to build, each stored as ``padded_df@<resolution>``
+	        (``main_df`` cut at every bin mark, e.g. ``"1m"`` or ``"1h"``). True builds
+	        the resolutions the registered analysis steps declare in their
+	        ``requires``, False none; steps pad ``main_df`` in memory when their
+	        table is not stored, so large projects can skip them. Stored padded
+	        tables at other resolutions are removed.
 
 	Returns:
 	    The EcoHab data structure as a ``pl.LazyFrame``.
 	"""
+	resolutions = auxfun.padding_resolutions() if padded is True else list(padded or [])
+	record = profiling.ProfileRecord(
+		"main_df",
+		"structure",
+		kwargs={
+			"fname_prefix": fname_prefix,
+			"sanitize_animal_ids": sanitize_animal_ids,
+			"min_antenna_crossings": min_antenna_crossings,
+			"custom_layout": custom_layout,
+			"append": append,
+			"padded": resolutions,
+		},
+	)
+
+	if append and not overwrite:
+		appended = _append_new_files(
+			config_path, fname_prefix, custom_layout, save_data, resolutions
+		)
+		if appended is not None:
+			if save_data:
+				auxfun.log_build(record, config_path, "main_df")
+			return appended
+		_forget_inferred_timeline(config_path)
+		overwrite = True
+
 	cfg: dict[str, Any] = auxfun.read_config(config_path)
 	key = "main_df"
 
@@ -274,7 +763,7 @@ def get_ecohab_data_structure(
 	except KeyError:
 		animal_ids = None
 
-	lf = load_data(
+	lf, stats = load_data_with_stats(
 		config_path=config_path,
 		fname_prefix=fname_prefix,
 		custom_layout=custom_layout,
@@ -288,43 +777,32 @@ def get_ecohab_data_structure(
 
 	cfg = auxfun.read_config(config_path)
 
-	lf = _prepare_columns(cfg, lf, str(timezone))
+	# Handle timezone and DST; boards named COM* each keep their own clock
+	has_com = any("COM" in board for board in stats.boards)
+	lf = _prepare_columns(cfg, lf, str(timezone), by="COM" if has_com else None).drop("COM")
 
+	timeline_inferred = False
 	try:
 		start_date: str = cfg["experiment_timeline"]["start_date"]
 		finish_date: str = cfg["experiment_timeline"]["finish_date"]
 	except KeyError:
 		print("Start and end dates not provided. Extracting from data...")
 		cfg, start_date, finish_date = auxfun.append_start_end_to_config(config_path, lf)
-
-	# Handle timezone, DST and trimming
-	has_com = not lf.filter(pl.col("COM").str.contains("COM")).collect().is_empty()
-	if not has_com:
-		lf = apply_timezone_fix(lf, timezone).lazy()
-	else:
-		dfs = [
-			apply_timezone_fix(lf.filter(pl.col("COM") == com), timezone)
-			for com in lf.select("COM").unique().collect()["COM"].to_list()
-		]
-		lf = pl.concat(dfs).lazy()
+		timeline_inferred = True
 
 	start_date: dt.datetime = dt.datetime.fromisoformat(start_date).astimezone(timezone)
 	finish_date: dt.datetime = dt.datetime.fromisoformat(finish_date).astimezone(timezone)
 
 	# Trim then get phases, days and phase count
 	lf = (
-		lf.drop("COM")
-		.filter((pl.col("datetime") >= start_date) & (pl.col("datetime") <= finish_date))
+		lf.filter((pl.col("datetime") >= start_date) & (pl.col("datetime") <= finish_date))
 		.sort("datetime")
 		.pipe(extrapolate_last_position)
-		.with_columns(
-			auxfun.get_phase(cfg),
-			auxfun.get_day(),
-			auxfun.get_hour(),
-		)
-		.pipe(auxfun.get_phase_count)
+		.pipe(phase_calendar.label_calendar, cfg)
 		.pipe(calculate_time_spent)
-		.pipe(get_animal_position, antenna_pairs)
+		.pipe(get_animal_position, antenna_pairs, auxfun.get_position_enum(cfg))
+		.collect()
+		.lazy()
 	)
 
 	auxfun.add_cages_to_config(config_path)
@@ -334,15 +812,31 @@ def get_ecohab_data_structure(
 		cfg["days_range"]
 	except KeyError:
 		auxfun.add_days_to_config(config_path, lf)
+	cfg = auxfun.read_config(config_path)  # with the cages, positions and days just added
 
-	auxfun.padded_df(lf, cfg, save_data, overwrite)
+	for resolution in resolutions:
+		auxfun.padded_df(lf, cfg, save_data, overwrite, resolution)
+	if save_data:
+		_remove_padding(results_path, keep=resolutions)
 
 	phase_durations_lf: pl.LazyFrame = auxfun.get_phase_durations(cfg)
 
 	if save_data:
-		lf.sink_parquet(results_path / f"{key}.parquet", compression="lz4", engine="streaming")
+		results_io.write_result(
+			lf,
+			results_path,
+			key,
+			partitioned=cfg.get("partition_results", False),
+			ipc_compression=results_io.ipc_compression(cfg, key),
+		)
 		phase_durations_lf.sink_parquet(
 			results_path / "phase_durations.parquet", engine="streaming"
 		)
+		_write_manifest(
+			results_path,
+			_file_manifest(_list_raw_files(Path(cfg["data_path"]), fname_prefix), stats.file_rows),
+			timeline_inferred,
+		)
+		auxfun.log_build(record, config_path, key, rows_in=stats.file_rows["n_rows"].sum())
 
 	return lf
@@ -21,6 +21,9 @@ def create_ecohab_project(
 	field_ecohab: bool = False,
 	interpolate_positions: bool = False,
 	antenna_rename_scheme: dict | None = None,
+	partition_results: bool = False,
+	ipc_results: list[str] | None = None,
+	ipc_compression: str = "uncompressed",
 	overwrite: bool = False,
 ) -> tuple[Path, str | None]:
 	"""Create an EcoHab project directory and write its ``config.toml``.
@@ -52,12 +55,19 @@ def create_ecohab_project(
 		interpolate_positions: Persist the position-interpolation preference in config.
 		antenna_rename_scheme: Per-board ``{old_antenna: new_antenna}`` mapping;
 			required when ``custom_layout`` is True and not a field setup.
+		partition_results: Store day-indexed results partitioned by day, one file
+			per day, so day-range reads and appends touch only the affected days.
+		ipc_results: Keys stored as Arrow IPC (Feather v2) files, memory-mapped
+			when read, instead of parquet - e.g. ``["main_df", "padded_df"]`` for
+			tables every step and dashboard worker reads.
+		ipc_compression: Compression of the IPC files: ``"uncompressed"`` (read
+			without decoding or copying, but larger) or ``"lz4"``.
 		overwrite: Overwrite an existing project config instead of loading it.
 
 	Raises:
 		FileNotFoundError: No ``.txt`` files found in ``data_path``.
-		ValueError: Finish date precedes start date, or a custom layout is requested
-			without an ``antenna_rename_scheme``.
+		ValueError: Finish date precedes start date, a custom layout is requested
+			without an ``antenna_rename_scheme``, or ``ipc_compression`` is unknown.
 
 	Returns:
 		Tuple of the config file path and a status string: ``"created"`` for a new
@@ -73,6 +83,11 @@ def create_ecohab_project(
 		print(f"Project already exists! Loading: {config_path}")
 		return config_path, "exists"
 
+	if ipc_compression not in ("uncompressed", "lz4"):
+		raise ValueError(
+			f"ipc_compression must be 'uncompressed' or 'lz4', got {ipc_compression!r}"
+		)
+
 	if not any(data_dir.glob("*.txt")):
 		raise FileNotFoundError(f"No .txt files found in {data_dir}")
 
@@ -101,6 +116,9 @@ def create_ecohab_project(
 		"timezone": timezone,
 		"days_range": days_range,
 		"interpolate_positions": interpolate_positions,
+		"partition_results": partition_results,
+		"ipc_results": list(ipc_results or []),
+		"ipc_compression": ipc_compression,
 	}
 
 	if custom_layout and not field_ecohab:
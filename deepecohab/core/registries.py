@@ -1,7 +1,15 @@
 import functools
+import hashlib
 import inspect
+import json
+import threading
+import time
+from collections import OrderedDict
 from collections.abc import Callable, Iterator, Sequence
-from dataclasses import fields
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextvars import Context, ContextVar, copy_context
+from dataclasses import dataclass, field, fields
+from importlib.metadata import version
 from pathlib import Path
 from typing import (
 	Any,
@@ -9,8 +17,148 @@ from typing import (
 
 import polars as pl
 
+from deepecohab.utils import profiling, results_io
+from deepecohab.utils.artifact_store import ArtifactStore, DiskStore, MemoryStore
 from deepecohab.utils.auxfun_plots import PlotConfig
 
+# Parquet key-value metadata entry holding a step result's fingerprint.
+FINGERPRINT_KEY = "deepecohab_fingerprint"
+# Parquet key-value metadata entry listing the columns a step result is sorted by.
+SORTED_BY_KEY = "deepecohab_sorted_by"
+# Parquet key-value metadata entry holding the grid (JSON) a sparse step result
+# densifies onto, as keyword arguments of auxfun.densify.
+GRID_KEY = "deepecohab_grid"
+
+# Config entries that can change analysis results. Paths and names are left out
+# so moving or renaming a project does not invalidate its results.
+FINGERPRINT_CONFIG_KEYS = (
+	"animal_ids",
+	"antenna_combinations",
+	"cages",
+	"days_range",
+	"experiment_timeline",
+	"phase",
+	"positions",
+	"timezone",
+	"tunnels",
+)
+
+
+def _fingerprint_value(value: Any) -> Any:
+	"""Reduce a config value or step kwarg to a JSON-serialisable, order-stable form."""
+	if isinstance(value, (pl.DataFrame, pl.LazyFrame)):
+		return hashlib.sha256(value.lazy().collect().serialize()).hexdigest()
+	if isinstance(value, dict):
+		return {str(k): _fingerprint_value(v) for k, v in sorted(value.items())}
+	if isinstance(value, (list, tuple)):
+		return [_fingerprint_value(v) for v in value]
+	if isinstance(value, Path):
+		return str(value)
+	return value
+
+
+def config_fingerprint(cfg: dict[str, Any]) -> str:
+	"""Hash of the config entries that can change analysis results."""
+	payload = {key: cfg.get(key) for key in FINGERPRINT_CONFIG_KEYS}
+	encoded = json.dumps(_fingerprint_value(payload), sort_keys=True, default=repr)
+	return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def read_fingerprint(results_path: Path, key: str) -> str | None:
+	"""Fingerprint stored in a step result's parquet metadata, or None if absent."""
+	return _stored_fingerprint(DiskStore(results_path), key)
+
+
+@dataclass
+class PipelineReport:
+	"""Wall time and table I/O of one ``run_pipeline`` call.
+
+	Attributes:
+		mode: ``"steps"`` (each step sunk on its own) or ``"fused"``.
+		steps: steps the run went through, cached ones included.
+		step_seconds: wall time of each step computed in the run (cached steps
+			are absent; a fused run records its one ``"fused"`` collection).
+		wall_seconds: time from the first step starting to the last result written.
+		bytes_read: stored size of the tables the steps scanned from disk,
+			counted once per scan. It is an upper bound on what was read, since
+			projections and day filters read less.
+		bytes_written: size of the results written to disk (0 with a
+			:class:`MemoryStore`).
+	"""
+
+	mode: str
+	steps: list[str] = field(default_factory=list)
+	step_seconds: dict[str, float] = field(default_factory=dict)
+	wall_seconds: float = 0.0
+	bytes_read: int = 0
+	bytes_written: int = 0
+	_lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+	def add_io(self, read: int = 0, written: int = 0) -> None:
+		"""Add table bytes read or written (thread-safe)."""
+		with self._lock:
+			self.bytes_read += read
+			self.bytes_written += written
+
+
+@dataclass
+class _PipelineRun:
+	"""State of a ``run_pipeline`` call, seen by the steps it runs."""
+
+	report: PipelineReport
+	store: ArtifactStore
+	# Frames of fused steps not yet materialised, served to the steps reading them.
+	planned: dict[str, pl.LazyFrame] = field(default_factory=dict)
+	# Profiles of the steps computed, added to the ledger once when the run ends.
+	profiled: list[profiling.ProfileRecord] = field(default_factory=list)
+
+
+# The run_pipeline call in progress in this context, if any. run_pipeline sets it
+# only in a context of its own, entered around each step and left before every
+# yield, so the caller's context never holds it. Worker threads run in copies.
+_ACTIVE_RUN: ContextVar[_PipelineRun | None] = ContextVar("deepecohab_run", default=None)
+
+
+def record_io(read: int = 0, written: int = 0) -> None:
+	"""Add table bytes read or written to the report of the pipeline run in progress."""
+	run = _ACTIVE_RUN.get()
+	if run is not None:
+		run.report.add_io(read, written)
+
+
+def planned_frame(key: str) -> pl.LazyFrame | None:
+	"""Unmaterialised frame of ``key`` in the fused pipeline run in progress, if any."""
+	run = _ACTIVE_RUN.get()
+	return run.planned.get(key) if run is not None else None
+
+
+def run_frame(key: str) -> pl.LazyFrame | None:
+	"""Frame of ``key`` as the pipeline run in progress holds it, if any.
+
+	A planned (fused) frame, else whatever the run's artifact store holds under
+	``key``. None outside a run or when the store does not hold ``key``.
+	"""
+	run = _ACTIVE_RUN.get()
+	if run is None:
+		return None
+	if key in run.planned:
+		return run.planned[key]
+	frame = run.store.get(key)
+	if frame is not None:
+		record_io(read=run.store.size(key))
+	return frame
+
+
+def _stored_fingerprint(store: ArtifactStore, key: str) -> str | None:
+	"""Fingerprint of the result a store holds under ``key``, or None."""
+	return (store.metadata(key) or {}).get(FINGERPRINT_KEY)
+
+
+def _file_fingerprint(results_path: Path, key: str) -> str | None:
+	"""Identity of a table not produced by a step (its files' size and mtime), or None."""
+	location = results_io.result_location(results_path, key)
+	return results_io.result_signature(location) if location is not None else None
+
 
 class DataFrameRegistry:
 	"""Registry of data-key builders and the dependency graph between them.
@@ -26,6 +174,17 @@ class DataFrameRegistry:
 		# name -> data keys the step reads. Only analysis steps (registered via
 		# register_step) appear here; this is what defines the dependency graph.
 		self._requires: dict[str, list[str]] = {}
+		# name -> keyword parameters (with defaults) and code version of each
+		# step; both feed the step's fingerprint.
+		self._params: dict[str, dict[str, Any]] = {}
+		self._code_version: dict[str, str] = {}
+		# name -> grid a sparse step result densifies onto (see auxfun.densify).
+		self._grids: dict[str, dict[str, Any]] = {}
+		# name -> undecorated step function and the parquet metadata of its result
+		# besides the fingerprint; the fused pipeline calls and sinks them itself.
+		self._steps: dict[str, Callable] = {}
+		self._metadata: dict[str, dict[str, str]] = {}
+		self.last_report: PipelineReport | None = None
 
 	def register(self, name: str):
 		"""Register a known data key and its builder, as-is.
@@ -34,7 +193,8 @@ class DataFrameRegistry:
 		those have bespoke signatures, build several outputs at once and run
 		before the analysis pipeline, so they are not lifecycle-wrapped and are
 		not nodes in the analysis dependency graph. They are still listed in
-		``list_available`` so they can be loaded by key.
+		``list_available`` so they can be loaded by key; ``padded_df`` is stored
+		once per resolution, as ``padded_df@<resolution>``.
 		"""
 
 		def wrapper(func: Callable):
@@ -43,7 +203,13 @@ class DataFrameRegistry:
 
 		return wrapper
 
-	def register_step(self, name: str, requires: Sequence[str] = ()):
+	def register_step(
+		self,
+		name: str,
+		requires: Sequence[str] = (),
+		sorted_by: Sequence[str] = (),
+		grid: dict[str, Any] | None = None,
+	):
 		"""Register an analysis pipeline step.
 
 		The wrapped function becomes pure compute: it receives the resolved
@@ -52,12 +218,25 @@ class DataFrameRegistry:
 		sinking - and records ``requires`` so ``run_pipeline`` can derive a valid
 		execution order by topological sort.
 
+		Each sunk parquet carries a fingerprint (see :meth:`fingerprint`) in its
+		metadata. A cached result is reused only while its fingerprint matches,
+		so a changed step kwarg, relevant config entry, upstream result or step
+		code recomputes the step, and in turn everything downstream of it.
+		Every computed and stored result is profiled (see :meth:`profile_report`).
+
 		Args:
-			name: output key, also the ``results/<name>.parquet`` filename.
+			name: output key, also the name of its table under ``results/``.
 			requires: data keys this step reads via ``auxfun._get_data``. Keys
 				that are themselves steps create dependency edges; keys produced
 				by the data-structure stage (e.g. main_df) are treated as
 				external prerequisites and create no edge.
+			sorted_by: columns the step's result is sorted by, recorded in the
+				parquet metadata (``SORTED_BY_KEY``, comma-separated) so readers
+				can rely on the stored row order instead of sorting again.
+			grid: for sparse results (observed cells only), the keyword arguments
+				of ``auxfun.densify`` rebuilding their dense grid (``columns``,
+				``ordered``, ``positions`` as a ``get_positions`` kind). Returned
+				by :meth:`grid` and recorded in the parquet metadata (``GRID_KEY``).
 		"""
 
 		def wrapper(func: Callable):
@@ -71,31 +250,263 @@ class DataFrameRegistry:
 			) -> pl.LazyFrame:
 				from deepecohab.utils import auxfun
 
-				cfg: dict[str, Any] = auxfun.read_config(config_path)
+				planned = planned_frame(name)
+				if planned is not None:
+					return planned
 
-				if not overwrite:
-					cached = auxfun.load_ecohab_data(config_path, name)
-					if isinstance(cached, pl.LazyFrame):
+				cfg: dict[str, Any] = auxfun.read_config(config_path)
+				store = self._store(cfg)
+				fingerprint = None
+				if not overwrite or save_data:
+					fingerprint = self.fingerprint(name, cfg, **kwargs)
+
+				if not overwrite and _stored_fingerprint(store, name) == fingerprint:
+					cached = store.get(name)
+					if cached is not None:
+						record_io(read=store.size(name))
 						return cached
 
+				record = profiling.ProfileRecord(
+					name,
+					"step",
+					config_fingerprint=config_fingerprint(cfg),
+					fingerprint=fingerprint,
+					kwargs=self._step_params(name, kwargs),
+				)
 				result: pl.LazyFrame = func(cfg, **kwargs)
 
 				if save_data:
-					results_path = Path(cfg["project_location"]) / "results" / f"{name}.parquet"
-					result.sink_parquet(results_path, compression="lz4", engine="streaming")
+					self._write(name, result, store, fingerprint)
+					record.stop()
+					record.rows_in = self._rows_in(cfg, store, name)
+					self._profile(record, cfg, store, [name])
 
 				return result
 
+			signature = inspect.signature(func).parameters.values()
+			self._params[name] = {
+				p.name: p.default
+				for p in list(signature)[1:]
+				if p.kind not in (p.VAR_POSITIONAL, p.VAR_KEYWORD)
+			}
+			try:
+				source = inspect.getsource(func)
+			except (OSError, TypeError):
+				source = ""
+			self._code_version[name] = (
+				f"{version('deepecohab')}+{hashlib.sha256(source.encode()).hexdigest()[:12]}"
+			)
 			self._registry[name] = lifecycle
 			self._requires[name] = list(requires)
+			self._steps[name] = func
+			self._metadata[name] = {}
+			if sorted_by:
+				self._metadata[name][SORTED_BY_KEY] = ",".join(sorted_by)
+			if grid is not None:
+				self._grids[name] = dict(grid)
+				self._metadata[name][GRID_KEY] = json.dumps(grid)
 			return lifecycle
 
 		return wrapper
 
+	def _store(self, cfg: dict[str, Any]) -> ArtifactStore:
+		"""Store of the pipeline run in progress, else the project's ``results/``."""
+		run = _ACTIVE_RUN.get()
+		if run is not None:
+			return run.store
+		return DiskStore.from_config(cfg)
+
+	def _write(
+		self,
+		name: str,
+		result: pl.LazyFrame | pl.DataFrame,
+		store: ArtifactStore,
+		fingerprint: str | None,
+	) -> None:
+		"""Store a step result with its fingerprint and metadata."""
+		store.put(name, result, {FINGERPRINT_KEY: fingerprint, **self._metadata[name]})
+		record_io(written=store.size(name))
+
+	def _rows_in(self, cfg: dict[str, Any], store: ArtifactStore, name: str) -> int | None:
+		"""Rows of the stored tables a step reads, or None if none is stored."""
+		disk = DiskStore.from_config(cfg)
+		rows = []
+		for req in self._requires[name]:
+			n = store.rows(req)
+			rows.append(n if n is not None else disk.rows(req))
+		known = [n for n in rows if n is not None]
+		return sum(known) if known else None
+
+	def _profile(
+		self,
+		record: profiling.ProfileRecord,
+		cfg: dict[str, Any],
+		store: ArtifactStore,
+		written: list[str],
+	) -> None:
+		"""Complete a stopped record with the ``written`` results and log it.
+
+		Records go to the run's report and, when results are stored on disk, to
+		the project's profiling ledger (``results/_profile.parquet``), which a
+		pipeline run writes once, when it ends.
+		"""
+		record.rows_out = sum(store.rows(key) or 0 for key in written)
+		record.bytes_out = sum(store.size(key) for key in written)
+		run = _ACTIVE_RUN.get()
+		if run is not None:
+			run.report.step_seconds[record.step] = record.wall_seconds
+		if not isinstance(store, DiskStore):
+			return
+		if run is not None:
+			run.profiled.append(record)
+		else:
+			profiling.log(store.results_path, record)
+
+	def _step_params(self, name: str, kwargs: dict[str, Any]) -> dict[str, Any]:
+		"""A step's keyword parameters: passed values over signature defaults."""
+		params = {key: kwargs.get(key, default) for key, default in self._params[name].items()}
+		return {key: value for key, value in params.items() if value is not inspect.Parameter.empty}
+
+	def _input_fingerprints(
+		self, cfg: dict[str, Any], name: str, pending: dict[str, str] | None = None
+	) -> dict[str, str | None]:
+		"""Fingerprints of the data a step reads, as currently stored.
+
+		Step inputs report the fingerprint stored with them in the run's store;
+		data-structure inputs (main_df, padded_df, ...) report their file
+		identity. ``pending`` overrides entries with fingerprints that steps are
+		about to produce (used by :meth:`stale_steps`).
+		"""
+		results = Path(cfg.get("project_location", ".")) / "results"
+		store = self._store(cfg)
+		pending = pending or {}
+		inputs: dict[str, str | None] = {}
+		for req in self._requires[name]:
+			if req in pending:
+				inputs[req] = pending[req]
+			elif req in self._requires:
+				inputs[req] = _stored_fingerprint(store, req)
+			else:
+				inputs[req] = _file_fingerprint(results, req)
+		return inputs
+
+	def fingerprint(
+		self,
+		name: str,
+		config: str | Path | dict[str, Any],
+		*,
+		_inputs: dict[str, str | None] | None = None,
+		**kwargs,
+	) -> str:
+		"""Content fingerprint of a step's result for the given config and kwargs.
+
+		Hashes the analysis-relevant config subset (``FINGERPRINT_CONFIG_KEYS``),
+		the step's keyword parameters (passed values over signature defaults;
+		kwargs the step does not take are ignored), the fingerprints of its
+		inputs and its code version (package version plus a hash of the step
+		function's source).
+
+		Args:
+			name: analysis step name.
+			config: project config (path or dict).
+			**kwargs: step kwargs, as passed to the step or ``run_pipeline``.
+
+		Returns:
+			Hex digest identifying the inputs the result was computed from.
+		"""
+		from deepecohab.utils import auxfun
+
+		cfg: dict[str, Any] = auxfun.read_config(config)
+		payload = {
+			"config": {key: cfg.get(key) for key in FINGERPRINT_CONFIG_KEYS},
+			"params": self._step_params(name, kwargs),
+			"inputs": _inputs if _inputs is not None else self._input_fingerprints(cfg, name),
+			"code": self._code_version[name],
+		}
+		encoded = json.dumps(_fingerprint_value(payload), sort_keys=True, default=repr)
+		return hashlib.sha256(encoded.encode()).hexdigest()
+
+	def stale_steps(
+		self,
+		config: str | Path | dict[str, Any],
+		targets: list[str] | None = None,
+		store: ArtifactStore | None = None,
+		**kwargs,
+	) -> list[str]:
+		"""Steps ``run_pipeline`` would recompute, in execution order.
+
+		A step is stale when its stored fingerprint is missing or differs from the
+		one it would be computed with now; every step downstream of a stale step
+		is stale too, since its input fingerprint is about to change.
+
+		Args:
+			config: project config (path or dict).
+			targets: if given, consider only these steps and their dependencies.
+			store: store holding the results; the project's ``results/`` by default.
+			**kwargs: step kwargs, as they would be passed to ``run_pipeline``.
+		"""
+		from deepecohab.utils import auxfun
+
+		cfg: dict[str, Any] = auxfun.read_config(config)
+		store = store or self._store(cfg)
+		# Run the check as a run on ``store``, so step inputs are looked up there.
+		token = _ACTIVE_RUN.set(_PipelineRun(PipelineReport(mode="check"), store))
+		try:
+			pending: dict[str, str] = {}
+			stale: list[str] = []
+			for name in self._resolve_order(targets):
+				inputs = self._input_fingerprints(cfg, name, pending)
+				expected = self.fingerprint(name, cfg, _inputs=inputs, **kwargs)
+				if _stored_fingerprint(store, name) != expected:
+					stale.append(name)
+				pending[name] = expected
+		finally:
+			_ACTIVE_RUN.reset(token)
+		return stale
+
 	def list_available(self) -> list[str]:
 		"""Returns a list of all registered data keys."""
 		return list(self._registry.keys())
 
+	def grid(self, name: str) -> dict[str, Any] | None:
+		"""Grid a sparse step result densifies onto, or None for dense results.
+
+		Pass it on to ``auxfun.densify``: ``densify(lf, cfg, **df_registry.grid(name))``.
+		"""
+		grid = self._grids.get(name)
+		return dict(grid) if grid is not None else None
+
+	def profile_report(
+		self, config: str | Path | dict[str, Any], raw: bool = False
+	) -> pl.DataFrame:
+		"""Summary of the project's profiling ledger (``results/_profile.parquet``).
+
+		Every step computed with its result written to disk, and every
+		data-structure build (``main_df``, ``padded_df@<resolution>``), appends
+		one row to the ledger: wall and CPU time, peak RSS, input/output row
+		counts, output size, config fingerprint and kwargs (see
+		:class:`profiling.ProfileRecord`). Cached steps take no time and are not
+		logged.
+
+		Args:
+			config: project config (path or dict).
+			raw: return the ledger itself instead of the per-step summary.
+
+		Returns:
+			One row per step and kind: run count, last run, last/median/total wall
+			seconds, median CPU seconds, peak RSS and the last run's row counts
+			and output size, slowest step first.
+		"""
+		from deepecohab.utils import auxfun
+
+		cfg: dict[str, Any] = auxfun.read_config(config)
+		ledger = profiling.read_ledger(Path(cfg["project_location"]) / "results")
+		return ledger if raw else profiling.summarise(ledger)
+
+	def inputs(self) -> set[str]:
+		"""Data keys read by the registered analysis steps."""
+		return {req for requires in self._requires.values() for req in requires}
+
 	def _resolve_order(self, targets: list[str] | None = None) -> list[str]:
 		"""Topologically sort the analysis steps.
 
@@ -151,24 +562,192 @@ class DataFrameRegistry:
 		return self._resolve_order()
 
 	def run_pipeline(
-		self, config: dict[str, Any], targets: list[str] | None = None, **kwargs
+		self,
+		config: dict[str, Any],
+		targets: list[str] | None = None,
+		jobs: int = 1,
+		fused: bool = False,
+		store: ArtifactStore | None = None,
+		**kwargs,
 	) -> Iterator[tuple[str, int, int]]:
 		"""Runs the pipeline in dependency order and yields status updates.
 
+		With ``jobs > 1`` steps run on a thread pool: each step is submitted as
+		soon as every step it requires has finished, so independent branches
+		(e.g. ``activity_df``, ``match_df``, ``tube_test_df`` and
+		``pairwise_meetings``) overlap. Threads suffice because the steps spend
+		their time in polars/NumPy, which release the GIL. Progress is yielded in
+		completion order; the first failing step's exception is re-raised after
+		the steps already running have finished.
+
+		With ``fused=True`` the steps are not sunk one by one: every step that is
+		not cached is built as a LazyFrame, reading its upstream steps' frames
+		instead of their files, and all of them are materialised together with
+		``pl.collect_all``. Polars then computes the subplans they share (the
+		``main_df`` scan, the occupancy bouts, ``match_df``) once. All results are
+		held in memory until they are written, and steps that collect their
+		inputs eagerly while being built (``ranking``) compute them once more.
+
+		Step results are kept in an :class:`ArtifactStore`. By default that is
+		the project's ``results/`` directory; with ``save_data=False`` it is a
+		fresh :class:`MemoryStore` that reads ``main_df`` (and results already
+		on disk) from ``results/`` but writes nothing, so a run leaves the
+		project untouched. Pass the same ``MemoryStore`` to several runs to
+		reuse the results a parameter change leaves valid.
+
+		Wall time and table I/O of the run are kept in :attr:`last_report`; see
+		:meth:`compare_modes` to measure what fusing saves.
+
 		Args:
 			config: project config (path or dict).
 			targets: if given, run only these steps and their dependencies;
 				otherwise run every step.
+			jobs: maximum number of steps running at once. ``1`` runs serially
+				in topological order. Ignored with ``fused=True``.
+			fused: materialise every step in one ``pl.collect_all`` call.
+			store: where step results are read from and written to; overrides
+				``save_data``.
 
 		Yields:
 			(step_name, current_index, total_steps)
 		"""
+		from deepecohab.utils import auxfun
+
 		order = self._resolve_order(targets)
+		if store is None:
+			cfg: dict[str, Any] = auxfun.read_config(config)
+			store = self._store(cfg)
+			if not kwargs.get("save_data", True):
+				store = MemoryStore(fallback=store)
+		kwargs["save_data"] = True
+		report = PipelineReport(mode="fused" if fused else "steps", steps=list(order))
+		self.last_report = report
+		run = _PipelineRun(report, store)
+		context = copy_context()
+		context.run(_ACTIVE_RUN.set, run)
+		start = time.perf_counter()
+		try:
+			if fused:
+				yield from self._run_fused(context, config, order, **kwargs)
+			else:
+				yield from self._run_steps(context, config, order, jobs, **kwargs)
+		finally:
+			report.wall_seconds = time.perf_counter() - start
+			if run.profiled and isinstance(store, DiskStore):
+				profiling.append(store.results_path, run.profiled)
+
+	def _run_steps(
+		self, context: Context, config: dict[str, Any], order: list[str], jobs: int, **kwargs
+	) -> Iterator[tuple[str, int, int]]:
+		"""Run each step through its lifecycle in ``context``, serially or on a thread pool."""
 		total = len(order)
-		for i, name in enumerate(order):
-			self._registry[name](config, **kwargs)
+
+		if jobs <= 1:
+			for i, name in enumerate(order):
+				context.run(self._registry[name], config, **kwargs)
+				yield name, i + 1, total
+			return
+
+		wanted = set(order)
+		waiting: dict[str, set[str]] = {
+			name: {req for req in self._requires[name] if req in wanted} for name in order
+		}
+		running: dict[Future, str] = {}
+		completed = 0
+
+		with ThreadPoolExecutor(max_workers=jobs) as pool:
+			while waiting or running:
+				# Submit in topological order so ties start deterministically.
+				ready = [name for name in order if name in waiting and not waiting[name]]
+				for name in ready:
+					del waiting[name]
+					# A context is entered by one thread at a time; copies share the run.
+					future = pool.submit(context.copy().run, self._registry[name], config, **kwargs)
+					running[future] = name
+
+				finished, _ = wait(running, return_when=FIRST_COMPLETED)
+				for future in sorted(finished, key=lambda f: order.index(running[f])):
+					name = running.pop(future)
+					future.result()
+					for reqs in waiting.values():
+						reqs.discard(name)
+					completed += 1
+					yield name, completed, total
+
+	def _run_fused(
+		self,
+		context: Context,
+		config: dict[str, Any],
+		order: list[str],
+		overwrite: bool = False,
+		save_data: bool = True,
+		**kwargs,
+	) -> Iterator[tuple[str, int, int]]:
+		"""Build every stale step's frame, then materialise and store them together.
+
+		Everything but the yields runs in the run's ``context``.
+		"""
+		from deepecohab.utils import auxfun
+
+		cfg: dict[str, Any] = auxfun.read_config(config)
+		run = context[_ACTIVE_RUN]
+		planned = run.planned
+		fingerprints: dict[str, str] = {}
+		cached: list[str] = []
+
+		def plan() -> None:
+			for name in order:
+				inputs = self._input_fingerprints(cfg, name, fingerprints)
+				fingerprints[name] = self.fingerprint(name, cfg, _inputs=inputs, **kwargs)
+				if not overwrite and _stored_fingerprint(run.store, name) == fingerprints[name]:
+					cached.append(name)
+					continue
+				# cache() marks the frame as one node shared by every plan reading it.
+				planned[name] = self._steps[name](cfg, **kwargs).cache()
+
+		context.run(plan)
+
+		total = len(order)
+		for i, name in enumerate(cached):
 			yield name, i + 1, total
 
+		record = profiling.ProfileRecord(
+			"fused",
+			"fused",
+			config_fingerprint=config_fingerprint(cfg),
+			kwargs={"steps": list(planned), **kwargs},
+		)
+		frames = context.run(pl.collect_all, list(planned.values()))
+		for i, (name, frame) in enumerate(zip(planned, frames, strict=True)):
+			if save_data:
+				context.run(self._write, name, frame, run.store, fingerprints[name])
+			yield name, len(cached) + i + 1, total
+		if planned and save_data:
+			record.stop()
+			context.run(self._profile, record, cfg, run.store, list(planned))
+
+	def compare_modes(
+		self, config: dict[str, Any], targets: list[str] | None = None, **kwargs
+	) -> dict[str, PipelineReport]:
+		"""Run the pipeline step by step and fused, recomputing every step each time.
+
+		Args:
+			config: project config (path or dict).
+			targets: if given, run only these steps and their dependencies.
+			**kwargs: step kwargs, forwarded to both runs.
+
+		Returns:
+			The ``"steps"`` and ``"fused"`` reports; their ``wall_seconds`` and
+			``bytes_read`` differences are what fusing saves.
+		"""
+		kwargs = {**kwargs, "overwrite": True}
+		reports = {}
+		for mode in ("steps", "fused"):
+			for _ in self.run_pipeline(config, targets, fused=mode == "fused", **kwargs):
+				pass
+			reports[mode] = self.last_report
+		return reports
+
 
 class PlotRegistry:
 	"""Registry for dashboard plots.
@@ -181,10 +760,15 @@ class PlotRegistry:
 	because the registry guarantees they are populated before dispatch.
 	"""
 
-	def __init__(self):
+	def __init__(self, max_cached_figures: int = 128):
 		self._registry: dict[str, Callable[..., Any]] = {}
 		self._plot_dependencies: dict[str, list[str]] = {}
 		self._config_fields = {f.name for f in fields(PlotConfig)}
+		# (project fingerprint, plot name, dependency values) -> figure, LRU-evicted
+		# past max_cached_figures entries.
+		self.max_cached_figures = max_cached_figures
+		self._figures: OrderedDict[tuple[str | None, str, str], Any] = OrderedDict()
+		self._cache_lock = threading.Lock()
 
 	def register(self, name: str):
 		"""Decorator to register a new plot type.
@@ -211,12 +795,19 @@ class PlotRegistry:
 		"""Returns the list of PlotConfig attributes used by a specific plot."""
 		return self._plot_dependencies.get(name, [])
 
-	def get_plot(self, name: str, config: PlotConfig):
+	def get_plot(self, name: str, config: PlotConfig, use_cache: bool = True):
 		"""Build the named plot from ``config``; returns ``{}`` if it is unregistered.
 
 		Validates that every field the plot declares as a parameter was populated
 		on ``config`` before dispatching, so a missing selection fails fast with a
 		clear error instead of surfacing deep inside polars/plotly.
+
+		Figures are memoized on (project fingerprint, plot name, values of the
+		plot's dependency fields), so switching back to a previous selection
+		returns the cached figure without re-running its prep. Dependency values
+		are keyed as step kwargs are fingerprinted (``_fingerprint_value``); a
+		plot whose values do not reduce to JSON is rendered without caching.
+		Cached figures are shared between callers and must not be mutated.
 		"""
 		plotter = self._registry.get(name)
 		if not plotter:
@@ -227,7 +818,37 @@ class PlotRegistry:
 			raise ValueError(
 				f"Plot {name!r} requires PlotConfig field(s) {missing}, which are None."
 			)
-		return plotter(**values)
+		if not use_cache:
+			return plotter(**values)
+
+		selection = {dep: value for dep, value in values.items() if dep != "store"}
+		try:
+			encoded = json.dumps(_fingerprint_value(selection), sort_keys=True)
+		except TypeError:
+			return plotter(**values)
+		store = values.get("store")
+		key = (store.fingerprint() if store is not None else None, name, encoded)
+		with self._cache_lock:
+			if key in self._figures:
+				self._figures.move_to_end(key)
+				return self._figures[key]
+
+		figure = plotter(**values)
+		self._cache_figure(key, figure)
+		return figure
+
+	def _cache_figure(self, key: tuple[str | None, str, str], figure: Any) -> None:
+		"""Insert a figure into the LRU, evicting old entries past ``max_cached_figures``."""
+		with self._cache_lock:
+			self._figures[key] = figure
+			self._figures.move_to_end(key)
+			while len(self._figures) > self.max_cached_figures:
+				self._figures.popitem(last=False)
+
+	def clear_cache(self) -> None:
+		"""Drop every memoized figure."""
+		with self._cache_lock:
+			self._figures.clear()
 
 	def list_available(self) -> list[str]:
 		"""Returns the names of all registered plots."""
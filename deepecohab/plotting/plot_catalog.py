@@ -6,13 +6,14 @@ from deepecohab.core.registries import plot_registry
 from deepecohab.plotting import plot_factory
 from deepecohab.utils import auxfun_plots
 from deepecohab.utils.auxfun_plots import PlotConfig
+from deepecohab.utils.project_store import ProjectStore
 
 __all__ = ["PlotConfig", "plot_registry"]
 
 
 @plot_registry.register("cage-preference")
 def cage_preference(
-	store: dict,
+	store: ProjectStore,
 	phase_type: list[str],
 	days_range: list[int],
 	cages: list[str],
@@ -26,7 +27,7 @@ def cage_preference(
 
 @plot_registry.register("cage-preference-evolution")
 def cage_preference_evolution(
-	store: dict,
+	store: ProjectStore,
 	animals: list[str],
 	days_range: list[int],
 	agg_switch: Literal["sum", "mean"],
@@ -40,7 +41,7 @@ def cage_preference_evolution(
 
 @plot_registry.register("metrics-polar-line")
 def polar_metrics(
-	store: dict,
+	store: ProjectStore,
 	days_range: list[int],
 	phase_type: list[str],
 	animal_colors: list[str],
@@ -57,7 +58,7 @@ def polar_metrics(
 
 @plot_registry.register("ranking-line")
 def ranking_over_time(
-	store: dict,
+	store: ProjectStore,
 	days_range: list[int],
 	animals: list[str],
 	animal_colors: list[str],
@@ -76,7 +77,7 @@ def ranking_over_time(
 
 @plot_registry.register("ranking-distribution-line")
 def ranking_distribution(
-	store: dict,
+	store: ProjectStore,
 	days_range: list[int],
 	animals: list[str],
 	animal_colors: list[str],
@@ -93,7 +94,7 @@ def ranking_distribution(
 
 @plot_registry.register("network-dominance")
 def network_dominance(
-	store: dict,
+	store: ProjectStore,
 	animals: list[str],
 	days_range: list[int],
 	animal_colors: list[str],
@@ -110,7 +111,7 @@ def network_dominance(
 
 @plot_registry.register("tube-test-heatmap")
 def tube_test_heatmap(
-	store: dict,
+	store: ProjectStore,
 	animals: list[str],
 	days_range: list[int],
 	phase_type: list[str],
@@ -129,7 +130,7 @@ def tube_test_heatmap(
 
 @plot_registry.register("chasings-heatmap")
 def chasings_heatmap(
-	store: dict,
+	store: ProjectStore,
 	animals: list[str],
 	days_range: list[int],
 	phase_type: list[str],
@@ -148,7 +149,7 @@ def chasings_heatmap(
 
 @plot_registry.register("chasings-line")
 def chasings_line(
-	store: dict,
+	store: ProjectStore,
 	animals: list[str],
 	days_range: list[int],
 	animal_colors: list[str],
@@ -175,7 +176,7 @@ def chasings_line(
 
 @plot_registry.register("activity-bar")
 def activity(
-	store: dict,
+	store: ProjectStore,
 	days_range: list[int],
 	phase_type: list[str],
 	positions: list[str],
@@ -195,7 +196,7 @@ def activity(
 
 @plot_registry.register("activity-line")
 def activity_line(
-	store: dict,
+	store: ProjectStore,
 	animals: list[str],
 	days_range: list[int],
 	animal_colors: list[str],
@@ -223,7 +224,7 @@ def activity_line(
 
 @plot_registry.register("time-per-cage-heatmap")
 def time_per_cage(
-	store: dict,
+	store: ProjectStore,
 	animals: list[str],
 	days_range: list[int],
 	cages: list[str],
@@ -241,7 +242,7 @@ def time_per_cage(
 
 @plot_registry.register("sociability-heatmap")
 def pairwise_sociability(
-	store: dict,
+	store: ProjectStore,
 	animals: list[str],
 	phase_type: list[str],
 	days_range: list[int],
@@ -263,7 +264,7 @@ def pairwise_sociability(
 
 @plot_registry.register("cohort-heatmap")
 def within_cohort_sociability(
-	store: dict,
+	store: ProjectStore,
 	animals: list[str],
 	phase_type: list[str],
 	days_range: list[int],
@@ -283,7 +284,7 @@ def within_cohort_sociability(
 
 @plot_registry.register("time-alone-bar")
 def time_alone(
-	store: dict,
+	store: ProjectStore,
 	phase_type: list[str],
 	days_range: list[int],
 	agg_switch: Literal["sum", "mean"],
@@ -302,7 +303,7 @@ def time_alone(
 
 @plot_registry.register("network-sociability")
 def network_sociability(
-	store: dict,
+	store: ProjectStore,
 	animals: list[str],
 	animal_colors: list[str],
 	days_range: list[int],
@@ -321,7 +322,7 @@ def network_sociability(
 
 @plot_registry.register("social-stability")
 def social_stability(
-	store: dict,
+	store: ProjectStore,
 	animals: list[str],
 	animal_colors: list[str],
 	phase_type: list[str],
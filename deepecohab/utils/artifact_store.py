@@ -0,0 +1,179 @@
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+
+from deepecohab.utils import results_io
+
+
+class ArtifactStore(ABC):
+	"""Where analysis step results are kept between the step producing them and its readers.
+
+	``run_pipeline`` writes every step result to a store together with its parquet
+	metadata (fingerprint, sort order, grid), and steps read their inputs back
+	from it. :class:`DiskStore` is the project's ``results/`` directory;
+	:class:`MemoryStore` hands results straight from producer to consumer. Other
+	stores implement :meth:`get`, :meth:`put` and :meth:`metadata`.
+	"""
+
+	@abstractmethod
+	def get(self, key: str) -> pl.LazyFrame | None:
+		"""The stored result of ``key`` as a LazyFrame, or None if absent."""
+
+	@abstractmethod
+	def put(self, key: str, result: pl.LazyFrame | pl.DataFrame, metadata: dict[str, str]) -> None:
+		"""Store ``result`` under ``key``, replacing what was stored there."""
+
+	@abstractmethod
+	def metadata(self, key: str) -> dict[str, str] | None:
+		"""Metadata stored with ``key``, or None if absent."""
+
+	def size(self, key: str) -> int:
+		"""Bytes read from disk by :meth:`get` of ``key`` (0 when nothing is read)."""
+		return 0
+
+	def rows(self, key: str) -> int | None:
+		"""Rows of the stored result of ``key``, or None if absent."""
+		lf = self.get(key)
+		return None if lf is None else lf.select(pl.len()).collect().item()
+
+
+class DiskStore(ArtifactStore):
+	"""Results as tables under a project's ``results/`` directory.
+
+	Args:
+		results_path: the project's ``results`` directory.
+		partitioned: write tables with a ``day`` column partitioned by day (see
+			:func:`results_io.write_result`).
+		ipc_results: keys written as Arrow IPC files instead of parquet.
+		ipc_compression: compression of those files (``"uncompressed"`` or ``"lz4"``).
+	"""
+
+	def __init__(
+		self,
+		results_path: Path,
+		partitioned: bool = False,
+		ipc_results: list[str] | None = None,
+		ipc_compression: str = "uncompressed",
+	):
+		self.results_path = Path(results_path)
+		self.partitioned = partitioned
+		self.ipc_results = list(ipc_results or [])
+		self.ipc_compression = ipc_compression
+
+	@classmethod
+	def from_config(cls, cfg: dict[str, Any]) -> "DiskStore":
+		"""The ``results/`` directory of a project, stored as its config says."""
+		return cls(
+			Path(cfg.get("project_location", ".")) / "results",
+			partitioned=cfg.get("partition_results", False),
+			ipc_results=cfg.get("ipc_results"),
+			ipc_compression=cfg.get("ipc_compression", "uncompressed"),
+		)
+
+	def get(self, key: str) -> pl.LazyFrame | None:
+		"""Scan the stored table of ``key``, or None if absent."""
+		location = results_io.result_location(self.results_path, key)
+		return results_io.scan_result(location) if location is not None else None
+
+	def put(self, key: str, result: pl.LazyFrame | pl.DataFrame, metadata: dict[str, str]) -> None:
+		"""Write ``result`` to ``results/`` with ``metadata`` stored alongside."""
+		results_io.write_result(
+			result.lazy(),
+			self.results_path,
+			key,
+			partitioned=self.partitioned,
+			metadata=metadata,
+			ipc_compression=self.ipc_compression if key in self.ipc_results else None,
+		)
+
+	def metadata(self, key: str) -> dict[str, str] | None:
+		"""Metadata of the stored table of ``key``, or None if absent or unreadable."""
+		location = results_io.result_location(self.results_path, key)
+		if location is None:
+			return None
+		try:
+			return results_io.result_metadata(location)
+		except (FileNotFoundError, ValueError, pl.exceptions.ComputeError):
+			return None
+
+	def size(self, key: str) -> int:
+		"""Bytes the stored table of ``key`` takes on disk."""
+		location = results_io.result_location(self.results_path, key)
+		return results_io.result_size(location) if location is not None else 0
+
+	def rows(self, key: str) -> int | None:
+		"""Rows of the stored table of ``key``, from its file metadata, or None if absent."""
+		location = results_io.result_location(self.results_path, key)
+		return results_io.result_rows(location) if location is not None else None
+
+
+class MemoryStore(ArtifactStore):
+	"""Results held in memory, so a pipeline run touches no result files.
+
+	Results are collected when stored and handed to readers as ``DataFrame.lazy()``
+	views, so downstream steps never recompute or re-read them. Keys not held are
+	looked up in ``fallback`` (typically the project's :class:`DiskStore`), so
+	``main_df`` and results cached on disk stay readable. Keep one store across
+	runs to reuse its results while only some parameters change.
+
+	Args:
+		fallback: store consulted for keys this one does not hold; it is only
+			read from, never written to.
+	"""
+
+	def __init__(self, fallback: ArtifactStore | None = None):
+		self.fallback = fallback
+		self._results: dict[str, tuple[pl.DataFrame, dict[str, str]]] = {}
+		self._lock = threading.Lock()
+
+	def __contains__(self, key: str) -> bool:
+		return key in self._results
+
+	def __iter__(self) -> Iterator[str]:
+		"""Keys held in memory (not those of ``fallback``)."""
+		return iter(list(self._results))
+
+	def get(self, key: str) -> pl.LazyFrame | None:
+		"""The held result of ``key``, else the fallback's."""
+		with self._lock:
+			held = self._results.get(key)
+		if held is not None:
+			return held[0].lazy()
+		return self.fallback.get(key) if self.fallback is not None else None
+
+	def put(self, key: str, result: pl.LazyFrame | pl.DataFrame, metadata: dict[str, str]) -> None:
+		"""Collect ``result`` and hold it with ``metadata``; the fallback is untouched."""
+		df = result.collect() if isinstance(result, pl.LazyFrame) else result
+		with self._lock:
+			self._results[key] = (df, dict(metadata))
+
+	def metadata(self, key: str) -> dict[str, str] | None:
+		"""Metadata held with ``key``, else the fallback's."""
+		with self._lock:
+			held = self._results.get(key)
+		if held is not None:
+			return dict(held[1])
+		return self.fallback.metadata(key) if self.fallback is not None else None
+
+	def size(self, key: str) -> int:
+		"""0 for held results; the fallback's size for the rest."""
+		if key in self._results or self.fallback is None:
+			return 0
+		return self.fallback.size(key)
+
+	def rows(self, key: str) -> int | None:
+		"""Height of the held result of ``key``, else the fallback's row count."""
+		with self._lock:
+			held = self._results.get(key)
+		if held is not None:
+			return held[0].height
+		return self.fallback.rows(key) if self.fallback is not None else None
+
+	def clear(self) -> None:
+		"""Drop every result held in memory."""
+		with self._lock:
+			self._results.clear()
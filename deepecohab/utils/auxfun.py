@@ -1,4 +1,7 @@
 import datetime as dt
+import re
+import warnings
+from collections.abc import Sequence
 from itertools import combinations, product
 from pathlib import Path
 from typing import (
@@ -10,7 +13,16 @@ from typing import (
 import polars as pl
 import toml
 
+from deepecohab.core import registries
 from deepecohab.core.registries import df_registry
+from deepecohab.utils import phase_calendar, profiling, results_io
+
+# Padded tables are stored per bin width as padded_df@<resolution>; steps declare
+# the resolution they read in their requires, e.g. "padded_df@1m".
+PADDED_KEY = "padded_df"
+DEFAULT_PADDING = "1m"
+# Time columns of the hourly experiment grid, as join keys for densify.
+GRID_TIME_COLUMNS = ("phase", "day", "phase_count", "hour")
 
 
 def read_config(config_path: str | Path | dict[str, Any]) -> dict:
@@ -44,7 +56,9 @@ def load_ecohab_data(
 
 	Args:
 	    config_path: config file path
-	    key: name of the parquet file where data is stored.
+	    key: name of the parquet file where data is stored. Padded tables are
+	        keyed by resolution (``padded_df@1h``); plain ``padded_df`` is the
+	        one-minute table.
 
 	Raises:
 	    KeyError: raised if the key not found in file.
@@ -52,20 +66,31 @@ def load_ecohab_data(
 	Returns:
 	    Desired data structure loaded from the file.
 	"""
-	if key not in df_registry.list_available():
+	if key == PADDED_KEY:
+		key = padding_key()
+	if key.split("@")[0] not in df_registry.list_available():
 		raise KeyError(f"{key} not found. Available keys: {df_registry.list_available()}")
 
 	cfg: dict[str, Any] = read_config(config_path)
-	results_path: Path = Path(cfg["project_location"]) / "results" / f"{key}.parquet"
+	location = results_io.result_location(Path(cfg["project_location"]) / "results", key)
 
-	if not results_path.is_file():
+	if location is None:
 		return None
 
-	return pl.read_parquet(results_path) if return_df else pl.scan_parquet(results_path)
+	registries.record_io(read=results_io.result_size(location))
+	return results_io.read_result(location) if return_df else results_io.scan_result(location)
 
 
 def _get_data(config_path: str | Path | dict[str, Any], key: str) -> pl.LazyFrame:
-	"""Like load_ecohab_data but raises if the file doesn't exist."""
+	"""Like load_ecohab_data but raises if the file doesn't exist.
+
+	Within a pipeline run, data is read from the run's artifact store, and in a
+	fused run the frames of upstream steps not materialised yet are returned
+	(see ``DataFrameRegistry.run_pipeline``).
+	"""
+	lf = registries.run_frame(key)
+	if lf is not None:
+		return lf
 	lf = load_ecohab_data(config_path, key)
 	if lf is None:
 		raise FileNotFoundError(
@@ -86,92 +111,93 @@ def make_project_path(project_location: Path, experiment_name: str) -> Path:
 def get_phase_durations(cfg: dict[str, Any]) -> pl.LazyFrame:
 	"""Compute the duration in seconds of every phase occurrence in the experiment.
 
-	Walks the experiment window in one-minute steps, assigns each minute to its
-	phase and occurrence count, and sums the per-occurrence span. Durations are
-	therefore approximate, accurate to roughly one minute.
+	Occurrences come from :func:`phase_calendar.phase_intervals` and are clipped to
+	the experiment window, so durations are exact, including across DST changes.
 
 	Returns:
 	    A LazyFrame with ``phase``, ``phase_count`` and ``duration_seconds`` columns.
 	"""
+	start, finish = phase_calendar.experiment_window(cfg)
+
 	phase_durations = (
-		pl.LazyFrame(
-			pl.datetime_range(
-				dt.datetime.fromisoformat(cfg["experiment_timeline"]["start_date"]),
-				dt.datetime.fromisoformat(cfg["experiment_timeline"]["finish_date"]),
-				interval="1m",
-				time_zone=cfg["timezone"],
-				closed="left",
-				eager=True,
-			).dt.round("1m")
-		)
-		.rename({"literal": "datetime"})
-		.with_columns(get_phase(cfg))
-		.pipe(get_phase_count)
-		.group_by("phase", "phase_count")
-		.agg(
-			((pl.col("datetime").max() - pl.col("datetime").min()) + pl.duration(minutes=1))
-			.dt.total_seconds()
-			.alias("duration_seconds")
+		phase_calendar.phase_intervals(cfg["phase"], start, finish)
+		.lazy()
+		.select(
+			"phase",
+			"phase_count",
+			(pl.min_horizontal("end", pl.lit(finish)) - pl.max_horizontal("start", pl.lit(start)))
+			.dt.total_seconds(fractional=True)
+			.alias("duration_seconds"),
 		)
+		.filter(pl.col("duration_seconds") > 0)  # an occurrence starting at the finish
 	)
 
 	return phase_durations
 
 
-def get_phase(cfg: dict[str, Any], dt_col: str = "datetime") -> pl.Expr:
-	"""Assign each row to a circadian phase from its local time of day.
+def _calendar_label(cfg: dict[str, Any], dt_col: str, column: str) -> pl.Expr:
+	"""Expression giving one :func:`phase_calendar.label_calendar` column of ``dt_col``."""
+	dtype = {"phase": pl.Enum(list(cfg["phase"])), "day": pl.UInt16, "hour": pl.UInt8}[column]
+	return (
+		pl.col(dt_col)
+		.map_batches(
+			lambda s: (
+				phase_calendar.label_calendar(s.to_frame(dt_col).lazy(), cfg, dt_col)
+				.collect()
+				.get_column(column)
+			),
+			return_dtype=dtype,
+		)
+		.alias(column)
+	)
 
-	cfg["phase"] maps each phase name to the wall-clock time it begins, e.g.
-	    {"light_phase": "07:00:00", "dark_phase": "20:00:00"}
-	means light_phase runs [07:00, 20:00) and dark_phase runs [20:00, 07:00),
-	wrapping around midnight. Phases are assumed to tile the full 24h day.
-	"""
-	phase_names = list(cfg["phase"])
 
-	boundaries = sorted(
-		(dt.time.fromisoformat(start), name) for name, start in cfg["phase"].items()
+def _deprecated(name: str) -> None:
+	warnings.warn(
+		f"auxfun.{name} is deprecated; use phase_calendar.label_calendar instead.",
+		DeprecationWarning,
+		stacklevel=3,
 	)
 
-	dst_shift = pl.col(dt_col).dt.dst_offset() - pl.col(dt_col).first().dt.dst_offset()
-	time_of_day = (pl.col(dt_col) - dst_shift).dt.time()
 
-	expr = pl.lit(boundaries[-1][1])
-	for start, name in boundaries:
-		expr = pl.when(time_of_day >= start).then(pl.lit(name)).otherwise(expr)
+def get_phase(cfg: dict[str, Any], dt_col: str = "datetime") -> pl.Expr:
+	"""Assign each row to a circadian phase from its local time of day.
 
-	return expr.cast(pl.Enum(phase_names)).alias("phase")
+	Deprecated: a wrapper over :func:`phase_calendar.label_calendar`, which labels
+	phase, day, hour and phase_count together.
+	"""
+	_deprecated("get_phase")
+	return _calendar_label(cfg, dt_col, "phase")
 
 
 def get_phase_count(lf: pl.LazyFrame) -> pl.LazyFrame:
 	"""Number each phase's successive occurrences in a ``phase_count`` column.
 
-	Consecutive rows sharing a ``phase`` form one run (via run-length ids); the runs
-	of a given phase are then densely ranked so the first dark phase is 1, the second
-	2, and so on. Requires a ``phase`` column and the frame to be in chronological order.
+	Deprecated: :func:`phase_calendar.label_calendar` numbers phases from the
+	experiment calendar. Consecutive rows sharing a ``phase`` form one run; the
+	runs of a given phase are densely ranked, so the first dark phase is 1, the
+	second 2, and so on. Requires the frame to be in chronological order.
 	"""
-	lf = (
+	_deprecated("get_phase_count")
+	return (
 		lf.with_columns(pl.col("phase").rle_id().alias("run_id"))
 		.with_columns(
 			pl.col("run_id").rank("dense").over("phase").cast(pl.UInt16).alias("phase_count")
 		)
 		.drop("run_id")
 	)
-	return lf
 
 
 def get_day(dt_col: str = "datetime") -> pl.Expr:
-	"""Auxfun for getting the day."""
-	return (
-		((pl.col(dt_col).dt.date() - pl.col(dt_col).dt.date().min()).dt.total_days())
-		.add(1)
-		.cast(pl.UInt16)
-		.alias("day")
-	)
+	"""Day of each row, counted from the earliest date (deprecated, see :func:`get_phase`)."""
+	_deprecated("get_day")
+	return _calendar_label({"phase": {"day": "00:00:00"}}, dt_col, "day")
 
 
 def get_hour(dt_col: str = "datetime") -> pl.Expr:
-	"""Expression extracting the hour of day (0-23) as ``hour``."""
-	return pl.col(dt_col).dt.hour().cast(pl.UInt8).alias("hour")
+	"""Hour of day (0-23) as ``hour`` (deprecated, see :func:`get_phase`)."""
+	_deprecated("get_hour")
+	return _calendar_label({"phase": {"day": "00:00:00"}}, dt_col, "hour")
 
 
 def get_positions(
@@ -202,21 +228,45 @@ def get_positions(
 			raise ValueError(f"Unknown position kind: {kind!r}")
 
 
+def get_position_enum(cfg: dict[str, Any]) -> pl.Enum:
+	"""Project-level Enum of every position a table can hold.
+
+	Covers directional tunnels and cages (from ``antenna_combinations``), their
+	undirected tunnels (from ``tunnels``) and ``undefined``, in sorted order, so
+	``main_df``, the analysis tables and the reference grids share one physical
+	encoding and position joins compare integer codes.
+	"""
+	cfg = read_config(cfg)
+	positions = (
+		set(cfg.get("antenna_combinations", {}).values())
+		| set(cfg.get("tunnels", {}).values())
+		| set(cfg.get("positions", []))
+		| {"undefined"}
+	)
+	return pl.Enum(sorted(positions))
+
+
 def set_animal_ids(
 	config_path: str | Path,
 	lf: pl.LazyFrame,
 	sanitize_animal_ids: bool,
 	min_antenna_crossings: int,
 	animal_ids: list | None = None,
+	animal_detections: pl.DataFrame | None = None,
 ) -> pl.LazyFrame:
-	"""Auxfun to infer animal ids from data, optionally removing ghost tags (random radio noise reads)."""
+	"""Auxfun to infer animal ids from data, optionally removing ghost tags (random radio noise reads).
+
+	``animal_detections`` (``animal_id``, ``len``) can pass counts already gathered
+	by the caller; otherwise they are counted from ``lf``.
+	"""
 	cfg: dict[str, Any] = read_config(config_path)
 	dropped_ids: list[str] = []
 
 	if isinstance(animal_ids, list):
 		lf: pl.LazyFrame = lf.filter(pl.col("animal_id").is_in(animal_ids))
 	else:
-		animal_detections: pl.DataFrame = lf.group_by("animal_id").len().collect()
+		if animal_detections is None:
+			animal_detections = lf.group_by("animal_id").len().collect()
 
 		if sanitize_animal_ids:
 			is_ghost: pl.Expr = pl.col("len") < min_antenna_crossings
@@ -270,10 +320,16 @@ def update_repeat_antenna_position(lf: pl.LazyFrame) -> pl.LazyFrame:
 	).with_columns(
 		pl.cum_count("position").over(["animal_id", "run_id"]).alias("consecutive_antenna_readout")
 	)
+	# Positions are kept in their Enum when they have one; antennas whose tunnel is
+	# not part of that layout keep their position.
+	dtype = lf.collect_schema()["position"]
+	if not isinstance(dtype, pl.Enum):
+		dtype = pl.Categorical
+	repeat_position = pl.col("antenna").cast(pl.Utf8).replace(tunnel_dict)
 	lf = lf.with_columns(
 		pl.when(pl.col("consecutive_antenna_readout").mod(2) == 0)
-		.then(pl.col("antenna").cast(pl.Utf8).replace(tunnel_dict).cast(pl.Categorical))
-		.otherwise(pl.col("position"))
+		.then(repeat_position.cast(dtype, strict=False).fill_null(pl.col("position")))
+		.otherwise(pl.col("position").cast(dtype))
 		.alias("position")
 	)
 
@@ -289,16 +345,10 @@ def append_start_end_to_config(
 	    Config with updated start and end datetimes
 	"""
 	cfg: dict[str, Any] = read_config(config_path)
-	bounds = (
-		lf.sort("datetime")
-		.select(
-			[
-				pl.col("datetime").first().alias("start_time"),
-				pl.col("datetime").last().alias("end_time"),
-			]
-		)
-		.collect()
-	)
+	bounds = lf.select(
+		pl.col("datetime").min().alias("start_time"),
+		pl.col("datetime").max().alias("end_time"),
+	).collect()
 
 	start_time = str(bounds.get_column("start_time")[0])
 	end_time = str(bounds.get_column("end_time")[0])
@@ -350,47 +400,140 @@ def add_days_to_config(config_path: str | Path, lf: pl.LazyFrame) -> None:
 	"""Auxfun to add days range to config for reading convenience."""
 	cfg: dict[str, Any] = read_config(config_path)
 
-	days: pl.Series = lf.collect().get_column("day").unique(maintain_order=True)
+	first_day, last_day = (
+		lf.select(pl.min("day").alias("first"), pl.max("day").alias("last")).collect().row(0)
+	)
+
+	with open(config_path, "w") as config:
+		cfg["days_range"] = [first_day, last_day]
+		toml.dump(cfg, config)
+
+
+def extend_experiment_in_config(
+	config_path: str | Path, last_day: int, finish_date: str | None = None
+) -> None:
+	"""Auxfun to widen the stored day range (and optionally the finish date) after an append."""
+	cfg: dict[str, Any] = read_config(config_path)
+
+	first_day, stored_last_day = cfg.get("days_range", [1, last_day])
+	cfg["days_range"] = [first_day, max(stored_last_day, last_day)]
+	if finish_date is not None:
+		cfg["experiment_timeline"]["finish_date"] = finish_date
 
 	with open(config_path, "w") as config:
-		cfg["days_range"] = [days.min(), days.max()]
 		toml.dump(cfg, config)
 
 
 def remove_tunnel_directionality(lf: pl.LazyFrame, cfg: dict[str, Any]) -> pl.LazyFrame:
-	"""Auxfun to map directional tunnels in a LazyFrame to undirected ones."""
-	return lf.with_columns(
-		pl.col("position").cast(pl.Utf8).replace(cfg["tunnels"]).cast(pl.Categorical)
-	)
+	"""Auxfun to map directional tunnels in a LazyFrame to undirected ones.
+
+	Enum positions (see :func:`get_position_enum`) are remapped by physical code
+	through a table built from the Enum's categories, so no strings are touched;
+	undirected names missing from the Enum are appended to it. Other position
+	dtypes go through a string replace and come back as Categorical.
+	"""
+	dtype = lf.collect_schema()["position"]
+	if not isinstance(dtype, pl.Enum):
+		return lf.with_columns(
+			pl.col("position").cast(pl.Utf8).replace(cfg["tunnels"]).cast(pl.Categorical)
+		)
+
+	categories: list[str] = dtype.categories.to_list()
+	undirected = [cfg["tunnels"].get(position, position) for position in categories]
+	enum = pl.Enum(categories + sorted(set(undirected) - set(categories)))
+	table = pl.Series("position", undirected, dtype=enum)
+
+	return lf.with_columns(pl.lit(table).gather(pl.col("position").to_physical()))
+
+
+def padding_key(resolution: str = DEFAULT_PADDING) -> str:
+	"""Results key of the padded table at ``resolution`` (e.g. ``padded_df@1m``)."""
+	return f"{PADDED_KEY}@{resolution}"
+
+
+def padding_seconds(resolution: str, cfg: dict[str, Any] | None = None) -> int:
+	"""Length in seconds of a padding resolution such as ``"10s"``, ``"1m"`` or ``"1h"``.
+
+	Pieces are labelled by their start, so every calendar boundary has to fall on a
+	bin mark: the resolution must divide an hour and, given ``cfg``, the phase starts.
+
+	Raises:
+		ValueError: if the resolution cannot be parsed or does not align.
+	"""
+	match = re.fullmatch(r"(\d+)([smh])", resolution)
+	if match is None:
+		raise ValueError(
+			f"Unknown padding resolution {resolution!r}; use e.g. '10s', '1m' or '1h'."
+		)
+	seconds = int(match[1]) * {"s": 1, "m": 60, "h": 3600}[match[2]]
+	if seconds == 0 or 3600 % seconds:
+		raise ValueError(f"Padding resolution {resolution!r} has to divide one hour.")
+
+	for phase, start in (cfg or {}).get("phase", {}).items():
+		start_time = dt.time.fromisoformat(start)
+		if (start_time.minute * 60 + start_time.second) % seconds:
+			raise ValueError(
+				f"Padding resolution {resolution!r} does not align with the start of "
+				f"{phase} ({start}); pick a finer one."
+			)
+	return seconds
+
+
+def padding_resolutions() -> list[str]:
+	"""Padding resolutions read by the registered analysis steps, finest first."""
+	prefix = f"{PADDED_KEY}@"
+	resolutions = {
+		key.removeprefix(prefix) for key in df_registry.inputs() if key.startswith(prefix)
+	}
+	return sorted(resolutions, key=padding_seconds)
+
+
+def stored_resolutions(results_path: Path) -> list[str]:
+	"""Resolutions of the padded tables stored under ``results_path``."""
+	prefix = f"{PADDED_KEY}@"
+	return [
+		key.removeprefix(prefix)
+		for key in results_io.list_results(results_path)
+		if key.startswith(prefix)
+	]
 
 
-def _get_minute_padding(lf: pl.LazyFrame, cfg: dict[str, Any]):
-	"""Split rows that straddle minute boundaries into per-minute pieces.
+def _get_padding(
+	lf: pl.LazyFrame,
+	cfg: dict[str, Any],
+	resolution: str = DEFAULT_PADDING,
+	finish: dt.datetime | None = None,
+) -> pl.LazyFrame:
+	"""Split rows that straddle bin boundaries into per-bin pieces.
 
 	Each input row describes an interval ending at ``datetime`` that lasted
 	``time_spent`` seconds (with ``time_under`` an associated duration). A single
-	interval may span several wall-clock minutes; this splits it at every minute
-	boundary so that no resulting piece crosses one, which lets time be attributed
-	to the correct minute/phase/hour bin downstream.
+	interval may span several wall-clock bins; this splits it at every bin
+	boundary (every minute by default) so that no resulting piece crosses one,
+	which lets time be attributed to the correct bin/phase/hour downstream.
 
 	``time_spent`` is recomputed as each piece's own length, and ``time_under`` is
 	redistributed across pieces in proportion to their duration (the parent total
 	is preserved up to rounding). Pieces are timestamped by their start: ``phase``,
-	``day`` and ``hour`` are derived from the piece start, while ``datetime`` is set
-	to the piece end. Rows that were actually split are flagged ``interpolated``.
+	``day``, ``hour`` and ``phase_count`` are derived from the piece start, while
+	``datetime`` is set to the piece end. Rows that were actually split are flagged
+	``interpolated``.
 
 	Args:
 		lf: Frame with at least ``datetime``, ``time_spent`` (seconds) and
 			``time_under`` (duration) columns.
-		cfg: Config mapping used by ``get_phase`` for phase assignment.
+		cfg: Config mapping used by :func:`phase_calendar.label_calendar`.
+		resolution: Bin width, see :func:`padding_seconds`.
+		finish: Latest piece start to label when it is past the recorded
+			experiment finish (rows appended to a running experiment).
 
 	Returns:
 		Frame with the same schema plus ``interpolated`` and a ``row_id`` index
-		identifying the original (pre-split) row; one row per minute-aligned piece.
+		identifying the original (pre-split) row; one row per bin-aligned piece.
 	"""
-	minute: pl.Expr = pl.duration(minutes=1)
+	step: pl.Expr = pl.duration(seconds=padding_seconds(resolution, cfg))
 
-	minute_padded: pl.LazyFrame = (
+	padded: pl.LazyFrame = (
 		lf.with_row_index("row_id")
 		.with_columns(
 			pl.col("datetime")
@@ -401,9 +544,9 @@ def _get_minute_padding(lf: pl.LazyFrame, cfg: dict[str, Any]):
 		)
 		.with_columns(
 			pl.datetime_ranges(
-				pl.col("__start").dt.truncate("1m") + minute,
+				pl.col("__start").dt.truncate(resolution) + step,
 				pl.col("datetime"),
-				interval="1m",
+				interval=resolution,
 				closed="left",
 			).alias("__marks")
 		)
@@ -434,49 +577,90 @@ def _get_minute_padding(lf: pl.LazyFrame, cfg: dict[str, Any]):
 			.alias("time_under"),
 			(pl.len().over("row_id") > 1).alias("interpolated"),
 		)
-		.with_columns(
-			get_phase(cfg, "__pstart"),
-			get_day("__pstart"),
-			get_hour("__pstart"),
-			pl.col("__pend").alias("datetime"),
-		)
+		.pipe(phase_calendar.label_calendar, cfg, "__pstart", finish)
+		.with_columns(pl.col("__pend").alias("datetime"))
 		.select(
 			pl.exclude("^__.*$")
 		)  # row_id preserved to keep information on original rows unique('row_id', keep='first')
 	)
 
-	return minute_padded
+	return padded
 
 
-@df_registry.register("padded_df")
+@df_registry.register(PADDED_KEY)
 def padded_df(
-	lf: pl.LazyFrame, cfg: dict[str, Any], save_data: bool = True, overwrite: bool = False
+	lf: pl.LazyFrame,
+	cfg: dict[str, Any],
+	save_data: bool = True,
+	overwrite: bool = False,
+	resolution: str = DEFAULT_PADDING,
 ) -> pl.LazyFrame:
-	"""Split each visit interval at wall-clock minute boundaries.
+	"""Split each visit interval at wall-clock bin boundaries.
 
 	Each row is the half-open interval [datetime - time_spent, datetime).
-	Intervals crossing one or more minute marks are cut into per-minute pieces.
+	Intervals crossing one or more bin marks are cut into per-bin pieces.
 	Pieces originating from a cut are flagged interpolated=True; untouched
-	rows are interpolated=False.
+	rows are interpolated=False. Each resolution is stored under its own key,
+	``padded_df@<resolution>``.
 	"""
 	cfg: dict[str, Any] = read_config(cfg)
-	key = "padded_df"
+	key = padding_key(resolution)
 
-	minute_padded: pl.LazyFrame | None = None if overwrite else load_ecohab_data(cfg, key)
+	padded: pl.LazyFrame | None = None if overwrite else load_ecohab_data(cfg, key)
 
-	if isinstance(minute_padded, pl.LazyFrame):
-		return minute_padded
+	if isinstance(padded, pl.LazyFrame):
+		return padded
 
 	results_path = Path(cfg["project_location"]) / "results"
 
-	minute_padded = _get_minute_padding(lf, cfg)
+	record = profiling.ProfileRecord(key, "structure", kwargs={"resolution": resolution})
+	padded = _get_padding(lf, cfg, resolution)
 
 	if save_data:
-		minute_padded.sink_parquet(
-			results_path / f"{key}.parquet", compression="lz4", engine="streaming"
+		results_io.write_result(
+			padded,
+			results_path,
+			key,
+			partitioned=cfg.get("partition_results", False),
+			ipc_compression=results_io.ipc_compression(cfg, key),
 		)
+		log_build(record, cfg, key, rows_in=lf.select(pl.len()).collect().item())
+
+	return padded
 
-	return minute_padded
+
+def log_build(
+	record: profiling.ProfileRecord,
+	config_path: str | Path | dict[str, Any],
+	key: str,
+	rows_in: int | None = None,
+) -> None:
+	"""Stop the record of a data-structure build and add it to the profiling ledger.
+
+	Args:
+	    record: record started when the build started.
+	    config_path: project config (path or dict).
+	    key: stored table the build wrote, measured for the output rows and size.
+	    rows_in: rows the build read, if known.
+	"""
+	record.stop()
+	cfg: dict[str, Any] = read_config(config_path)
+	results_path = Path(cfg["project_location"]) / "results"
+	location = results_io.result_location(results_path, key)
+	record.config_fingerprint = registries.config_fingerprint(cfg)
+	record.rows_in = rows_in
+	if location is not None:
+		record.rows_out = results_io.result_rows(location)
+		record.bytes_out = results_io.result_size(location)
+	profiling.log(results_path, record)
+
+
+def get_padded(cfg: dict[str, Any], resolution: str = DEFAULT_PADDING) -> pl.LazyFrame:
+	"""Stored ``padded_df@<resolution>``, or ``main_df`` padded in memory if it is absent."""
+	padded = load_ecohab_data(cfg, padding_key(resolution))
+	if padded is None:
+		padded = _get_padding(_get_data(cfg, "main_df"), cfg, resolution)
+	return padded
 
 
 def build_time_grid(cfg: dict[str, Any]) -> pl.LazyFrame:
@@ -486,7 +670,7 @@ def build_time_grid(cfg: dict[str, Any]) -> pl.LazyFrame:
 	dates (both inclusive), with both bounds floored to the hour so the grid is
 	independent of the sub-hour offsets of the raw timestamps. Each bin is
 	annotated with its day, circadian phase, hour of day and phase occurrence
-	count (see ``get_day``, ``get_phase``, ``get_hour`` and ``get_phase_count``).
+	count from the experiment calendar (see :func:`phase_calendar.label_calendar`).
 
 	This is the temporal half of the dense reference grid that observed data is
 	reindexed onto, so bins with no activity are still represented (e.g. as zero
@@ -521,13 +705,8 @@ def build_time_grid(cfg: dict[str, Any]) -> pl.LazyFrame:
 				time_zone=cfg["timezone"],
 			).alias("__datetime")
 		)
-		.with_columns(
-			get_day(dt_col="__datetime"),
-			get_phase(cfg, dt_col="__datetime"),
-			get_hour(dt_col="__datetime"),
-		)
-		.pipe(get_phase_count)
-		.drop("__datetime")
+		.pipe(phase_calendar.label_calendar, cfg, "__datetime")
+		.select("day", "phase", "hour", "phase_count")
 	)
 
 
@@ -579,7 +758,8 @@ def build_animal_grid(
 
 	if positions is not None:
 		rows = [(*row, pos) for row, pos in product(rows, positions)]
-		schema["position"] = pl.Categorical
+		categories = set(get_position_enum(cfg).categories) | set(positions)
+		schema["position"] = pl.Enum(sorted(categories))
 
 	return pl.LazyFrame(rows, schema=schema, orient="row")
 
@@ -603,43 +783,70 @@ def build_experiment_grid(cfg: dict[str, Any]) -> pl.LazyFrame:
 	)
 
 
-def reindex_onto_grid(
+def densify(
 	data: pl.LazyFrame,
 	cfg: dict[str, Any],
-	columns: str | tuple[str, str],
+	columns: str | tuple[str, str] | list[str],
 	ordered: bool = True,
-	positions: list[str] | None = None,
+	positions: list[str] | str | None = None,
+	time_columns: Sequence[str] = GRID_TIME_COLUMNS,
+	days_range: Sequence[int] | None = None,
+	phase_type: Sequence[str] | None = None,
 ) -> pl.LazyFrame:
-	"""Reindex an observed table onto the dense time x animal(x position) grid.
+	"""Reindex a sparse table onto its dense time x animal(x position) grid.
+
+	Pair and tunnel tables (``chasings_df``, ``tube_test_df``, ``pairwise_meetings``)
+	are stored with observed cells only; the grid they belong to is recorded with
+	the step (``df_registry.grid``) and in the parquet metadata. This cross-joins
+	:func:`build_time_grid` with :func:`build_animal_grid` to rebuild it and
+	left-joins ``data`` onto it, filling cells with no observed value with ``0``.
+	Apply it lazily, after filtering or aggregating, so only the cells a caller
+	needs are materialised:
 
-	Cross-joins :func:`build_time_grid` with :func:`build_animal_grid` to obtain
-	the dense reference grid, then left-joins ``data`` onto it so every grid cell
-	is present, filling cells with no observed value with ``0``. The join keys are
-	derived from the grid: the time columns (``phase``, ``day``, ``phase_count``,
-	``hour``), the ``position`` column when ``positions`` is given, and the animal
-	column(s) named in ``columns``.
+	``densify(lf, cfg, **df_registry.grid("chasings_df"), days_range=[2, 4])``
 
 	Args:
-		data: Observed table to reindex; must contain the derived join columns.
+		data: Sparse table; must contain the time, ``position`` (when ``positions``
+			is given) and animal columns of the grid.
 		cfg: Path or mapping resolved by ``read_config``.
 		columns: Animal column(s) for :func:`build_animal_grid` (a single name or
 			a pair).
 		ordered: For pair grids, whether to enumerate ordered pairs. See
 			:func:`build_animal_grid`.
-		positions: When given, the grid is crossed with these positions and
-			``position`` becomes a join key. When ``None`` no position column is used.
+		positions: Positions the grid is crossed with, or a :func:`get_positions`
+			kind naming them. When ``None`` no position column is used.
+		time_columns: Time columns of the grid; a subset such as
+			``["phase", "day", "phase_count"]`` densifies a table already
+			aggregated over hours.
+		days_range: inclusive ``[first, last]`` day range to restrict the grid to,
+			matching a day filter applied to ``data``.
+		phase_type: phases to restrict the grid to, matching a phase filter.
 
 	Returns:
 		``data`` reindexed onto the dense grid, with absent cells filled with ``0``.
 	"""
 	cfg = read_config(cfg)
-	full_grid = build_time_grid(cfg).join(
+	if isinstance(positions, str):
+		positions = get_positions(cfg, positions)
+	if isinstance(columns, list):
+		columns = columns[0] if len(columns) == 1 else tuple(columns)
+
+	time_grid = build_time_grid(cfg)
+	if days_range is not None:
+		time_grid = time_grid.filter(pl.col("day").is_between(days_range[0], days_range[-1]))
+	if phase_type is not None:
+		time_grid = time_grid.filter(pl.col("phase").is_in(list(phase_type)))
+	time_columns = list(time_columns)
+	if set(time_columns) != set(GRID_TIME_COLUMNS):
+		time_grid = time_grid.select(time_columns).unique()
+
+	full_grid = time_grid.join(
 		build_animal_grid(cfg, columns, ordered=ordered, positions=positions),
 		how="cross",
 	)
 
 	animal_cols = [columns] if isinstance(columns, str) else list(columns)
-	on = ["phase", "day", "phase_count", "hour"]
+	on = list(time_columns)
 	if positions is not None:
 		on.append("position")
 	on += animal_cols
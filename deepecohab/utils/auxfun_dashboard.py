@@ -11,6 +11,7 @@ import polars as pl
 from dash import dcc, exceptions, html
 
 from deepecohab.core.registries import df_registry, plot_registry
+from deepecohab.utils.project_store import ProjectStore
 
 COMMON_CFG = {"displayModeBar": False}
 
@@ -563,11 +564,20 @@ def build_filter_expr(
 	return exprs
 
 
+def _filtered_table(
+	store: ProjectStore, name: str, days_range: list[int], phase_types: list[str]
+) -> pl.DataFrame:
+	"""Read one table for download, filtered to the selected days and phases."""
+	lf = store[name]
+	expr = build_filter_expr(lf.collect_schema().names(), days_range, phase_types)
+	return (lf.filter(expr) if expr is not None else lf).collect()
+
+
 def download_dataframes(
 	selected_dfs: list[str],
 	phase_type: str,
 	days_range: list[int],
-	store: dict,
+	store: ProjectStore,
 ) -> dict[str, Any | None]:
 	"""Downloads the selected DataFrame/s via the browser."""
 	if not selected_dfs:
@@ -578,9 +588,7 @@ def download_dataframes(
 	if len(selected_dfs) == 1:
 		name = selected_dfs[0]
 		if name in store:
-			df = store[name]
-			expr = build_filter_expr(df.schema, days_range, phase_types)
-			df = df.filter(expr) if expr is not None else df
+			df = _filtered_table(store, name, days_range, phase_types)
 			return dcc.send_string(df.write_csv, f"{name}.csv")
 		raise exceptions.PreventUpdate
 
@@ -588,9 +596,7 @@ def download_dataframes(
 	with zipfile.ZipFile(zip_buffer, "w") as zf:
 		for name in selected_dfs:
 			if name in store:
-				df = store[name]
-				expr = build_filter_expr(df.schema, days_range, phase_types)
-				df = df.filter(expr) if expr is not None else df
+				df = _filtered_table(store, name, days_range, phase_types)
 				csv_bytes = df.write_csv().encode("utf-8")
 				zf.writestr(f"{name}.csv", csv_bytes)
 
@@ -10,6 +10,8 @@ import plotly.graph_objects as go
 import plotly.io as pio
 import polars as pl
 
+from deepecohab.utils.project_store import ProjectStore
+
 
 @dataclass(frozen=True)
 class PlotConfig:
@@ -20,7 +22,7 @@ class PlotConfig:
 	analysis.
 	"""
 
-	store: dict | None = None
+	store: ProjectStore | None = None
 	days_range: list[int] | None = None
 	phase_type: list[str] | None = None
 	agg_switch: Literal["sum", "mean"] | None = None
@@ -161,11 +163,53 @@ def create_node_trace(
 	return node_trace
 
 
-def prep_ranking_over_time(store: dict[str, pl.DataFrame], days_range: list[int]) -> pl.DataFrame:
+def _ranking_trajectory(store: ProjectStore) -> pl.LazyFrame:
+	"""Dense (one row per animal per match) view of the sparse stored ranking."""
+	from deepecohab.analysis.antenna_analysis import densify_ranking
+
+	return densify_ranking(store.slice("ranking"))
+
+
+def _range_totals(
+	store: ProjectStore,
+	key: str,
+	by: list[str],
+	values: list[str],
+	days_range: list[int],
+	phase_type: list[str] | None = None,
+) -> pl.LazyFrame:
+	"""Totals of ``values`` per ``by`` over ``days_range`` from a rollup's prefix sums.
+
+	Reads only the last day of the range and the day before it, so the cost
+	depends on the number of animals (pairs, positions), not on the range length.
+	"""
+	cumulative = [f"{v}_cum" for v in values]
+
+	def at_day(day: int) -> pl.LazyFrame:
+		return (
+			store.slice(key, [*by, *cumulative], days_range=[day, day], phase_type=phase_type)
+			.lazy()
+			.group_by(by)
+			.agg(pl.sum(cumulative))
+		)
+
+	return (
+		at_day(days_range[1])
+		.join(at_day(days_range[0] - 1), on=by, how="left", suffix="_before")
+		.select(
+			*by,
+			*[
+				(pl.col(c) - pl.col(f"{c}_before").fill_null(0)).alias(v)
+				for c, v in zip(cumulative, values, strict=True)
+			],
+		)
+	)
+
+
+def prep_ranking_over_time(store: ProjectStore, days_range: list[int]) -> pl.DataFrame:
 	"""Aggregate animal ordinal rankings by day, hour, and datetime."""
 	df = (
-		store["ranking"]
-		.lazy()
+		_ranking_trajectory(store)
 		.filter(pl.col("day").is_between(days_range[0], days_range[1]))
 		.sort("datetime")
 		.group_by("day", "hour", "animal_id", "datetime", maintain_order=True)
@@ -175,13 +219,10 @@ def prep_ranking_over_time(store: dict[str, pl.DataFrame], days_range: list[int]
 	return df
 
 
-def prep_ranking_day_stability(
-	store: dict[str, pl.DataFrame], days_range: list[int]
-) -> pl.DataFrame:
+def prep_ranking_day_stability(store: ProjectStore, days_range: list[int]) -> pl.DataFrame:
 	"""Prepare daily dominance ranking using the last hour of each day."""
-	ranking = store["ranking"]
 	daily_rank = (
-		ranking.lazy()
+		_ranking_trajectory(store)
 		.filter(pl.col("day").is_between(days_range[0], days_range[1]))
 		.group_by(["day", "animal_id"])
 		.agg(pl.col("ordinal").last())
@@ -195,7 +236,7 @@ def prep_ranking_day_stability(
 
 
 def prep_polar_df(
-	store: dict[str, pl.DataFrame],
+	store: ProjectStore,
 	days_range: list[int],
 	phase_type: list[str],
 ) -> pl.DataFrame:
@@ -203,12 +244,13 @@ def prep_polar_df(
 	n_days = 1 if days_range[0] == days_range[1] else len(range(*days_range)) + 1
 
 	df = (
-		store["feature_df"]
-		.lazy()
-		.filter(
-			pl.col("phase").is_in(phase_type),
-			pl.col("day").is_between(days_range[0], days_range[1]),
+		store.slice(
+			"feature_df",
+			["animal_id", "metric", "day", "z-score"],
+			days_range=days_range,
+			phase_type=phase_type,
 		)
+		.lazy()
 		.group_by("animal_id", "metric", "day")
 		.agg(pl.mean("z-score"))
 		.group_by("animal_id", "metric")
@@ -231,7 +273,7 @@ def prep_polar_df(
 
 
 def prep_ranking_distribution(
-	store: dict[str, pl.DataFrame],
+	store: ProjectStore,
 	days_range: list[int],
 ) -> pl.DataFrame:
 	"""Calculate normal probability density functions for animal rankings on the latest available day."""
@@ -244,8 +286,7 @@ def prep_ranking_distribution(
 	)
 
 	df = (
-		store["ranking"]
-		.lazy()
+		_ranking_trajectory(store)
 		.filter(diff == diff.min())
 		.group_by("animal_id")
 		.agg(pl.last("mu"), pl.last("sigma"))
@@ -259,7 +300,7 @@ def prep_ranking_distribution(
 
 
 def prep_network_dominance(
-	store: dict[str, pl.DataFrame],
+	store: ProjectStore,
 	animals: list[str],
 	days_range: list[int],
 ) -> tuple[pl.DataFrame, pl.DataFrame]:
@@ -273,11 +314,7 @@ def prep_network_dominance(
 	)
 
 	connections = (
-		store["chasings_df"]
-		.lazy()
-		.filter(pl.col("day").is_between(days_range[0], days_range[1]))
-		.group_by("chased", "chaser")
-		.agg(pl.sum("chasings"))
+		_range_totals(store, "chasings_rollup", ["chased", "chaser"], ["chasings"], days_range)
 		.join(
 			join_df,
 			left_on=["chaser", "chased"],
@@ -291,17 +328,17 @@ def prep_network_dominance(
 	diff = (pl.col("day") - days_range[-1]).abs()
 
 	nodes = (
-		store["ranking"]
+		_ranking_trajectory(store)
 		.filter(diff == diff.min())  # Get last valid day with update to rank
 		.group_by("animal_id")
 		.agg(pl.last("ordinal"))
-	)
+	).collect(engine="in-memory")
 
 	return connections, nodes
 
 
 def prep_chasings_heatmap(
-	store: dict[str, pl.DataFrame],
+	store: ProjectStore,
 	animals: list[str],
 	days_range: list[int],
 	phase_type: list[str],
@@ -318,23 +355,36 @@ def prep_chasings_heatmap(
 
 	match agg_switch:
 		case "sum":
-			agg_func = pl.when(pl.len() > 0).then(pl.sum("chasings")).alias("sum")
+			pairs = (
+				_range_totals(
+					store,
+					"chasings_rollup",
+					["chaser", "chased"],
+					["chasings", "hours"],
+					days_range,
+					phase_type,
+				)
+				.filter(pl.col("hours") > 0)
+				.select("chaser", "chased", pl.col("chasings").alias("sum"))
+			)
 		case "mean":
-			agg_func = pl.mean("chasings").round(2).alias("mean")
+			pairs = (
+				store.slice(
+					"chasings_rollup",
+					["day", "chaser", "chased", "chasings", "hours"],
+					days_range=days_range,
+					phase_type=phase_type,
+				)
+				.lazy()
+				.filter(pl.col("hours") > 0)
+				.group_by("day", "chaser", "chased")
+				.agg(pl.sum("chasings"))
+				.group_by("chaser", "chased")
+				.agg(pl.mean("chasings").round(2).alias("mean"))
+			)
 
 	img = (
-		store["chasings_df"]
-		.lazy()
-		.sort("chased", "chaser")
-		.filter(
-			pl.col("phase").is_in(phase_type),
-			pl.col("day").is_between(days_range[0], days_range[1]),
-		)
-		.group_by("day", "chaser", "chased")
-		.agg(pl.sum("chasings"))
-		.group_by("chaser", "chased", maintain_order=True)
-		.agg(agg_func)
-		.join(join_df, on=["chaser", "chased"], how="right")
+		pairs.join(join_df, on=["chaser", "chased"], how="right")
 		.collect(engine="in-memory")
 		.pivot(
 			on="chaser",
@@ -349,7 +399,7 @@ def prep_chasings_heatmap(
 
 
 def prep_chasings_line(
-	store: dict[str, pl.DataFrame],
+	store: ProjectStore,
 	animals: list[str],
 	days_range: list[int],
 ) -> pl.DataFrame:
@@ -374,9 +424,10 @@ def prep_chasings_line(
 	)
 
 	df = (
-		store["chasings_df"]
+		store.slice(
+			"chasings_df", ["chaser", "chased", "hour", "day", "chasings"], days_range=days_range
+		)
 		.lazy()
-		.filter(pl.col("day").is_between(days_range[0], days_range[1]))
 		.join(
 			join_df,
 			on=["chaser", "chased", "hour", "day"],
@@ -402,19 +453,21 @@ def prep_chasings_line(
 
 
 def prep_activity(
-	store: dict[str, pl.DataFrame],
+	store: ProjectStore,
 	days_range: list[int],
 	phase_type: list[str],
 ) -> pl.DataFrame:
 	"""Aggregate visits and time spent per position, animal, and day."""
 	df = (
-		store["activity_df"]
+		store.slice(
+			"activity_rollup",
+			["day", "animal_id", "position", "visits_to_position", "time_in_position", "hours"],
+			days_range=days_range,
+			phase_type=phase_type,
+		)
 		.lazy()
+		.filter(pl.col("hours") > 0)
 		.with_columns(pl.col("position").cast(pl.String))
-		.filter(
-			pl.col("phase").is_in(phase_type),
-			pl.col("day").is_between(days_range[0], days_range[1]),
-		)
 		.group_by(["day", "animal_id", "position"])
 		.agg(
 			pl.sum("visits_to_position").alias("visits"),
@@ -428,7 +481,7 @@ def prep_activity(
 
 
 def prep_activity_line(
-	store: dict[str, pl.DataFrame],
+	store: ProjectStore,
 	animals: list[str],
 	days_range: list[int],
 ) -> pl.DataFrame:
@@ -451,11 +504,10 @@ def prep_activity_line(
 	)
 
 	df = (
-		store["main_df"]
+		store.slice(
+			"detections_rollup", ["day", "hour", "animal_id", "n_detections"], days_range=days_range
+		)
 		.lazy()
-		.filter(pl.col("day").is_between(days_range[0], days_range[1]))
-		.group_by("day", "hour", "animal_id")
-		.agg(pl.len().alias("n_detections"))
 		.join(
 			join_df,
 			on=["animal_id", "hour", "day"],
@@ -479,7 +531,7 @@ def prep_activity_line(
 
 
 def prep_time_per_cage(
-	store: dict[str, pl.DataFrame],
+	store: ProjectStore,
 	animals: list[str],
 	days_range: list[int],
 	agg_switch: Literal["mean", "sum"],
@@ -496,7 +548,7 @@ def prep_time_per_cage(
 		),
 		schema=[
 			("hour", pl.Int8()),
-			("position", pl.Categorical()),
+			("position", pl.String()),
 			("animal_id", pl.Enum(animals)),
 		],
 	)
@@ -508,11 +560,14 @@ def prep_time_per_cage(
 			agg_func = pl.mean("time_in_position").round(2) / 60
 
 	df = (
-		store["activity_df"]
-		.lazy()
-		.filter(
-			pl.col("day").is_between(days_range[0], days_range[1]), pl.col("position").is_in(cages)
+		store.slice(
+			"activity_df",
+			["day", "hour", "position", "animal_id", "time_in_position"],
+			days_range=days_range,
 		)
+		.lazy()
+		.filter(pl.col("position").is_in(cages))
+		.with_columns(pl.col("position").cast(pl.String))
 		.sort("day", "hour")
 		.group_by(["position", "animal_id", "hour"], maintain_order=True)
 		.agg(agg_func)
@@ -527,7 +582,7 @@ def prep_time_per_cage(
 
 
 def prep_pairwise_sociability(
-	store: dict[str, pl.DataFrame],
+	store: ProjectStore,
 	phase_type: list[str],
 	animals: list[str],
 	days_range: list[int],
@@ -539,24 +594,31 @@ def prep_pairwise_sociability(
 	join_df = pl.LazyFrame(
 		product(cages, animals, animals),
 		schema=[
-			("position", pl.Categorical()),
+			("position", pl.String()),
 			("animal_id", pl.Enum(animals)),
 			("animal_id_2", pl.Enum(animals)),
 		],
 	)
 
+	has_rows = pl.col("hours") > 0
 	img = (
-		store["pairwise_meetings"]
-		.lazy()
-		.with_columns(pl.col(pairwise_switch))
-		.filter(
-			pl.col("phase").is_in(phase_type),
-			pl.col("day").is_between(days_range[0], days_range[1]),
-		)
-		.group_by(["animal_id", "animal_id_2", "position"], maintain_order=True)
-		.agg(
-			pl.sum(pairwise_switch).alias("sum"),
-			pl.mean(pairwise_switch).alias("mean").round(2),
+		_range_totals(
+			store,
+			"pairwise_rollup",
+			["animal_id", "animal_id_2", "position"],
+			[pairwise_switch, "hours"],
+			days_range,
+			phase_type,
+		)
+		.select(
+			"animal_id",
+			"animal_id_2",
+			pl.col("position").cast(pl.String),
+			pl.when(has_rows).then(pl.col(pairwise_switch)).alias("sum"),
+			pl.when(has_rows)
+			.then(pl.col(pairwise_switch) / pl.col("hours"))
+			.round(2)
+			.alias("mean"),
 		)
 		.join(
 			join_df,
@@ -576,7 +638,7 @@ def prep_pairwise_sociability(
 
 
 def prep_within_cohort_sociability(
-	store: dict[str, pl.DataFrame],
+	store: ProjectStore,
 	phase_type: list[str],
 	animals: list[str],
 	days_range: list[int],
@@ -591,13 +653,14 @@ def prep_within_cohort_sociability(
 		],
 	)
 	img = (
-		store["incohort_sociability"]
+		store.slice(
+			"incohort_sociability",
+			["animal_id", "animal_id_2", sociability_switch],
+			days_range=days_range,
+			phase_type=phase_type,
+		)
 		.lazy()
 		.with_columns(pl.col(sociability_switch).round(3))
-		.filter(
-			pl.col("phase").is_in(phase_type),
-			pl.col("day").is_between(days_range[0], days_range[1]),
-		)
 		.group_by(["animal_id", "animal_id_2"], maintain_order=True)
 		.agg(pl.mean(sociability_switch).round(2).alias("mean"))
 		.join(
@@ -618,16 +681,14 @@ def prep_within_cohort_sociability(
 
 
 def prep_time_alone(
-	store: dict[str, pl.DataFrame],
+	store: ProjectStore,
 	phase_type: list[str],
 	days_range: list[int],
 ) -> pl.DataFrame:
 	"""Filter the time spent alone for the specified phases and day range."""
 	df = (
-		store["activity_df"]
+		store.slice("activity_df", days_range=days_range, phase_type=phase_type)
 		.filter(
-			pl.col("phase").is_in(phase_type),
-			pl.col("day").is_between(days_range[0], days_range[1]),
 			pl.col("position")
 			.cast(pl.String)
 			.str.contains("cage"),  # NOTE: To be decided whether the plot should show tunnels
@@ -640,7 +701,7 @@ def prep_time_alone(
 
 
 def prep_network_sociability(
-	store: dict[str, pl.DataFrame],
+	store: ProjectStore,
 	animals: list[str],
 	days_range: list[int],
 ) -> pl.DataFrame:
@@ -654,9 +715,12 @@ def prep_network_sociability(
 	)
 
 	connections = (
-		store["incohort_sociability"]
+		store.slice(
+			"incohort_sociability",
+			["animal_id", "animal_id_2", "proportion_together"],
+			days_range=days_range,
+		)
 		.lazy()
-		.filter(pl.col("day").is_between(days_range[0], days_range[1]))
 		.group_by("animal_id", "animal_id_2")
 		.agg(pl.sum("proportion_together"))
 		.join(
@@ -673,28 +737,30 @@ def prep_network_sociability(
 
 
 def prep_social_stability(
-	store: dict[str, pl.DataFrame],
+	store: ProjectStore,
 	phase_type: list[str],
 	days_range: list[int],
 ) -> pl.DataFrame:
 	"""Return a dataframe showing proportion together and stability of the relationship."""
 	mad = (pl.col("proportion_together") - pl.median("proportion_together")).abs().median()
 
-	df = store["incohort_sociability"].lazy()
+	df = store.slice(
+		"incohort_sociability",
+		["day", "animal_id", "animal_id_2", "proportion_together"],
+		days_range=days_range,
+		phase_type=phase_type,
+	).lazy()
 
 	df = pl.concat(
 		[
 			df,
 			df.rename({"animal_id": "animal_id_2", "animal_id_2": "animal_id"}),
-		]
+		],
+		how="diagonal",  # the swapped frame has the pair columns in the opposite order
 	)
 
 	df = (
-		df.filter(
-			pl.col("phase").is_in(phase_type),
-			pl.col("day").is_between(days_range[0], days_range[1]),
-		)
-		.group_by("day", "animal_id", "animal_id_2")
+		df.group_by("day", "animal_id", "animal_id_2")
 		.agg(pl.mean("proportion_together"))
 		.sort("animal_id", "animal_id_2", "day")
 		.group_by("animal_id", "animal_id_2")
@@ -717,18 +783,20 @@ def prep_social_stability(
 
 
 def prep_cage_preference(
-	store: dict[str, pl.DataFrame],
+	store: ProjectStore,
 	phase_type: list[str],
 	days_range: list[int],
 ) -> pl.DataFrame:
 	"""Return a dataframe showing cage preference of the cohort."""
 	df = (
-		store["activity_df"]
-		.lazy()
-		.filter(
-			pl.col("phase").is_in(phase_type),
-			pl.col("day").is_between(days_range[0], days_range[1]),
+		store.slice(
+			"activity_rollup",
+			["day", "animal_id", "position", "time_in_position", "hours"],
+			days_range=days_range,
+			phase_type=phase_type,
 		)
+		.lazy()
+		.filter(pl.col("hours") > 0)
 		.with_columns(
 			pl.col("position").cast(pl.String),
 			pl.col("time_in_position") / 3600,
@@ -743,7 +811,7 @@ def prep_cage_preference(
 
 
 def prep_tube_test_heatmap(
-	store: dict[str, pl.DataFrame],
+	store: ProjectStore,
 	animals: list[str],
 	days_range: list[int],
 	phase_type: list[str],
@@ -760,23 +828,36 @@ def prep_tube_test_heatmap(
 
 	match agg_switch:
 		case "sum":
-			agg_func = pl.when(pl.len() > 0).then(pl.sum("tube_test")).alias("sum")
+			pairs = (
+				_range_totals(
+					store,
+					"tube_test_rollup",
+					["winner", "loser"],
+					["tube_test", "hours"],
+					days_range,
+					phase_type,
+				)
+				.filter(pl.col("hours") > 0)
+				.select("winner", "loser", pl.col("tube_test").alias("sum"))
+			)
 		case "mean":
-			agg_func = pl.mean("tube_test").round(2).alias("mean")
+			pairs = (
+				store.slice(
+					"tube_test_rollup",
+					["day", "winner", "loser", "tube_test", "hours"],
+					days_range=days_range,
+					phase_type=phase_type,
+				)
+				.lazy()
+				.filter(pl.col("hours") > 0)
+				.group_by("day", "winner", "loser")
+				.agg(pl.sum("tube_test"))
+				.group_by("winner", "loser")
+				.agg(pl.mean("tube_test").round(2).alias("mean"))
+			)
 
 	img = (
-		store["tube_test_df"]
-		.lazy()
-		.sort("loser", "winner")
-		.filter(
-			pl.col("phase").is_in(phase_type),
-			pl.col("day").is_between(days_range[0], days_range[1]),
-		)
-		.group_by("day", "winner", "loser")
-		.agg(pl.sum("tube_test"))
-		.group_by("winner", "loser", maintain_order=True)
-		.agg(agg_func)
-		.join(join_df, on=["winner", "loser"], how="right")
+		pairs.join(join_df, on=["winner", "loser"], how="right")
 		.collect(engine="in-memory")
 		.pivot(
 			on="winner",
@@ -791,7 +872,7 @@ def prep_tube_test_heatmap(
 
 
 def prep_cage_preference_evolution(
-	store: dict[str, pl.DataFrame],
+	store: ProjectStore,
 	animals: list[str],
 	days_range: list[int],
 	agg_switch: Literal["mean", "sum"],
@@ -816,17 +897,20 @@ def prep_cage_preference_evolution(
 	match agg_switch:
 		case "sum":
 			agg_func = pl.sum("time_in_position").truediv(3600).round(2)
-		case "mean":
-			agg_func = pl.mean("time_in_position").truediv(3600).round(2)
+		case "mean":  # mean over the hourly cells of the day
+			agg_func = (
+				(pl.sum("time_in_position") / pl.sum("hours")).truediv(3600).round(2)
+			).alias("time_in_position")
 	df = (
-		store["activity_df"]
+		store.slice(
+			"activity_rollup",
+			["day", "animal_id", "position", "time_in_position", "hours"],
+			days_range=days_range,
+		)
 		.lazy()
+		.filter(pl.col("hours") > 0)
 		.with_columns(pl.col("position").cast(pl.String))
-		.filter(
-			pl.col("day").is_between(days_range[0], days_range[1]),
-			pl.col("position").str.contains("cage"),
-		)
-		.fill_null(0)
+		.filter(pl.col("position").str.contains("cage"))
 		.group_by(["day", "animal_id", "position"])
 		.agg(agg_func)
 		.join(
@@ -3,8 +3,7 @@ from pathlib import Path
 import diskcache
 from dash import DiskcacheManager
 
-from deepecohab.core.registries import df_registry
-from deepecohab.utils import auxfun
+from deepecohab.utils.project_store import ProjectStore
 
 # Co-locate the launch cache with the package rather than the drive root.
 cache_dir = Path(__file__).resolve().parents[1] / "cache"
@@ -15,24 +14,22 @@ launch_cache.clear()
 background_manager = DiskcacheManager(launch_cache)
 
 
-@launch_cache.memoize()
-def get_project_data(config_tuple):
-	"""Load and cache all available analysis tables for a project config.
+# One store per project: scan handles and slice caches live in-process; only the
+# small launch/progress state goes through diskcache.
+_project_stores: dict[str, ProjectStore] = {}
+
+
+def get_project_data(config: dict | tuple) -> ProjectStore:
+	"""Return the lazy, slice-caching store of a project's analysis tables.
 
 	Args:
-		config_tuple: project config as a hashable tuple of items (so the
-			result can be memoized).
+		config: project config, as a dict or a tuple of items.
 
 	Returns:
-		Mapping of data key to loaded DataFrame, or an empty dict if the
-		project has no results directory yet.
+		The project's ProjectStore; tables are read on demand, and a store for a
+		project without a results directory is simply empty.
 	"""
-	config = dict(config_tuple)
-	results_path = Path(config["project_location"]) / "results"
-	if not results_path.exists():
-		return {}
-
-	return {
-		name: auxfun.load_ecohab_data(config, name, return_df=True)
-		for name in df_registry.list_available()
-	}
+	location = str(dict(config)["project_location"])
+	if location not in _project_stores:
+		_project_stores[location] = ProjectStore(config)
+	return _project_stores[location]
@@ -22,6 +22,11 @@ class ExperimentConfig(ABC):
 			pruned to match
 		antenna_combinations: per-comport renaming scheme, used when combining
 			reads from multiple boards in one setup
+		partition_results: store day-indexed results as one parquet file per day
+			(``results/<key>/day=N/part.parquet``) instead of a single file
+		ipc_results: keys stored as memory-mapped Arrow IPC files
+			(``results/<key>.arrow``) instead of parquet
+		ipc_compression: compression of the IPC files, ``"uncompressed"`` or ``"lz4"``
 	"""
 
 	project_location: str
@@ -39,6 +44,9 @@ class ExperimentConfig(ABC):
 	phase: dict[str, str] = field(init=False)
 	experiment_timeline: dict[str, str | None] = field(init=False)
 	interpolate_positions: bool = False
+	partition_results: bool = False
+	ipc_results: list[str] = field(default_factory=list)
+	ipc_compression: str = "uncompressed"
 
 	def __post_init__(self):
 		self.phase = {
@@ -68,6 +76,9 @@ class ExperimentConfig(ABC):
 		data["days_range"] = self.days_range
 		data["antenna_combinations"] = self.antenna_combinations
 		data["tunnels"] = self.tunnels
+		data["partition_results"] = self.partition_results
+		data["ipc_results"] = self.ipc_results
+		data["ipc_compression"] = self.ipc_compression
 
 		scheme = getattr(self, "antenna_rename_scheme", None)
 		if scheme is not None:
@@ -0,0 +1,410 @@
+import datetime as dt
+from typing import Any
+from zoneinfo import ZoneInfo
+
+import polars as pl
+
+# Phases keep the wall clock in force at the experiment start: lights do not follow
+# DST changes, so phase boundaries repeat every 24 h of absolute time. ``day`` and
+# ``hour`` follow the local, DST-aware calendar.
+CALENDAR_COLUMNS = ["phase", "day", "hour", "phase_count"]
+
+
+def _localize(value: str | dt.datetime, tz: ZoneInfo) -> dt.datetime:
+	if isinstance(value, str):
+		value = dt.datetime.fromisoformat(value)
+	return value.replace(tzinfo=tz) if value.tzinfo is None else value.astimezone(tz)
+
+
+def experiment_window(
+	cfg: dict[str, Any], time_zone: str | None = None
+) -> tuple[dt.datetime, dt.datetime]:
+	"""Experiment start and finish from ``experiment_timeline``.
+
+	Both are returned in ``time_zone`` (the project timezone by default); naive
+	timestamps are read as wall time in that zone.
+	"""
+	tz = ZoneInfo(time_zone or cfg["timezone"])
+	timeline: dict[str, str] = cfg["experiment_timeline"]
+	return _localize(timeline["start_date"], tz), _localize(timeline["finish_date"], tz)
+
+
+def phase_intervals(
+	phases: dict[str, str], start: dt.datetime, finish: dt.datetime
+) -> pl.DataFrame:
+	"""Every phase occurrence overlapping ``[start, finish]``, with its exact bounds.
+
+	Occurrence boundaries are the ``phases`` start times on the clock in force at
+	``start``. ``phase_count`` numbers each phase's occurrences from the one holding
+	``start`` (or the first one after it); occurrences ending by ``start`` get 0.
+
+	Args:
+		phases: phase name -> wall-clock start time, as ``cfg["phase"]``.
+		start: zone-aware experiment start.
+		finish: zone-aware experiment finish.
+
+	Returns:
+		DataFrame with ``phase``, ``phase_count`` and the occurrence's ``start`` and
+		``end`` (not clipped to the window), in chronological order.
+	"""
+	time_zone = str(start.tzinfo)
+	fixed = dt.timezone(start.utcoffset())
+	starts = sorted((dt.time.fromisoformat(time), name) for name, time in phases.items())
+
+	first = (start - dt.timedelta(days=1)).astimezone(fixed).date()
+	last = (finish + dt.timedelta(days=1)).astimezone(fixed).date()
+	bounds = [
+		(dt.datetime.combine(first + dt.timedelta(days=i), time, fixed), name)
+		for i in range((last - first).days + 1)
+		for time, name in starts
+	]
+
+	return (
+		pl.DataFrame(
+			{
+				"phase": pl.Series([name for _, name in bounds], dtype=pl.Enum(list(phases))),
+				"start": pl.Series(
+					[bound.astimezone(dt.UTC) for bound, _ in bounds],
+					dtype=pl.Datetime("us", "UTC"),
+				).dt.convert_time_zone(time_zone),
+			}
+		)
+		.with_columns(pl.col("start").shift(-1).alias("end"))
+		.filter(pl.col("end") > start, pl.col("start") <= finish)
+		.select(
+			"phase",
+			(pl.col("end") > start).cum_sum().over("phase").cast(pl.UInt16).alias("phase_count"),
+			"start",
+			"end",
+		)
+	)
+
+
+def build_calendar(phases: dict[str, str], start: dt.datetime, finish: dt.datetime) -> pl.DataFrame:
+	"""Segments of constant phase, phase_count, day and hour covering the experiment.
+
+	A segment starts at every phase boundary and every local hour start. The table
+	opens at the hour holding ``start`` and closes with an all-null segment after the
+	one holding ``finish``, so rows outside that span are labelled null. ``day`` counts
+	local calendar days from the date of ``start``.
+
+	Args:
+		phases: phase name -> wall-clock start time, as ``cfg["phase"]``.
+		start: zone-aware experiment start.
+		finish: zone-aware experiment finish.
+
+	Returns:
+		DataFrame with ``datetime`` (segment start, UTC-sorted) followed by
+		``phase``, ``day``, ``hour`` and ``phase_count``.
+	"""
+	time_zone = str(start.tzinfo)
+	opening = start.replace(minute=0, second=0, microsecond=0)
+	# Also cover the hour before ``start``; an occurrence ending in it keeps count 0.
+	occurrences = phase_intervals(phases, opening, finish).with_columns(
+		(pl.col("end") > start).cum_sum().over("phase").cast(pl.UInt16).alias("phase_count")
+	)
+
+	# Local hour starts: 15-minute steps cover every UTC offset in use.
+	hours = (
+		pl.datetime_range(
+			opening,
+			occurrences["end"][-1],
+			interval="15m",
+			time_zone=time_zone,
+			eager=True,
+		)
+		.alias("datetime")
+		.to_frame()
+		.filter(pl.col("datetime").dt.minute() == 0)
+	)
+	boundaries = pl.concat(
+		[
+			hours,
+			occurrences.select(pl.col("start").alias("datetime")),
+			occurrences.select(pl.col("end").last().alias("datetime")),
+		]
+	)
+
+	segments = (
+		boundaries.unique()
+		.sort("datetime")
+		.join_asof(
+			occurrences.select("start", "phase", "phase_count"),
+			left_on="datetime",
+			right_on="start",
+		)
+		.filter(pl.col("datetime") >= opening)
+		.select(
+			"datetime",
+			"phase",
+			(pl.col("datetime").dt.date() - pl.lit(start.date()))
+			.dt.total_days()
+			.add(1)
+			.cast(pl.UInt16)
+			.alias("day"),
+			pl.col("datetime").dt.hour().cast(pl.UInt8).alias("hour"),
+			"phase_count",
+		)
+	)
+
+	inside = pl.col("datetime") <= finish
+	closing = (
+		segments.filter(~inside)
+		.head(1)
+		.with_columns(pl.lit(None, segments.schema[c]).alias(c) for c in CALENDAR_COLUMNS)
+	)
+	return pl.concat([segments.filter(inside), closing])
+
+
+def _segments_for(
+	lf: pl.LazyFrame,
+	cfg: dict[str, Any],
+	first_col: str,
+	last_col: str,
+	finish: dt.datetime | None,
+) -> pl.DataFrame:
+	"""Calendar segments covering ``lf``, with ``datetime`` in the dtype of ``first_col``.
+
+	The calendar spans ``experiment_timeline`` or, when that is missing, the range
+	from the earliest ``first_col`` to the latest ``last_col`` of ``lf``.
+	"""
+	dtype = lf.collect_schema()[first_col]
+	if "experiment_timeline" in cfg:
+		start, end = experiment_window(cfg, dtype.time_zone)
+	else:
+		start, end = (
+			lf.lazy()
+			.select(pl.col(first_col).min().alias("start"), pl.col(last_col).max().alias("end"))
+			.collect()
+			.row(0)
+		)
+	if finish is not None:
+		end = finish if end is None else max(end, finish)
+
+	if start is None:  # nothing to label
+		return pl.DataFrame(
+			schema={
+				"datetime": dtype,
+				"phase": pl.Enum(list(cfg["phase"])),
+				"day": pl.UInt16,
+				"hour": pl.UInt8,
+				"phase_count": pl.UInt16,
+			}
+		)
+	return build_calendar(cfg["phase"], start, end).with_columns(pl.col("datetime").cast(dtype))
+
+
+def _segment_index(bounds: pl.Series, column: str, side: str = "right") -> pl.Expr:
+	"""Index of the segment holding ``column`` (null before the first segment)."""
+	index = pl.lit(bounds).search_sorted(pl.col(column), side=side).cast(pl.Int64) - 1
+	return pl.when(pl.col(column).is_not_null() & (index >= 0)).then(index)
+
+
+def label_calendar(
+	lf: pl.LazyFrame,
+	cfg: dict[str, Any],
+	dt_col: str = "datetime",
+	finish: dt.datetime | None = None,
+) -> pl.LazyFrame:
+	"""Add ``phase``, ``day``, ``hour`` and ``phase_count`` columns from the calendar.
+
+	Each row is placed in its :func:`build_calendar` segment by a binary search over
+	the segment starts, so ``lf`` need not be sorted and no per-row time-of-day or
+	DST arithmetic is done. Existing label columns are replaced.
+
+	Args:
+		lf: frame with a zone-aware ``dt_col``.
+		cfg: project config; ``phase`` is required. The calendar spans
+			``experiment_timeline`` or, when that is missing, the rows of ``lf``.
+		dt_col: timestamp column to label.
+		finish: extend the calendar to at least this time (e.g. for rows appended
+			past the recorded finish date).
+
+	Returns:
+		``lf`` with the four label columns; rows outside the calendar get nulls.
+	"""
+	segments = _segments_for(lf, cfg, dt_col, dt_col, finish)
+
+	return (
+		lf.with_columns(_segment_index(segments["datetime"], dt_col).alias("__segment"))
+		.with_columns(
+			pl.lit(segments[column]).gather(pl.col("__segment")).alias(column)
+			for column in CALENDAR_COLUMNS
+		)
+		.drop("__segment")
+	)
+
+
+def split_intervals(
+	lf: pl.LazyFrame,
+	cfg: dict[str, Any],
+	start: str = "start",
+	end: str = "end",
+	finish: dt.datetime | None = None,
+) -> pl.LazyFrame:
+	"""Cut ``[start, end)`` intervals at calendar segment boundaries and label the pieces.
+
+	The per-row counterpart of :func:`bin_intervals`: an interval spanning ``k``
+	segments (hours and phase changes) becomes ``k`` rows whose ``start``/``end``
+	are clipped to their segment, so every piece lies in a single calendar cell.
+	Only segment boundaries cut, so a stay costs one row per hour it spans.
+
+	Args:
+		lf: intervals with zone-aware ``start`` and ``end`` columns.
+		cfg: project config, as for :func:`label_calendar`.
+		start: interval start column.
+		end: interval end column (exclusive).
+		finish: extend the calendar to at least this time.
+
+	Returns:
+		``lf`` with one row per piece, clipped ``start``/``end`` and the four label
+		columns. Intervals starting outside the calendar are dropped.
+	"""
+	segments = _segments_for(lf, cfg, start, end, finish)
+	bounds = segments["datetime"]
+	edges = pl.concat([bounds.to_physical(), pl.Series([2**63 - 1], dtype=pl.Int64)])
+	dtype = lf.collect_schema()[start]
+
+	def edge(index: pl.Expr) -> pl.Expr:
+		return pl.lit(edges).gather(index)
+
+	return (
+		lf.with_columns(
+			_segment_index(bounds, start).alias("__first"),
+			_segment_index(bounds, end, side="left").alias("__last"),
+		)
+		.filter(pl.col("__first").is_not_null())
+		.with_columns(
+			pl.int_ranges(
+				"__first", pl.max_horizontal("__first", "__last") + 1, dtype=pl.Int64
+			).alias("__segment")
+		)
+		.explode("__segment", empty_as_null=False)
+		.with_columns(
+			pl.max_horizontal(pl.col(start).to_physical(), edge(pl.col("__segment")))
+			.cast(dtype)
+			.alias(start),
+			pl.min_horizontal(pl.col(end).to_physical(), edge(pl.col("__segment") + 1))
+			.cast(dtype)
+			.alias(end),
+			*(
+				pl.lit(segments[column]).gather(pl.col("__segment")).alias(column)
+				for column in CALENDAR_COLUMNS
+			),
+		)
+		.drop("__first", "__last", "__segment")
+	)
+
+
+def bin_intervals(
+	lf: pl.LazyFrame,
+	cfg: dict[str, Any],
+	by: list[str],
+	start: str = "start",
+	end: str = "end",
+	name: str = "duration",
+	finish: dt.datetime | None = None,
+) -> pl.LazyFrame:
+	"""Total the length of ``[start, end)`` intervals per group and calendar cell.
+
+	Intervals are cut at calendar segment boundaries (hours and phase changes)
+	arithmetically, without expanding them into per-bin rows: the partial first and
+	last segments of each interval are measured directly, and the segments it fully
+	covers are counted with a per-group difference array (+1 where coverage starts,
+	-1 where it stops) whose running sum over the segment index gives the coverage
+	of every segment. A stay of any length therefore costs at most four rows.
+
+	Args:
+		lf: intervals with zone-aware ``start`` and ``end`` columns and ``by`` keys.
+		cfg: project config, as for :func:`label_calendar`.
+		by: grouping columns kept in the output.
+		start: interval start column.
+		end: interval end column (exclusive).
+		name: output column holding the summed length.
+		finish: extend the calendar to at least this time.
+
+	Returns:
+		Frame of the same kind as ``lf`` with ``by``, ``phase``, ``day``, ``hour``,
+		``phase_count`` and ``name`` (seconds, Float64), one row per group and cell
+		with any interval.
+	"""
+	eager = isinstance(lf, pl.DataFrame)
+	lf = lf.lazy()
+	segments = _segments_for(lf, cfg, start, end, finish)
+	dtype = segments.schema["datetime"]
+	per_second = {"ns": 1_000_000_000, "us": 1_000_000, "ms": 1_000}[dtype.time_unit]
+
+	bounds = segments["datetime"]
+	# One bound past the last segment so every segment has an end.
+	edges = pl.concat([bounds.to_physical(), pl.Series([2**63 - 1], dtype=pl.Int64)])
+	n_segments = len(bounds)
+
+	intervals = (
+		lf.filter(pl.col(start).is_not_null(), pl.col(end).is_not_null())
+		.select(
+			*by,
+			pl.col(start).to_physical().alias("__start"),
+			pl.col(end).to_physical().alias("__end"),
+			_segment_index(bounds, start).alias("__first"),
+			_segment_index(bounds, end, side="left").alias("__last"),
+		)
+		.filter(pl.col("__first").is_not_null())
+		.with_columns(pl.max_horizontal("__first", "__last").alias("__last"))
+	)
+
+	def edge(index: pl.Expr) -> pl.Expr:
+		return pl.lit(edges).gather(index)
+
+	first_piece = intervals.select(
+		*by,
+		pl.col("__first").alias("__segment"),
+		(pl.min_horizontal("__end", edge(pl.col("__first") + 1)) - pl.col("__start")).alias(
+			"__length"
+		),
+	)
+	last_piece = intervals.filter(pl.col("__last") > pl.col("__first")).select(
+		*by,
+		pl.col("__last").alias("__segment"),
+		(pl.col("__end") - edge(pl.col("__last"))).alias("__length"),
+	)
+
+	spans = intervals.filter(pl.col("__last") > pl.col("__first") + 1)
+	steps = (
+		pl.concat(
+			[
+				spans.select(
+					*by, (pl.col("__first") + 1).alias("__segment"), pl.lit(1).alias("__step")
+				),
+				spans.select(*by, pl.col("__last").alias("__segment"), pl.lit(-1).alias("__step")),
+			]
+		)
+		.group_by(*by, "__segment")
+		.agg(pl.sum("__step"))
+	)
+	covered = (
+		steps.select(by)
+		.unique()
+		.join(pl.LazyFrame({"__segment": pl.int_range(n_segments, eager=True)}), how="cross")
+		.join(steps, on=[*by, "__segment"], how="left")
+		.sort(*by, "__segment")
+		.select(
+			*by,
+			"__segment",
+			(
+				pl.col("__step").fill_null(0).cum_sum().over(by)
+				* (edge(pl.col("__segment") + 1) - edge(pl.col("__segment")))
+			).alias("__length"),
+		)
+		.filter(pl.col("__length") > 0)
+	)
+
+	labels = segments.lazy().select(pl.int_range(pl.len()).alias("__segment"), *CALENDAR_COLUMNS)
+	binned = (
+		pl.concat([first_piece, last_piece, covered], how="vertical_relaxed")
+		.group_by(*by, "__segment")
+		.agg(pl.sum("__length"))
+		.join(labels, on="__segment", how="left")
+		.group_by(*by, *CALENDAR_COLUMNS)
+		.agg((pl.sum("__length") / per_second).alias(name))
+	)
+	return binned.collect() if eager else binned
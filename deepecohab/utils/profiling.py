@@ -0,0 +1,195 @@
+import datetime as dt
+import json
+import sys
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+
+try:
+	import resource
+except ImportError:  # Windows
+	resource = None
+
+# Ledger of every step and data-structure build run on a project, one row per run.
+# Underscore-prefixed, so it is bookkeeping rather than a table (see results_io).
+PROFILE_FILE = "_profile.parquet"
+
+LEDGER_SCHEMA = {
+	"started": pl.Datetime("us", "UTC"),
+	"step": pl.String,
+	"kind": pl.String,
+	"config_fingerprint": pl.String,
+	"fingerprint": pl.String,
+	"kwargs": pl.String,
+	"wall_seconds": pl.Float64,
+	"cpu_seconds": pl.Float64,
+	"peak_rss_bytes": pl.Int64,
+	"rows_in": pl.Int64,
+	"rows_out": pl.Int64,
+	"bytes_out": pl.Int64,
+}
+
+# Steps running on the pipeline's threads append to the same ledger.
+_ledger_lock = threading.Lock()
+
+# Records logged inside a ``buffered`` block, by the results directory they go to.
+# Worker threads of a pipeline run see the same dict through copied contexts.
+_buffer: ContextVar[dict[Path, list["ProfileRecord"]] | None] = ContextVar(
+	"deepecohab_profile_buffer", default=None
+)
+
+
+def _peak_rss() -> int | None:
+	"""High-water mark of this process's resident memory, in bytes."""
+	if resource is None:
+		return None
+	peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+	return peak if sys.platform == "darwin" else peak * 1024
+
+
+@dataclass
+class ProfileRecord:
+	"""Resources one run of a step or data-structure builder took.
+
+	Timing starts when the record is created; the caller fills in the row counts
+	and output size it knows and calls :meth:`stop` once the output is written.
+
+	Attributes:
+		step: data key built (``padded_df@1m`` for padded tables, ``fused`` for
+			the single ``pl.collect_all`` of a fused pipeline run).
+		kind: ``"step"``, ``"structure"`` or ``"fused"``.
+		config_fingerprint: hash of the analysis-relevant config entries.
+		fingerprint: fingerprint of the step result, if it has one.
+		kwargs: parameters the run was called with.
+		started: UTC time the run started.
+		wall_seconds: elapsed time.
+		cpu_seconds: CPU time of the whole process, all threads included, so
+			steps running alongside it with ``jobs > 1`` are counted too.
+		peak_rss_bytes: peak resident memory of the process when the run ended.
+			It never decreases, so a step only raised it if it is higher than
+			the previous run's.
+		rows_in: rows of the tables the run read, if known.
+		rows_out: rows of the table it wrote.
+		bytes_out: size of the table it wrote.
+	"""
+
+	step: str
+	kind: str
+	config_fingerprint: str | None = None
+	fingerprint: str | None = None
+	kwargs: dict[str, Any] = field(default_factory=dict)
+	started: dt.datetime = field(default_factory=lambda: dt.datetime.now(dt.UTC))
+	wall_seconds: float | None = None
+	cpu_seconds: float | None = None
+	peak_rss_bytes: int | None = None
+	rows_in: int | None = None
+	rows_out: int | None = None
+	bytes_out: int | None = None
+	_wall_start: float = field(default_factory=time.perf_counter, repr=False)
+	_cpu_start: float = field(default_factory=time.process_time, repr=False)
+
+	def stop(self) -> "ProfileRecord":
+		"""Take the elapsed wall and CPU time and the peak RSS."""
+		self.wall_seconds = time.perf_counter() - self._wall_start
+		self.cpu_seconds = time.process_time() - self._cpu_start
+		self.peak_rss_bytes = _peak_rss()
+		return self
+
+	def row(self) -> dict[str, Any]:
+		"""The record as a ledger row."""
+		return {
+			"started": self.started,
+			"step": self.step,
+			"kind": self.kind,
+			"config_fingerprint": self.config_fingerprint,
+			"fingerprint": self.fingerprint,
+			"kwargs": json.dumps(self.kwargs, sort_keys=True, default=str),
+			"wall_seconds": self.wall_seconds,
+			"cpu_seconds": self.cpu_seconds,
+			"peak_rss_bytes": self.peak_rss_bytes,
+			"rows_in": self.rows_in,
+			"rows_out": self.rows_out,
+			"bytes_out": self.bytes_out,
+		}
+
+
+def log(results_path: Path, record: ProfileRecord) -> None:
+	"""Add a stopped record to the ledger, at the end of the enclosing :func:`buffered`."""
+	records = _buffer.get()
+	if records is None:
+		append(results_path, [record])
+		return
+	with _ledger_lock:
+		records[results_path].append(record)
+
+
+@contextmanager
+def buffered() -> Iterator[None]:
+	"""Hold the records logged inside the block and write each ledger once, at its end.
+
+	A data-structure build then rewrites the ledger once rather than once per
+	table it writes. Records of a block that raised are written as well. The
+	block must not span a ``yield`` (``run_pipeline`` keeps its own records).
+	"""
+	if _buffer.get() is not None:
+		yield
+		return
+	records: dict[Path, list[ProfileRecord]] = defaultdict(list)
+	token = _buffer.set(records)
+	try:
+		yield
+	finally:
+		_buffer.reset(token)
+		for results_path, logged in records.items():
+			append(results_path, logged)
+
+
+def append(results_path: Path, records: list[ProfileRecord]) -> None:
+	"""Add stopped records to the ledger under ``results_path``."""
+	new = pl.DataFrame([record.row() for record in records], schema=LEDGER_SCHEMA)
+	path = results_path / PROFILE_FILE
+	with _ledger_lock:
+		ledger = pl.concat([read_ledger(results_path), new], how="diagonal_relaxed")
+		tmp = path.with_suffix(".tmp")
+		ledger.write_parquet(tmp)
+		tmp.replace(path)
+
+
+def read_ledger(results_path: Path) -> pl.DataFrame:
+	"""The ledger under ``results_path``, empty if nothing was profiled yet."""
+	path = results_path / PROFILE_FILE
+	if not path.is_file():
+		return pl.DataFrame(schema=LEDGER_SCHEMA)
+	return pl.read_parquet(path)
+
+
+def summarise(ledger: pl.DataFrame) -> pl.DataFrame:
+	"""Per step: number of runs, the last run, and wall/CPU/memory statistics.
+
+	Sorted by the median wall time, slowest first.
+	"""
+	return (
+		ledger.sort("started")
+		.group_by("step", "kind")
+		.agg(
+			pl.len().alias("runs"),
+			pl.col("started").last().alias("last_run"),
+			pl.col("wall_seconds").last().alias("last_wall_seconds"),
+			pl.col("wall_seconds").median().alias("median_wall_seconds"),
+			pl.col("wall_seconds").sum().alias("total_wall_seconds"),
+			pl.col("cpu_seconds").median().alias("median_cpu_seconds"),
+			pl.col("peak_rss_bytes").max().alias("peak_rss_bytes"),
+			pl.col("rows_in").last().alias("last_rows_in"),
+			pl.col("rows_out").last().alias("last_rows_out"),
+			pl.col("bytes_out").last().alias("last_bytes_out"),
+		)
+		.sort("median_wall_seconds", descending=True, nulls_last=True)
+	)
@@ -0,0 +1,147 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator, Mapping, Sequence
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+
+from deepecohab.utils import results_io
+
+
+class ProjectStore(Mapping[str, pl.LazyFrame]):
+	"""Lazy, read-only view of a project's ``results/`` tables for the dashboard.
+
+	Indexing returns a lazy scan handle, so nothing is read until it is
+	collected. :meth:`slice` materialises only the columns and day/phase range a
+	plot asks for and keeps the result in a bounded LRU keyed by (table, filter).
+	Every access checks the size and mtime of the table's files; when a step
+	rewrites them, the handle and all cached slices of that table are dropped.
+	Day-partitioned tables are scanned with hive partitioning, so day-range
+	slices only read the selected days' files.
+
+	Args:
+		config: project config as a dict or hashable tuple of items.
+		max_entries: maximum number of cached slices across all tables.
+	"""
+
+	def __init__(self, config: dict[str, Any] | tuple, max_entries: int = 64):
+		self.results_path = Path(dict(config)["project_location"]) / "results"
+		self.max_entries = max_entries
+		self._scans: dict[str, tuple[str, pl.LazyFrame]] = {}
+		self._slices: OrderedDict[tuple, pl.DataFrame] = OrderedDict()
+		self._lock = threading.Lock()
+
+	def _signature(self, key: str) -> tuple[Path, str] | None:
+		location = results_io.result_location(self.results_path, key)
+		if location is None:
+			return None
+		try:
+			return location, results_io.result_signature(location)
+		except FileNotFoundError:  # rewritten between listing and stat
+			return None
+
+	def _scan(self, key: str) -> pl.LazyFrame:
+		"""Return the scan handle of ``key``, dropping stale state if its files changed."""
+		found = self._signature(key)
+		if found is None:
+			self.invalidate(key)
+			raise KeyError(key)
+		location, signature = found
+
+		with self._lock:
+			cached = self._scans.get(key)
+			if cached is not None and cached[0] == signature:
+				return cached[1]
+
+			for slice_key in [k for k in self._slices if k[0] == key]:
+				del self._slices[slice_key]
+			lf = results_io.scan_result(location)
+			self._scans[key] = (signature, lf)
+			return lf
+
+	def __getitem__(self, key: str) -> pl.LazyFrame:
+		return self._scan(key)
+
+	def __iter__(self) -> Iterator[str]:
+		return results_io.list_results(self.results_path)
+
+	def __len__(self) -> int:
+		return sum(1 for _ in self)
+
+	def fingerprint(self) -> str:
+		"""Identity of the project's current tables (path, size and mtime of their files).
+
+		Changes whenever any table is written, so it can key caches of values
+		derived from the store, such as rendered figures.
+		"""
+		state = [str(self.results_path)]
+		for key in self:
+			found = self._signature(key)
+			if found is not None:
+				state.append(f"{key}:{found[1]}")
+		return hashlib.sha256("|".join(state).encode()).hexdigest()
+
+	def slice(
+		self,
+		key: str,
+		columns: Sequence[str] | None = None,
+		days_range: Sequence[int] | None = None,
+		phase_type: Sequence[str] | None = None,
+	) -> pl.DataFrame:
+		"""Materialise a filtered, projected slice of a table, cached by its filter.
+
+		Filters on ``day``/``phase`` apply only if the table has that column, so a
+		generic request works for every table.
+
+		Args:
+			key: table name (``results/<key>.parquet``, ``.arrow`` or ``results/<key>/``).
+			columns: columns to keep, or None for all.
+			days_range: inclusive ``[first, last]`` day range, or None for all days.
+			phase_type: phases to keep, or None for all phases.
+
+		Returns:
+			The eager slice. Treat it as read-only; it is shared with later callers.
+		"""
+		scan = self._scan(key)
+		slice_key = (
+			key,
+			tuple(columns) if columns is not None else None,
+			tuple(days_range) if days_range is not None else None,
+			tuple(sorted(phase_type)) if phase_type is not None else None,
+		)
+		with self._lock:
+			if slice_key in self._slices:
+				self._slices.move_to_end(slice_key)
+				return self._slices[slice_key]
+
+		lf = scan
+		schema = lf.collect_schema()
+		if days_range is not None and "day" in schema:
+			lf = lf.filter(pl.col("day").is_between(days_range[0], days_range[-1]))
+		if phase_type is not None and "phase" in schema:
+			lf = lf.filter(pl.col("phase").is_in(list(phase_type)))
+		if columns is not None:
+			lf = lf.select(columns)
+		df = lf.collect()
+
+		with self._lock:
+			# A concurrent rewrite may have replaced the handle meanwhile; only
+			# cache slices read from the current one.
+			if self._scans.get(key, (None, None))[1] is scan:
+				self._slices[slice_key] = df
+				while len(self._slices) > self.max_entries:
+					self._slices.popitem(last=False)
+		return df
+
+	def invalidate(self, key: str | None = None) -> None:
+		"""Drop the handle and cached slices of ``key``, or of every table if None."""
+		with self._lock:
+			if key is None:
+				self._scans.clear()
+				self._slices.clear()
+				return
+			self._scans.pop(key, None)
+			for slice_key in [k for k in self._slices if k[0] == key]:
+				del self._slices[slice_key]
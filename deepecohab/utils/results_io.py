@@ -0,0 +1,257 @@
+import hashlib
+import json
+import shutil
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+
+# A table is either a single results/<key>.parquet file or, with the project's
+# partition_results option, hive-partitioned by day as results/<key>/day=N/part.parquet.
+# Tables listed in the project's ipc_results are a single Arrow IPC (Feather v2) file,
+# results/<key>.arrow, memory-mapped when read; since IPC files carry no key-value
+# metadata, theirs is kept next to them in results/<key>.arrow.json.
+PARTITION_KEY = "day"
+PART_FILE = "part.parquet"
+IPC_SUFFIX = ".arrow"
+IPC_METADATA_SUFFIX = ".arrow.json"
+
+
+def _part_files(directory: Path) -> list[Path]:
+	# In day order: as strings, day=10 would sort before day=2.
+	return sorted(
+		directory.glob(f"{PARTITION_KEY}=*/*.parquet"),
+		key=lambda part: (int(part.parent.name.split("=", 1)[1]), part.name),
+	)
+
+
+def result_location(results_path: Path, key: str) -> Path | None:
+	"""Path of a stored table (partition directory or single file), or None if absent.
+
+	Every layout is recognised regardless of the project's current settings, so
+	switching ``partition_results`` or ``ipc_results`` on an existing project keeps
+	old tables readable.
+	"""
+	directory = results_path / key
+	if directory.is_dir() and _part_files(directory):
+		return directory
+	for file in (results_path / f"{key}.parquet", results_path / f"{key}{IPC_SUFFIX}"):
+		if file.is_file():
+			return file
+	return None
+
+
+def _is_ipc(location: Path) -> bool:
+	return location.suffix == IPC_SUFFIX
+
+
+def ipc_compression(cfg: dict[str, Any], key: str) -> str | None:
+	"""IPC compression the project stores ``key`` with, or None if it is stored as parquet.
+
+	Tables are written as Arrow IPC when their key is listed in the config's
+	``ipc_results``; padded tables (``padded_df@1h``) are listed as ``padded_df``.
+	"""
+	if key.split("@")[0] not in cfg.get("ipc_results", []):
+		return None
+	return cfg.get("ipc_compression", "uncompressed")
+
+
+def list_results(results_path: Path) -> Iterator[str]:
+	"""Keys of the tables stored under ``results_path``, in any layout.
+
+	Underscore-prefixed files (e.g. the ingest manifest) are bookkeeping, not
+	tables, and are skipped.
+	"""
+	if not results_path.is_dir():
+		return iter(())
+	keys = {p.stem for p in results_path.glob("*.parquet")}
+	keys |= {p.stem for p in results_path.glob(f"*{IPC_SUFFIX}")}
+	keys |= {p.name for p in results_path.iterdir() if p.is_dir() and _part_files(p)}
+	return iter(sorted(k for k in keys if not k.startswith("_")))
+
+
+def scan_result(location: Path) -> pl.LazyFrame:
+	"""Lazily scan a table found by :func:`result_location`.
+
+	Partitioned tables are scanned with hive partitioning, day by day in order, so
+	rows come back in the order they were written and filters on ``day`` only open
+	the files of the selected days. IPC tables are memory-mapped: an
+	uncompressed one is read without copying, from pages the OS shares between
+	every process reading it.
+	"""
+	if location.is_dir():
+		return pl.scan_parquet(_part_files(location), hive_partitioning=True)
+	if _is_ipc(location):
+		return pl.scan_ipc(location, memory_map=True)
+	return pl.scan_parquet(location)
+
+
+def read_result(location: Path) -> pl.DataFrame:
+	"""Eagerly read a table found by :func:`result_location`."""
+	if location.is_dir():
+		return pl.read_parquet(_part_files(location), hive_partitioning=True)
+	if _is_ipc(location):
+		# Rechunking would copy the mapped record batches into new buffers.
+		return pl.read_ipc(location, memory_map=True, rechunk=False)
+	return pl.read_parquet(location)
+
+
+def result_metadata(location: Path) -> dict[str, str]:
+	"""Key-value metadata of a table (of its first partition, if partitioned)."""
+	if location.is_dir():
+		location = _part_files(location)[0]
+	if _is_ipc(location):
+		sidecar = location.with_suffix(IPC_METADATA_SUFFIX)
+		return json.loads(sidecar.read_text()) if sidecar.is_file() else {}
+	return pl.read_parquet_metadata(location)
+
+
+def result_signature(location: Path) -> str:
+	"""Identity of a table's files (size and mtime of each), changing on any rewrite."""
+	files = _part_files(location) if location.is_dir() else [location]
+	state = []
+	for file in files:
+		stat = file.stat()
+		state.append(f"{file.relative_to(location.parent)}:{stat.st_size}:{stat.st_mtime_ns}")
+	return hashlib.sha256("|".join(state).encode()).hexdigest()
+
+
+def result_rows(location: Path) -> int:
+	"""Rows of a table found by :func:`result_location`.
+
+	Counted from the parquet footers (the record batch headers of an IPC file)
+	without reading any column.
+	"""
+	if location.is_dir():
+		return pl.scan_parquet(_part_files(location)).select(pl.len()).collect().item()
+	if _is_ipc(location):
+		return pl.scan_ipc(location, memory_map=True).select(pl.len()).collect().item()
+	return pl.scan_parquet(location).select(pl.len()).collect().item()
+
+
+def result_size(location: Path) -> int:
+	"""Bytes on disk of a table found by :func:`result_location`."""
+	files = _part_files(location) if location.is_dir() else [location]
+	return sum(file.stat().st_size for file in files)
+
+
+def write_result(
+	lf: pl.LazyFrame,
+	results_path: Path,
+	key: str,
+	partitioned: bool = False,
+	metadata: dict[str, str] | None = None,
+	days: Sequence[int] | None = None,
+	ipc_compression: str | None = None,
+) -> None:
+	"""Write a table to ``results/``, replacing whatever was stored under ``key``.
+
+	Output is streamed to a temporary path and swapped in afterwards, so ``lf`` may
+	read from the table it replaces.
+
+	Args:
+		lf: table to write.
+		results_path: the project's ``results`` directory.
+		key: table name.
+		partitioned: write one ``day=N/part.parquet`` file per day. Tables without a
+			``day`` column, and empty tables, are always written as a single file.
+		metadata: parquet key-value metadata stored in every written file.
+		days: with a partitioned table already on disk, rewrite only these day
+			partitions (rows of other days in ``lf`` are ignored, listed days
+			without rows are removed). Ignored for single-file tables.
+		ipc_compression: write a single Arrow IPC file instead of parquet,
+			``"uncompressed"`` (read zero-copy) or ``"lz4"``. ``partitioned`` and
+			``days`` are then ignored.
+	"""
+	directory = results_path / key
+	file = results_path / f"{key}.parquet"
+	if ipc_compression is not None:
+		_write_ipc(lf, results_path, key, metadata, ipc_compression)
+		return
+	partitioned = partitioned and PARTITION_KEY in lf.collect_schema()
+	if days is not None and result_location(results_path, key) != directory:
+		days = None  # nothing partitioned to patch; write the whole table
+
+	if partitioned:
+		tmp = results_path / f"{key}.tmp"
+		shutil.rmtree(tmp, ignore_errors=True)
+		if days is not None:
+			lf = lf.filter(pl.col(PARTITION_KEY).is_in(list(days)))
+		lf.sink_parquet(
+			pl.PartitionBy(
+				tmp,
+				key=PARTITION_KEY,
+				include_key=True,
+				file_path_provider=lambda args: (
+					f"{PARTITION_KEY}={args.partition_keys[PARTITION_KEY][0]}/{PART_FILE}"
+				),
+				approximate_bytes_per_file=None,
+			),
+			compression="lz4",
+			metadata=metadata,
+			engine="streaming",
+			mkdir=True,
+		)
+		written = _part_files(tmp) if tmp.is_dir() else []
+
+		if days is not None:
+			for day in days:
+				shutil.rmtree(directory / f"{PARTITION_KEY}={day}", ignore_errors=True)
+			for part in written:
+				target = directory / part.parent.name
+				target.mkdir()
+				part.replace(target / PART_FILE)
+			shutil.rmtree(tmp, ignore_errors=True)
+			return
+
+		if written:
+			shutil.rmtree(directory, ignore_errors=True)
+			tmp.replace(directory)
+			file.unlink(missing_ok=True)
+			_remove_ipc(results_path, key)
+			return
+		shutil.rmtree(tmp, ignore_errors=True)
+
+	tmp_file = results_path / f"{key}.parquet.tmp"
+	lf.sink_parquet(tmp_file, compression="lz4", metadata=metadata, engine="streaming")
+	tmp_file.replace(file)
+	shutil.rmtree(directory, ignore_errors=True)
+	_remove_ipc(results_path, key)
+
+
+def _write_ipc(
+	lf: pl.LazyFrame,
+	results_path: Path,
+	key: str,
+	metadata: dict[str, str] | None,
+	compression: str,
+) -> None:
+	file = results_path / f"{key}{IPC_SUFFIX}"
+	tmp_file = results_path / f"{key}{IPC_SUFFIX}.tmp"
+	lf.sink_ipc(tmp_file, compression=compression, engine="streaming")
+	# The old metadata (and fingerprint) goes first and the new one is swapped in
+	# only after the data: a crash in between leaves the table without a
+	# fingerprint, to be recomputed, never new metadata next to old data.
+	sidecar = results_path / f"{key}{IPC_METADATA_SUFFIX}"
+	sidecar.unlink(missing_ok=True)
+	# Renaming leaves readers that mapped the old file reading it until they close it.
+	tmp_file.replace(file)
+	if metadata:
+		tmp_sidecar = results_path / f"{key}{IPC_METADATA_SUFFIX}.tmp"
+		tmp_sidecar.write_text(json.dumps(metadata))
+		tmp_sidecar.replace(sidecar)
+	(results_path / f"{key}.parquet").unlink(missing_ok=True)
+	shutil.rmtree(results_path / key, ignore_errors=True)
+
+
+def _remove_ipc(results_path: Path, key: str) -> None:
+	(results_path / f"{key}{IPC_SUFFIX}").unlink(missing_ok=True)
+	(results_path / f"{key}{IPC_METADATA_SUFFIX}").unlink(missing_ok=True)
+
+
+def remove_result(results_path: Path, key: str) -> None:
+	"""Delete the table stored under ``key``, in any layout, if there is one."""
+	(results_path / f"{key}.parquet").unlink(missing_ok=True)
+	shutil.rmtree(results_path / key, ignore_errors=True)
+	_remove_ipc(results_path, key)
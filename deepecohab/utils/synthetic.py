@@ -0,0 +1,398 @@
+import datetime as dt
+import heapq
+import random
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import polars as pl
+
+# Boards -> (cages on the ring, antennas per board, raw file prefix). One board reads
+# all 8 antennas of the default 4-cage EcoHab; four boards read 4 antennas each of the
+# 8-cage field layout, renamed by the field config's ``antenna_rename_scheme``.
+LAYOUTS = {1: (4, 8, "20"), 4: (8, 4, "COM")}
+
+# Share of an animal's movements that are a read on a cage antenna without crossing
+# the tunnel (a poke into the tube), and how much more active the dark phase is.
+_PEEK_PROBABILITY = 0.3
+_DARK_ACTIVITY = 1.6
+_LIGHT_ACTIVITY = 0.4
+_HOUR_MS = 3_600_000
+
+
+@dataclass
+class SyntheticDataset:
+	"""Raw EcoHab registrations written by :func:`generate_raw_data`.
+
+	Attributes:
+		data_path: directory holding the hourly raw ``.txt`` files.
+		boards: number of boards (COM ports) that recorded the data.
+		fname_prefix: prefix of the raw file names.
+		timezone: IANA timezone the wall-clock times are written in.
+		light_phase_start: wall-clock start of the light phase.
+		dark_phase_start: wall-clock start of the dark phase.
+		start: first instant of the recording (UTC).
+		finish: last instant of the recording (UTC).
+		animal_ids: tags of the simulated animals.
+		ghost_ids: tags read too rarely to be animals (see ``min_antenna_crossings``).
+		n_reads: registrations written, ghost reads included.
+		n_chases: chasings simulated: one animal following another through a tunnel.
+		n_tube_tests: head-on tunnel encounters simulated.
+		n_files: raw files written.
+	"""
+
+	data_path: Path
+	boards: int
+	fname_prefix: str
+	timezone: str
+	light_phase_start: str
+	dark_phase_start: str
+	start: dt.datetime
+	finish: dt.datetime
+	animal_ids: list[str] = field(default_factory=list)
+	ghost_ids: list[str] = field(default_factory=list)
+	n_reads: int = 0
+	n_chases: int = 0
+	n_tube_tests: int = 0
+	n_files: int = 0
+
+	def project_kwargs(self) -> dict[str, Any]:
+		"""Arguments of ``create_ecohab_project`` for a project on this data."""
+		return {
+			"data_path": self.data_path,
+			"timezone": self.timezone,
+			"light_phase_start": self.light_phase_start,
+			"dark_phase_start": self.dark_phase_start,
+			"field_ecohab": self.boards > 1,
+		}
+
+	def structure_kwargs(self) -> dict[str, Any]:
+		"""Arguments of ``get_ecohab_data_structure`` that read this data."""
+		return {
+			"fname_prefix": self.fname_prefix,
+			"custom_layout": self.boards > 1,
+			"sanitize_animal_ids": True,
+			"min_antenna_crossings": 100,
+		}
+
+
+class _Simulation:
+	"""Animals moving around a ring of cages joined by tunnels, one event at a time.
+
+	Tunnel ``i`` joins cage ``i`` to cage ``i + 1`` (cyclically) and is read by
+	antenna ``2i + 1`` on the cage ``i`` side and ``2i + 2`` on the other, which is
+	how the bundled default and field layouts number them. Every animal rests in a
+	cage for an exponential time, shorter in the dark phase, then either pokes into
+	a tunnel (one read on a cage antenna) or crosses it (entry and exit reads). A
+	crossing may be chased: a resting cagemate enters the tunnel behind it and exits
+	just after it, and the same pair may go on to chase through the next tunnels. Or
+	it may end in a tube test: an animal resting in the cage ahead enters from the
+	other end, and the crossing animal retreats with the other one behind it.
+	"""
+
+	def __init__(
+		self,
+		n_animals: int,
+		n_cages: int,
+		start_ms: int,
+		finish_ms: int,
+		reads_per_hour: float,
+		chase_probability: float,
+		burst_probability: float,
+		tube_test_probability: float,
+		is_dark: Callable[[int], bool],
+		rng: random.Random,
+	):
+		self.n_cages = n_cages
+		self.finish_ms = finish_ms
+		# Events per millisecond at activity 1: a crossing is two reads, a peek one.
+		self.rate = reads_per_hour / (2 - _PEEK_PROBABILITY) / _HOUR_MS
+		self.chase_probability = chase_probability
+		self.burst_probability = burst_probability
+		self.tube_test_probability = tube_test_probability
+		self.is_dark = is_dark
+		self.rng = rng
+		self.cage = [rng.randrange(n_cages) for _ in range(n_animals)]
+		self.busy_until = [start_ms] * n_animals
+		self.version = [0] * n_animals
+		self.partner: dict[int, int] = {}
+		self.n_chases = 0
+		self.n_tube_tests = 0
+		self.reads: tuple[list[int], list[int], list[int]] = ([], [], [])
+		self.queue: list[tuple[int, int, int]] = []
+		for animal in range(n_animals):
+			self._schedule(animal, self._dwell(start_ms) + start_ms)
+
+	def _dwell(self, t: int) -> int:
+		activity = _DARK_ACTIVITY if self.is_dark(t) else _LIGHT_ACTIVITY
+		return max(1, round(self.rng.expovariate(self.rate * activity)))
+
+	def _schedule(self, animal: int, t: int) -> None:
+		self.version[animal] += 1
+		if t < self.finish_ms:
+			heapq.heappush(self.queue, (t, animal, self.version[animal]))
+
+	def _read(self, t: int, animal: int, antenna: int) -> None:
+		times, antennas, animals = self.reads
+		times.append(t)
+		antennas.append(antenna)
+		animals.append(animal)
+
+	def _resting(self, animal: int, cage: int, t: int) -> bool:
+		return self.cage[animal] == cage and self.busy_until[animal] < t
+
+	def _tunnel(self, cage: int, forward: bool) -> tuple[int, int, int]:
+		"""Entry antenna, exit antenna and destination cage of a crossing."""
+		if forward:
+			return 2 * cage + 1, 2 * cage + 2, (cage + 1) % self.n_cages
+		tunnel = (cage - 1) % self.n_cages
+		return 2 * tunnel + 2, 2 * tunnel + 1, tunnel
+
+	def _others(self, animal: int, cage: int, t: int) -> list[int]:
+		return [a for a in range(len(self.cage)) if a != animal and self._resting(a, cage, t)]
+
+	def _chase(self, t: int, animal: int, chaser: int) -> None:
+		"""``chaser`` follows ``animal`` through the tunnel, possibly chasing on after."""
+		rng = self.rng
+		entry, exit_, destination = self._tunnel(self.cage[animal], rng.random() < 0.5)
+		crossing = rng.randint(1_000, 2_500)
+		# The chaser enters while the chased animal is still in the tunnel and leaves
+		# right behind it, inside the default chasing window.
+		chaser_exit = t + crossing + rng.randint(100, 800)
+		self._read(t, animal, entry)
+		self._read(t + crossing - rng.randint(200, min(1_000, crossing - 100)), chaser, entry)
+		self._read(t + crossing, animal, exit_)
+		self._read(chaser_exit, chaser, exit_)
+		self.cage[animal] = self.cage[chaser] = destination
+		self.busy_until[animal], self.busy_until[chaser] = t + crossing, chaser_exit
+		self.n_chases += 1
+
+		next_departure = t + crossing + self._dwell(t)
+		chaser_departure = chaser_exit + self._dwell(t)
+		if rng.random() < self.burst_probability:
+			# The chased animal moves on soon, its chaser waiting for it.
+			next_departure = chaser_exit + rng.randint(2_000, 30_000)
+			chaser_departure += next_departure - chaser_exit
+			self.partner[animal] = chaser
+		self._schedule(animal, next_departure)
+		self._schedule(chaser, chaser_departure)
+
+	def _tube_test(self, t: int, animal: int, winner: int, entry: int, exit_: int) -> None:
+		"""``animal`` meets ``winner`` head-on in the tunnel, retreats and is followed."""
+		rng = self.rng
+		retreat = t + rng.randint(1_500, 4_000)
+		winner_exit = retreat + rng.randint(200, 1_500)
+		self._read(t, animal, entry)
+		self._read(t + rng.randint(200, retreat - t - 500), winner, exit_)
+		self._read(retreat, animal, entry)
+		self._read(winner_exit, winner, entry)
+		self.cage[winner] = self.cage[animal]
+		self.busy_until[animal], self.busy_until[winner] = retreat, winner_exit
+		self.n_tube_tests += 1
+		self._schedule(animal, retreat + self._dwell(t))
+		self._schedule(winner, winner_exit + self._dwell(t))
+
+	def _cross(self, t: int, animal: int) -> None:
+		rng = self.rng
+		entry, exit_, destination = self._tunnel(self.cage[animal], rng.random() < 0.5)
+		if rng.random() < self.tube_test_probability and (
+			rivals := self._others(animal, destination, t)
+		):
+			self._tube_test(t, animal, rng.choice(rivals), entry, exit_)
+			return
+		crossing = rng.randint(1_500, 6_000)
+		self._read(t, animal, entry)
+		self._read(t + crossing, animal, exit_)
+		self.cage[animal] = destination
+		self.busy_until[animal] = t + crossing
+		self._schedule(animal, t + crossing + self._dwell(t))
+
+	def run(self) -> None:
+		"""Simulate every animal until the end of the recording."""
+		rng = self.rng
+		while self.queue:
+			t, animal, version = heapq.heappop(self.queue)
+			if version != self.version[animal]:
+				continue
+			cage = self.cage[animal]
+			chaser = self.partner.pop(animal, None)
+			if chaser is not None and self._resting(chaser, cage, t):
+				self._chase(t, animal, chaser)
+			elif rng.random() < _PEEK_PROBABILITY:
+				self._read(t, animal, self._tunnel(cage, rng.random() < 0.5)[0])
+				self.busy_until[animal] = t
+				self._schedule(animal, t + self._dwell(t))
+			elif rng.random() < self.chase_probability and (
+				cagemates := self._others(animal, cage, t)
+			):
+				self._chase(t, animal, rng.choice(cagemates))
+			else:
+				self._cross(t, animal)
+
+
+def _tag(rng: random.Random) -> str:
+	return f"{rng.getrandbits(40):010X}"
+
+
+def generate_raw_data(
+	data_path: str | Path,
+	animals: int = 8,
+	days: float = 3,
+	boards: int = 1,
+	reads_per_hour: float = 50.0,
+	chase_probability: float = 0.05,
+	burst_probability: float = 0.5,
+	tube_test_probability: float = 0.02,
+	ghost_tags: int = 2,
+	start: dt.datetime = dt.datetime(2023, 10, 27, 12),
+	timezone: str = "Europe/Warsaw",
+	light_phase_start: str = "07:00:00",
+	dark_phase_start: str = "19:00:00",
+	seed: int = 0,
+) -> SyntheticDataset:
+	"""Write simulated raw EcoHab registrations in the format ``load_data`` reads.
+
+	Animals move between the cages of the layout the board count selects, more in
+	the dark phase than in the light phase, poke into tunnels, chase each other in
+	bursts and meet head-on in tunnels (see :class:`_Simulation`). Each board's reads
+	are written in recorded order to hourly tab-separated files
+	(``<YYYYMMDD>_<HH>0000.txt`` for one board, ``COM<n>_<YYYYMMDD>_<HH>0000.txt``
+	for several) as local wall-clock times, so a recording spanning a DST change
+	repeats (autumn) or skips (spring) an hour the way a real one does; the default
+	start crosses the October 2023 change in Europe/Warsaw. Ghost tags are added
+	with fewer reads than the default ``min_antenna_crossings``.
+
+	The output depends only on the arguments, so a benchmark can regenerate the
+	same data at every run.
+
+	Args:
+		data_path: directory the files are written to; created if missing.
+		animals: number of animals.
+		days: length of the recording in days.
+		boards: ``1`` for the default 4-cage layout, ``4`` for the field layout.
+		reads_per_hour: mean reads per animal and hour over a day with equally
+			long phases.
+		chase_probability: chance that a tunnel crossing is chased by a resting
+			cagemate.
+		burst_probability: chance that a chase goes on through the next tunnel.
+		tube_test_probability: chance that a crossing meets an animal resting in
+			the cage ahead head-on.
+		ghost_tags: number of ghost tags.
+		start: start of the recording, local wall-clock time unless timezone-aware.
+		timezone: IANA timezone the boards' clocks run in.
+		light_phase_start: wall-clock start of the light phase.
+		dark_phase_start: wall-clock start of the dark phase.
+		seed: random seed.
+
+	Raises:
+		ValueError: ``boards`` has no bundled layout.
+
+	Returns:
+		A :class:`SyntheticDataset` describing the written data.
+	"""
+	if boards not in LAYOUTS:
+		raise ValueError(f"boards must be one of {sorted(LAYOUTS)}, got {boards}")
+	n_cages, antennas_per_board, fname_prefix = LAYOUTS[boards]
+	data_path = Path(data_path)
+	data_path.mkdir(parents=True, exist_ok=True)
+
+	zone = ZoneInfo(timezone)
+	if start.tzinfo is None:
+		start = start.replace(tzinfo=zone)
+	start = start.astimezone(dt.UTC)
+	finish = start + dt.timedelta(days=days)
+	start_ms, finish_ms = (round(t.timestamp() * 1000) for t in (start, finish))
+
+	light, dark = (dt.time.fromisoformat(t) for t in (light_phase_start, dark_phase_start))
+
+	def is_dark(t: int) -> bool:
+		wall = dt.datetime.fromtimestamp(t / 1000, zone).time()
+		return not (light <= wall < dark) if light < dark else dark <= wall < light
+
+	rng = random.Random(seed)
+	tags: list[str] = []
+	while len(tags) < animals + ghost_tags:
+		if (tag := _tag(rng)) not in tags:
+			tags.append(tag)
+	animal_ids, ghost_ids = tags[:animals], tags[animals:]
+
+	simulation = _Simulation(
+		animals,
+		n_cages,
+		start_ms,
+		finish_ms,
+		reads_per_hour,
+		chase_probability,
+		burst_probability,
+		tube_test_probability,
+		is_dark,
+		rng,
+	)
+	simulation.run()
+	times, antennas, tag_index = simulation.reads
+	for ghost in range(ghost_tags):
+		for _ in range(rng.randint(3, 60)):
+			times.append(rng.randrange(start_ms, finish_ms))
+			antennas.append(rng.randint(1, 2 * n_cages))
+			tag_index.append(animals + ghost)
+	time_under = np.random.default_rng(seed).integers(20, 901, len(times))
+
+	# The boards log a read when it ends; main_df's datetime is that end, so the
+	# written time is the end minus the time the tag spent under the antenna.
+	wall_end = (
+		pl.from_epoch("end", time_unit="ms")
+		.dt.replace_time_zone("UTC")
+		.dt.convert_time_zone(timezone)
+		.dt.replace_time_zone(None)
+	)
+	board = (pl.col("antenna") - 1) // antennas_per_board + 1
+	file = wall_end.dt.strftime("%Y%m%d_%H0000.txt")
+	if boards > 1:
+		file = pl.format("COM{}_{}", board, file)
+	raw = (
+		pl.DataFrame(
+			{"end": times, "antenna": antennas, "time_under": time_under, "tag": tag_index},
+			schema={"end": pl.Int64, "antenna": pl.Int64, "time_under": pl.Int64, "tag": pl.UInt32},
+		)
+		.with_columns(board.alias("board"))
+		.sort("board", "end")
+		.select(
+			file.alias("file"),
+			(wall_end - pl.duration(milliseconds=pl.col("time_under"))).alias("start"),
+			((pl.col("antenna") - 1) % antennas_per_board + 1).alias("antenna"),
+			"time_under",
+			pl.lit(pl.Series(tags)).gather(pl.col("tag")).alias("animal_id"),
+		)
+		.select(
+			"file",
+			pl.int_range(1, pl.len() + 1).over("file").alias("ind"),
+			pl.col("start").dt.strftime("%Y.%m.%d").alias("date"),
+			pl.col("start").dt.strftime("%H:%M:%S%.3f").alias("time"),
+			"antenna",
+			"time_under",
+			"animal_id",
+		)
+	)
+	files = raw.partition_by("file", as_dict=True, include_key=False, maintain_order=True)
+	for (name,), part in files.items():
+		part.write_csv(data_path / name, separator="\t", include_header=False)
+
+	return SyntheticDataset(
+		data_path=data_path,
+		boards=boards,
+		fname_prefix=fname_prefix,
+		timezone=timezone,
+		light_phase_start=light_phase_start,
+		dark_phase_start=dark_phase_start,
+		start=start,
+		finish=finish,
+		animal_ids=animal_ids,
+		ghost_ids=ghost_ids,
+		n_reads=raw.height,
+		n_chases=simulation.n_chases,
+		n_tube_tests=simulation.n_tube_tests,
+		n_files=len(files),
+	)
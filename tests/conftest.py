@@ -0,0 +1,62 @@
+"""Shared fixtures: small projects on the bundled example data.
+
+``make_project`` creates a project from any subset of the example recordings
+(usable from fixtures of any scope); ``project`` is the half-day project most
+pipeline tests run on, with ``main_df`` built. Override ``project_build`` in a
+module to pass other keyword arguments to ``get_ecohab_data_structure``.
+"""
+
+import shutil
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+import deepecohab as d
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+EXAMPLE_FILES = sorted((REPO_ROOT / "examples" / "example_data").glob("*.txt"))
+# Half a day of recordings: enough for every step, fast enough to rebuild per test.
+HALF_DAY = EXAMPLE_FILES[:12]
+
+
+def _make_project(
+	root: Path, name: str, files: list[Path] = HALF_DAY, **project_kwargs
+) -> tuple[Path, Path]:
+	"""Create project ``name`` under ``root`` whose data directory holds copies of ``files``."""
+	data_dir = root / f"data_{name}"
+	data_dir.mkdir()
+	for f in files:
+		shutil.copy(f, data_dir / f.name)
+
+	config_path, _ = d.create_ecohab_project(
+		project_location=root,
+		experiment_name=name,
+		data_path=data_dir,
+		light_phase_start="00:00:00",
+		dark_phase_start="12:00:00",
+		interpolate_positions=True,
+		timezone="Europe/Warsaw",
+		**project_kwargs,
+	)
+	return config_path, data_dir
+
+
+@pytest.fixture(scope="session")
+def make_project() -> Callable[..., tuple[Path, Path]]:
+	"""``make_project(root, name, files=HALF_DAY, **project_kwargs) -> (config_path, data_dir)``."""
+	return _make_project
+
+
+@pytest.fixture()
+def project_build() -> dict:
+	"""Keyword arguments of ``get_ecohab_data_structure`` for ``project``."""
+	return {}
+
+
+@pytest.fixture()
+def project(tmp_path, make_project, project_build) -> Path:
+	"""Config path of a half-day example project with ``main_df`` built."""
+	config_path, _ = make_project(tmp_path, "project")
+	d.get_ecohab_data_structure(config_path, fname_prefix="20", **project_build)
+	return config_path
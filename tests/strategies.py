@@ -75,7 +75,7 @@ def aware(naive: list[dt.datetime], tz: str) -> pl.Series:
 
 
 def padding_frame(rows: list[dict], tz: str) -> pl.LazyFrame:
-	"""Frame shaped for auxfun._get_minute_padding, one input row per visit."""
+	"""Frame shaped for auxfun._get_padding, one input row per visit."""
 	return pl.LazyFrame(
 		{
 			"animal_id": pl.Series([r["animal_id"] for r in rows], dtype=pl.Enum(ANIMALS)),
@@ -0,0 +1,124 @@
+"""Artifact stores: where ``run_pipeline`` keeps step results.
+
+A run with ``save_data=False`` must compute every step without writing a result
+file, give the tables a disk run writes, and a :class:`MemoryStore` kept across
+runs must serve its results as a cache just like ``results/`` does.
+"""
+
+from contextvars import copy_context
+from pathlib import Path
+
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+import deepecohab as d
+from deepecohab.core import registries
+from deepecohab.core.registries import FINGERPRINT_KEY
+from deepecohab.utils import results_io
+from deepecohab.utils.artifact_store import ArtifactStore
+
+TARGETS = ["activity_df", "pairwise_rollup"]
+
+
+def _results(config_path: Path) -> set[str]:
+	return set(
+		results_io.list_results(Path(d.read_config(config_path)["project_location"]) / "results")
+	)
+
+
+def test_unsaved_run_writes_nothing(project):
+	before = _results(project)
+
+	events = list(d.df_registry.run_pipeline(project, targets=TARGETS, save_data=False))
+
+	assert [name for name, _, _ in events] == d.df_registry.last_report.steps
+	assert _results(project) == before
+	assert d.df_registry.last_report.bytes_written == 0
+
+
+@pytest.mark.parametrize("fused", [False, True])
+def test_memory_store_holds_the_disk_tables(project, fused):
+	store = d.MemoryStore(
+		fallback=d.DiskStore(Path(d.read_config(project)["project_location"]) / "results")
+	)
+	list(d.df_registry.run_pipeline(project, targets=TARGETS, fused=fused, store=store))
+	list(d.df_registry.run_pipeline(project, targets=TARGETS))
+
+	disk = d.DiskStore(Path(d.read_config(project)["project_location"]) / "results")
+	assert set(store) == set(d.df_registry.last_report.steps)
+	for step in store:
+		table, expected = store.get(step).collect(), disk.get(step).collect()
+		keys = [c for c, dtype in table.schema.items() if not dtype.is_float()]
+		assert_frame_equal(table.sort(keys), expected.sort(keys), check_row_order=False)
+		# Disk metadata also carries the Arrow schema written with the table.
+		assert store.metadata(step).items() <= disk.metadata(step).items(), step
+
+
+def test_memory_store_caches_across_runs(project):
+	store = d.MemoryStore()
+	list(d.df_registry.run_pipeline(project, targets=TARGETS, store=store))
+	fingerprints = {step: store.metadata(step)[FINGERPRINT_KEY] for step in store}
+
+	assert d.df_registry.stale_steps(project, targets=TARGETS, store=store) == []
+	assert d.df_registry.stale_steps(project, targets=TARGETS) != []
+
+	# A parameter change recomputes only the steps it reaches.
+	list(d.df_registry.run_pipeline(project, targets=TARGETS, store=store, minimum_time=5))
+	changed = {
+		step for step in fingerprints if store.metadata(step)[FINGERPRINT_KEY] != fingerprints[step]
+	}
+	assert "pairwise_meetings" in changed
+	assert "activity_df" not in changed
+
+
+def test_interleaved_runs_keep_their_own_state(project):
+	stores = {2: d.MemoryStore(), 5: d.MemoryStore()}
+	runs = [
+		d.df_registry.run_pipeline(project, targets=TARGETS, store=store, minimum_time=t)
+		for t, store in stores.items()
+	]
+	for _ in zip(*runs, strict=True):
+		# Between yields no run is active in the caller's context.
+		assert registries._ACTIVE_RUN.get() is None
+
+	alone = d.MemoryStore()
+	list(d.df_registry.run_pipeline(project, targets=TARGETS, store=alone, minimum_time=5))
+	assert set(stores[5]) == set(alone)
+	for step in alone:
+		assert stores[5].metadata(step) == alone.metadata(step), step
+	assert (
+		stores[2].metadata("pairwise_meetings")[FINGERPRINT_KEY]
+		!= alone.metadata("pairwise_meetings")[FINGERPRINT_KEY]
+	)
+
+	# A run abandoned halfway can be closed from any context.
+	run = d.df_registry.run_pipeline(project, targets=TARGETS, store=d.MemoryStore())
+	next(run)
+	copy_context().run(run.close)
+
+
+def test_memory_store_falls_back_for_reads_only(tmp_path):
+	disk = d.DiskStore(tmp_path)
+	disk.put("a", pl.LazyFrame({"x": [1]}), {FINGERPRINT_KEY: "1"})
+	store = d.MemoryStore(fallback=disk)
+
+	assert store.get("a").collect()["x"].to_list() == [1]
+	assert store.metadata("a")[FINGERPRINT_KEY] == "1"
+	assert "a" not in store
+
+	store.put("a", pl.DataFrame({"x": [2]}), {FINGERPRINT_KEY: "2"})
+	assert store.get("a").collect()["x"].to_list() == [2]
+	assert disk.metadata("a")[FINGERPRINT_KEY] == "1"
+
+	store.clear()
+	assert store.get("a").collect()["x"].to_list() == [1]
+
+
+def test_incomplete_store_fails_when_created():
+	class GetOnly(ArtifactStore):
+		def get(self, key):
+			return None
+
+	with pytest.raises(TypeError, match="abstract"):
+		GetOnly()
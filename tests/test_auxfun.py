@@ -7,7 +7,11 @@ import strategies as strat
 from hypothesis import given, settings
 from hypothesis import strategies as st
 
-from deepecohab.core.create_data_structure import calculate_time_spent
+from deepecohab.core.create_data_structure import (
+	apply_timezone_fix,
+	calculate_time_spent,
+	get_animal_position,
+)
 from deepecohab.utils import auxfun
 
 TZ_NAME = "Europe/Warsaw"
@@ -15,6 +19,10 @@ TZ = ZoneInfo(TZ_NAME)
 
 CFG = {"phase": {"light_phase": "07:00:00", "dark_phase": "20:00:00"}}
 
+# get_phase, get_day, get_hour and get_phase_count are deprecated wrappers kept
+# for callers outside the package; their labels are still checked here.
+pytestmark = pytest.mark.filterwarnings("ignore:auxfun.get_:DeprecationWarning")
+
 
 def aware_dt_series(values: list[dt.datetime]) -> pl.Series:
 	"""Build a zone-aware Datetime series in the project timezone."""
@@ -25,6 +33,13 @@ def at(*args: int) -> dt.datetime:
 	return dt.datetime(*args, tzinfo=TZ)
 
 
+def test_phase_labellers_are_deprecated():
+	df = pl.DataFrame({"datetime": aware_dt_series([at(2023, 6, 15, 12, 0, 0)])})
+	with pytest.warns(DeprecationWarning, match="label_calendar"):
+		out = df.with_columns(auxfun.get_phase(CFG), auxfun.get_day(), auxfun.get_hour())
+	assert out.row(0)[1:] == ("light_phase", 1, 12)
+
+
 @pytest.mark.parametrize(
 	"hour,minute,expected",
 	[
@@ -295,6 +310,56 @@ def test_time_spent_matches_reference_oracle(rows, tz):
 	assert out["time_spent"].to_list() == expected
 
 
+@given(
+	pairs=strat.antenna_combinations,
+	reads=st.lists(
+		st.tuples(st.sampled_from(strat.ANIMALS[:3]), st.integers(1, 12)), min_size=1, max_size=30
+	),
+)
+def test_animal_position_matches_pair_lookup(pairs, reads):
+	"""The dense integer lookup names the same position as the ``"<prev>_<curr>"``
+	key, with ``0`` before each animal's first read and ``undefined`` for unmapped
+	pairs (including antennas beyond the configured ones).
+	"""
+	lf = pl.LazyFrame(reads, schema={"animal_id": pl.String, "antenna": pl.UInt8}, orient="row")
+
+	out = get_animal_position(lf, pairs).collect()
+
+	previous: dict[str, int] = {}
+	expected = []
+	for animal, antenna in reads:
+		expected.append(pairs.get(f"{previous.get(animal, 0)}_{antenna}", "undefined"))
+		previous[animal] = antenna
+	assert out["position"].cast(pl.String).to_list() == expected
+	assert out["position"].dtype == pl.Enum(sorted({*pairs.values(), "undefined"}))
+
+
+def test_timezone_fix_resolves_every_fall_back_per_board():
+	"""Reads every 10 min across two autumn transitions, on two boards whose
+	rows are not interleaved in time, localize back to their true instants.
+	"""
+	tz = "Europe/Warsaw"
+	instants = [
+		start + dt.timedelta(minutes=10 * i)
+		for start in (
+			dt.datetime(2023, 10, 28, 23, 0, tzinfo=dt.UTC),
+			dt.datetime(2024, 10, 26, 23, 0, tzinfo=dt.UTC),
+		)
+		for i in range(24)
+	]
+	truth = pl.Series("datetime", instants).dt.convert_time_zone(tz)
+	board = pl.DataFrame({"datetime": truth}).with_columns(
+		pl.col("datetime").dt.replace_time_zone(None)
+	)
+	lf = pl.concat(
+		[board.with_columns(COM=pl.lit("COM1")), board.with_columns(COM=pl.lit("COM2"))]
+	).lazy()
+
+	out = apply_timezone_fix(lf, tz, by="COM").collect()
+
+	assert out["datetime"].to_list() == [*truth, *truth]
+
+
 @given(
 	animals=strat.animal_id_lists,
 	positions=st.lists(st.sampled_from(strat.CAGES), min_size=0, max_size=4, unique=True),
@@ -334,6 +399,62 @@ def test_build_animal_grid_rejects_bad_columns():
 		auxfun.build_animal_grid({"animal_ids": ["A", "B"]}, ("a", "b", "c"))
 
 
+GRID_CFG = {
+	"animal_ids": ["A", "B", "C"],
+	"cages": ["cage_1", "cage_2"],
+	"positions": ["cage_1", "cage_2", "undefined"],
+	"timezone": "Europe/Warsaw",
+	"phase": {"light_phase": "07:00:00", "dark_phase": "19:00:00"},
+	"experiment_timeline": {
+		"start_date": "2023-05-24 12:30:00+02:00",
+		"finish_date": "2023-05-26 11:10:00+02:00",
+	},
+}
+
+
+def _sparse_pairs(cfg: dict) -> pl.LazyFrame:
+	"""One observed cell of a pair table, keyed like the grid."""
+	cell = auxfun.build_time_grid(cfg).filter(pl.col("day") == 2).head(1)
+	pair = auxfun.build_animal_grid(cfg, ("animal_id", "animal_id_2"), False, ["cage_2"])
+	return cell.join(pair.head(1), how="cross").with_columns(pl.lit(5.0).alias("time_together"))
+
+
+def test_densify_fills_the_grid_with_zeros():
+	"""Every time x pair x position cell is present; the observed one keeps its value."""
+	sparse = _sparse_pairs(GRID_CFG)
+	n_hours = auxfun.build_time_grid(GRID_CFG).collect().height
+
+	dense = auxfun.densify(
+		sparse, GRID_CFG, ("animal_id", "animal_id_2"), ordered=False, positions="cages"
+	).collect()
+
+	assert dense.height == n_hours * 3 * 2
+	assert dense["time_together"].sum() == 5.0
+	assert (dense["time_together"] > 0).sum() == 1
+	assert dense.join(sparse.collect(), on=dense.columns, how="semi").height == 1
+
+
+def test_densify_restricts_the_grid_to_filters_and_time_columns():
+	sparse = _sparse_pairs(GRID_CFG)
+	grid = {"columns": ["animal_id", "animal_id_2"], "ordered": False, "positions": "cages"}
+	time_grid = auxfun.build_time_grid(GRID_CFG).collect()
+
+	day_two = auxfun.densify(sparse, GRID_CFG, **grid, days_range=[2, 2]).collect()
+	assert day_two["day"].unique().to_list() == [2]
+	assert day_two.height == time_grid.filter(pl.col("day") == 2).height * 3 * 2
+
+	per_phase = auxfun.densify(
+		sparse.drop("hour"),
+		GRID_CFG,
+		**grid,
+		time_columns=["phase", "day", "phase_count"],
+		phase_type=["dark_phase"],
+	).collect()
+	phases = time_grid.filter(pl.col("phase") == "dark_phase").select("day", "phase_count")
+	assert "hour" not in per_phase.columns
+	assert per_phase.height == phases.unique().height * 3 * 2
+
+
 @given(
 	positions=st.lists(
 		st.sampled_from(strat.CAGES + strat.DIRECTIONAL_TUNNELS + ["undefined"]),
@@ -350,3 +471,23 @@ def test_remove_tunnel_directionality_maps_only_tunnels(positions, tunnels):
 	out = auxfun.remove_tunnel_directionality(lf, {"tunnels": tunnels}).collect()
 	assert out["position"].to_list() == [tunnels.get(p, p) for p in positions]
 	assert out.schema["position"] == pl.Categorical
+
+
+@settings(max_examples=50, deadline=None)
+@given(
+	positions=st.lists(
+		st.sampled_from(strat.CAGES + strat.DIRECTIONAL_TUNNELS + ["undefined"]),
+		max_size=20,
+	),
+	tunnels=strat.tunnels_maps,
+)
+def test_remove_tunnel_directionality_remaps_enum_codes(positions, tunnels):
+	"""Enum positions are remapped by code and stay an Enum holding every name."""
+	enum = auxfun.get_position_enum(
+		{"antenna_combinations": {}, "tunnels": {}, "positions": positions}
+	)
+	lf = pl.LazyFrame({"position": pl.Series(positions, dtype=enum)})
+	out = auxfun.remove_tunnel_directionality(lf, {"tunnels": tunnels}).collect()
+	assert out["position"].to_list() == [tunnels.get(p, p) for p in positions]
+	assert isinstance(out.schema["position"], pl.Enum)
+	assert {tunnels.get(p, p) for p in positions} <= set(out.schema["position"].categories)
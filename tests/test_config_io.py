@@ -176,7 +176,7 @@ def test_padded_df_writes_and_caches(tmp_path):
 		"project_location": str(tmp_path),
 		"phase": {"light_phase": "07:00:00", "dark_phase": "20:00:00"},
 	}
-	parquet = tmp_path / "results" / "padded_df.parquet"
+	parquet = tmp_path / "results" / "padded_df@1m.parquet"
 
 	auxfun.padded_df(_padding_lf(), cfg, save_data=True, overwrite=False)
 	assert parquet.exists()
@@ -192,4 +192,4 @@ def test_padded_df_no_save(tmp_path):
 		"phase": {"light_phase": "07:00:00", "dark_phase": "20:00:00"},
 	}
 	auxfun.padded_df(_padding_lf(), cfg, save_data=False, overwrite=True)
-	assert not (tmp_path / "results" / "padded_df.parquet").exists()
+	assert not (tmp_path / "results" / "padded_df@1m.parquet").exists()
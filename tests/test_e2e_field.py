@@ -21,6 +21,7 @@ import pytest
 
 import deepecohab as d
 from deepecohab.utils import auxfun_plots
+from deepecohab.utils.project_store import ProjectStore
 
 pytestmark = pytest.mark.e2e
 
@@ -105,6 +106,7 @@ def field_project(tmp_path_factory) -> Path:
 		sanitize_animal_ids=True,
 		min_antenna_crossings=100,
 		custom_layout=True,  # field layout renames antennas per board
+		padded=["1m"],  # no step reads padded tables; build one to cover padded_df
 	)
 
 	steps_run = [
@@ -125,9 +127,9 @@ def cfg(field_project) -> dict:
 
 
 @pytest.fixture(scope="session")
-def store(field_project) -> dict[str, pl.DataFrame]:
-	"""Eager dataframes for every registered key, as the dashboard assembles them."""
-	return {key: d.load_ecohab_data(field_project, key, return_df=True) for key in DF_KEYS}
+def store(field_project) -> ProjectStore:
+	"""Lazy project store over the produced tables, as the dashboard assembles it."""
+	return ProjectStore(d.read_config(field_project))
 
 
 def _plot_config(store, cfg, **switches) -> auxfun_plots.PlotConfig:
@@ -212,7 +214,8 @@ def test_main_df_schema_and_values(field_project, cfg):
 def test_dataframe_produced_and_nonempty(field_project, key):
 	"""Every registered data key was sunk to parquet and loads as a non-empty frame."""
 	results = Path(d.read_config(field_project)["project_location"]) / "results"
-	assert (results / f"{key}.parquet").is_file(), f"{key}.parquet not written"
+	stored = key if key != "padded_df" else "padded_df@1m"  # padded tables are per resolution
+	assert (results / f"{stored}.parquet").is_file(), f"{stored}.parquet not written"
 
 	lf = d.load_ecohab_data(field_project, key)
 	assert isinstance(lf, pl.LazyFrame)
@@ -0,0 +1,83 @@
+"""Fingerprint-based cache invalidation of analysis steps.
+
+Runs the real pipeline on a half-day slice of the bundled example data and checks
+that only the steps whose inputs changed (and their descendants) are stale and
+recomputed, make-style.
+"""
+
+from pathlib import Path
+
+import polars as pl
+import pytest
+import toml
+
+import deepecohab as d
+from deepecohab.core.registries import FINGERPRINT_KEY, read_fingerprint
+
+CHASING_BRANCH = ["match_df", "chasings_df", "chasings_rollup", "ranking", "feature_df"]
+
+
+@pytest.fixture()
+def project(project) -> Path:
+	list(d.df_registry.run_pipeline(project))
+	return project
+
+
+def _result(config_path: Path, key: str) -> Path:
+	return Path(d.read_config(config_path)["project_location"]) / "results" / f"{key}.parquet"
+
+
+def test_results_carry_fingerprints(project):
+	for step in d.df_registry.analysis_steps:
+		assert read_fingerprint(_result(project, step).parent, step) == d.df_registry.fingerprint(
+			step, project
+		)
+	assert d.df_registry.stale_steps(project) == []
+
+
+def test_changed_kwarg_reruns_only_its_branch(project):
+	pairwise_mtime = _result(project, "pairwise_meetings").stat().st_mtime_ns
+	match_mtime = _result(project, "match_df").stat().st_mtime_ns
+
+	window = [0.1, 1.5]
+	assert d.df_registry.stale_steps(project, chasing_time_window=window) == CHASING_BRANCH
+
+	list(d.df_registry.run_pipeline(project, chasing_time_window=window))
+
+	assert d.df_registry.stale_steps(project, chasing_time_window=window) == []
+	assert _result(project, "pairwise_meetings").stat().st_mtime_ns == pairwise_mtime
+	assert _result(project, "match_df").stat().st_mtime_ns != match_mtime
+
+
+def test_equivalent_kwarg_values_share_a_fingerprint(project):
+	# Defaults passed explicitly, and lists vs tuples, do not invalidate anything.
+	assert d.df_registry.stale_steps(project, chasing_time_window=[0.1, 1.2], minimum_time=2) == []
+	# Kwargs no step takes are ignored.
+	assert d.df_registry.stale_steps(project, unrelated=True) == []
+
+
+def test_config_change_invalidates_dependent_steps(project):
+	cfg = toml.load(project)
+	cfg["phase"]["dark_phase"] = "13:00:00"
+	with open(project, "w") as f:
+		toml.dump(cfg, f)
+
+	assert d.df_registry.stale_steps(project) == d.df_registry.analysis_steps
+
+
+def test_rebuilt_data_structure_invalidates_steps(project):
+	d.get_ecohab_data_structure(project, fname_prefix="20", overwrite=True)
+
+	stale = d.df_registry.stale_steps(project)
+	assert "pairwise_meetings" in stale and "match_df" in stale
+
+
+def test_result_without_fingerprint_is_recomputed(project):
+	path = _result(project, "tube_test_df")
+	pl.read_parquet(path).write_parquet(path)  # legacy file: no metadata
+
+	assert "tube_test_df" in d.df_registry.stale_steps(project)
+	d.calculate_tube_test(project)
+	assert pl.read_parquet_metadata(path)[FINGERPRINT_KEY] == d.df_registry.fingerprint(
+		"tube_test_df", project
+	)
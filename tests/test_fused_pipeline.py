@@ -0,0 +1,95 @@
+"""Fused pipeline mode: every stale step materialised in one ``pl.collect_all``.
+
+A fused run must write exactly the tables (and fingerprints) a step-by-step run
+writes, compute a step read by several others only once, skip cached steps, and
+report its wall time and table I/O.
+"""
+
+from pathlib import Path
+
+import polars as pl
+from polars.testing import assert_frame_equal
+
+import deepecohab as d
+from deepecohab.core.registries import DataFrameRegistry
+from deepecohab.utils import auxfun, results_io
+
+
+def _tables(config_path: Path) -> dict[str, tuple[pl.DataFrame, dict[str, str]]]:
+	results = Path(d.read_config(config_path)["project_location"]) / "results"
+	tables = {}
+	for step in d.df_registry.analysis_steps:
+		location = results_io.result_location(results, step)
+		tables[step] = (results_io.read_result(location), results_io.result_metadata(location))
+	return tables
+
+
+def test_fused_run_writes_the_step_by_step_tables(project):
+	list(d.df_registry.run_pipeline(project))
+	expected = _tables(project)
+
+	events = list(d.df_registry.run_pipeline(project, fused=True, overwrite=True))
+
+	assert sorted(name for name, _, _ in events) == sorted(d.df_registry.analysis_steps)
+	assert [current for _, current, _ in events] == list(range(1, len(events) + 1))
+	for step, (table, metadata) in _tables(project).items():
+		keys = [c for c, dtype in table.schema.items() if not dtype.is_float()]
+		assert_frame_equal(table.sort(keys), expected[step][0].sort(keys), check_row_order=False)
+		assert metadata == expected[step][1], step
+	assert d.df_registry.stale_steps(project) == []
+
+
+def test_compare_modes_reports_both_runs(project):
+	reports = d.df_registry.compare_modes(project, targets=["pairwise_rollup"])
+
+	assert reports["steps"].mode == "steps" and reports["fused"].mode == "fused"
+	for report in reports.values():
+		assert report.steps == ["intervals", "pairwise_meetings", "pairwise_rollup"]
+		assert report.wall_seconds > 0
+		assert report.bytes_written > 0
+	# Step by step, pairwise_meetings reads intervals and the rollup reads pairwise
+	# back from disk; fused, only main_df is scanned.
+	assert reports["fused"].bytes_read < reports["steps"].bytes_read
+
+
+def _counting_registry(calls: list[str]) -> DataFrameRegistry:
+	"""``shared`` is read by two steps; each step records when its frame is computed."""
+	reg = DataFrameRegistry()
+
+	def counted(name: str, lf: pl.LazyFrame) -> pl.LazyFrame:
+		def record(s: pl.Series) -> pl.Series:
+			calls.append(name)
+			return s
+
+		return lf.with_columns(pl.col("x").map_batches(record, return_dtype=pl.Int64))
+
+	@reg.register_step("shared")
+	def _shared(cfg, **kwargs):
+		return counted("shared", pl.LazyFrame({"x": [1, 2, 3]}))
+
+	@reg.register_step("double", requires=["shared"])
+	def _double(cfg, **kwargs):
+		return auxfun._get_data(cfg, "shared").select(pl.col("x") * 2)
+
+	@reg.register_step("total", requires=["shared"])
+	def _total(cfg, **kwargs):
+		return auxfun._get_data(cfg, "shared").select(pl.sum("x"))
+
+	return reg
+
+
+def test_fused_run_computes_shared_steps_once(tmp_path):
+	(tmp_path / "results").mkdir()
+	cfg = {"project_location": str(tmp_path)}
+	calls: list[str] = []
+	reg = _counting_registry(calls)
+
+	list(reg.run_pipeline(cfg, fused=True))
+
+	assert calls == ["shared"]
+	total = pl.read_parquet(tmp_path / "results" / "total.parquet")
+	assert total["x"].to_list() == [6]
+
+	list(reg.run_pipeline(cfg, fused=True))  # everything cached
+	assert calls == ["shared"]
+	assert reg.last_report.bytes_written == 0
@@ -0,0 +1,108 @@
+"""Group-size occupancy histogram (the ``group_size_df`` step).
+
+Every animal's time in a position must be split over the number of animals
+present with it, matching a brute-force count over the occupancy bouts, and the
+``group_size == 1`` rows must be exactly the solitary time ``_get_time_alone`` gives.
+"""
+
+import datetime as dt
+from collections import defaultdict
+from itertools import pairwise
+
+import polars as pl
+import pytest
+import strategies as strat
+from hypothesis import given, settings
+from hypothesis import strategies as st
+from polars.testing import assert_frame_equal
+
+from deepecohab.analysis.antenna_analysis import _get_group_sizes, _get_intervals, _get_time_alone
+
+BASE = dt.datetime(2023, 3, 25, 22, 0, 0)
+CFG = {"phase": strat.PHASE_CONFIGS[0], "tunnels": {}}
+KEYS = ["animal_id", "position", "phase", "day", "phase_count", "hour"]
+
+# Presence events packed into two hours so that visits overlap often.
+crowded_event = st.fixed_dictionaries(
+	{
+		"animal_id": st.sampled_from(strat.ANIMALS),
+		"position": st.sampled_from(strat.CAGES[:2]),
+		"start": st.integers(min_value=0, max_value=7200).map(
+			lambda s: BASE + dt.timedelta(seconds=s)
+		),
+		"duration": st.integers(min_value=1, max_value=1800).map(float),
+	}
+)
+crowded_events = st.lists(crowded_event, min_size=1, max_size=20)
+
+
+def brute_force(bouts: pl.DataFrame) -> dict[tuple, dict[int, float]]:
+	"""Time per (animal, position, calendar cell) and group size, piece by piece."""
+	result: dict[tuple, dict[int, float]] = defaultdict(lambda: defaultdict(float))
+	for _, rows in bouts.group_by("position"):
+		cuts = sorted(set(rows["start"]) | set(rows["end"]))
+		for lo, hi in pairwise(cuts):
+			present = rows.filter((pl.col("start") <= lo) & (pl.col("end") >= hi))
+			for row in present.iter_rows(named=True):
+				cell = tuple(str(row[k]) for k in KEYS)
+				result[cell][min(present.height, len(strat.ANIMALS))] += (hi - lo) / 1e6
+	return result
+
+
+@settings(max_examples=100, deadline=None)
+@given(events=crowded_events, tz=strat.timezones)
+def test_group_sizes_match_brute_force(events, tz):
+	bouts = _get_intervals(strat.time_alone_frame(events, tz).lazy(), CFG)
+	result = _get_group_sizes(bouts, max_group=len(strat.ANIMALS)).collect()
+
+	got = {
+		(tuple(str(r[k]) for k in KEYS), r["group_size"]): r["time_in_group"]
+		for r in result.iter_rows(named=True)
+	}
+	expected = {
+		(cell, size): seconds
+		for cell, sizes in brute_force(bouts.collect()).items()
+		for size, seconds in sizes.items()
+		if seconds > 0
+	}
+	assert got.keys() == expected.keys()
+	for key, seconds in expected.items():
+		assert got[key] == pytest.approx(seconds, abs=1e-6)
+
+
+@settings(max_examples=100, deadline=None)
+@given(events=crowded_events, tz=strat.timezones)
+def test_group_size_one_is_time_alone(events, tz):
+	bouts = _get_intervals(strat.time_alone_frame(events, tz).lazy(), CFG)
+	alone = _get_time_alone(bouts).filter(pl.col("time_alone") > 0).collect()
+	group_one = (
+		_get_group_sizes(bouts, max_group=len(strat.ANIMALS))
+		.filter(pl.col("group_size") == 1)
+		.drop("group_size")
+		.rename({"time_in_group": "time_alone"})
+		.collect()
+	)
+
+	assert_frame_equal(group_one.sort(KEYS), alone.sort(KEYS), categorical_as_str=True)
+
+
+def test_two_overlapping_visits():
+	"""A in cage_1 22:00-22:10 and B 22:05-22:15: each is alone 5 min and paired 5 min."""
+	events = [
+		{"animal_id": "A", "position": "cage_1", "start": BASE, "duration": 600.0},
+		{
+			"animal_id": "B",
+			"position": "cage_1",
+			"start": BASE + dt.timedelta(minutes=5),
+			"duration": 600.0,
+		},
+	]
+	bouts = _get_intervals(strat.time_alone_frame(events, "UTC").lazy(), CFG)
+	result = _get_group_sizes(bouts, max_group=3).collect().sort("animal_id", "group_size")
+
+	assert result.select("animal_id", "group_size", "time_in_group").rows() == [
+		("A", 1, 300.0),
+		("A", 2, 300.0),
+		("B", 1, 300.0),
+		("B", 2, 300.0),
+	]
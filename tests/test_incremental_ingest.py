@@ -0,0 +1,185 @@
+"""Incremental ingest (get_ecohab_data_structure(append=True)) on the bundled example data.
+
+The property that matters is differential: ingesting the raw files in several
+batches must give exactly the tables a single full build over all files gives.
+The default-layout example data is small (~1 s per build), so this runs in the
+fast suite.
+"""
+
+import shutil
+from pathlib import Path
+
+import polars as pl
+import pytest
+from polars.io.plugins import register_io_source
+from polars.testing import assert_frame_equal
+
+import deepecohab as d
+from deepecohab.core import create_data_structure as cds
+from deepecohab.core.create_data_structure import MANIFEST_FILE
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+RAW_FILES = sorted((REPO_ROOT / "examples" / "example_data").glob("*.txt"))
+
+# Sort keys giving a deterministic row order (sorting by datetime alone leaves
+# ties between the extrapolated rows at the experiment end).
+SORT_KEYS = {
+	"main_df": ["datetime", "animal_id"],
+	"padded_df": ["datetime", "animal_id", "time_spent"],
+	"phase_durations": ["phase", "phase_count"],
+}
+
+
+def _load(config_path: Path, key: str) -> pl.DataFrame:
+	df = d.load_ecohab_data(config_path, key, return_df=True)
+	# row_id numbering among rows with equal datetimes depends on sort tie order.
+	return df.drop("row_id", strict=False).sort(SORT_KEYS[key.split("@")[0]])
+
+
+@pytest.fixture(scope="module")
+def full_build(tmp_path_factory, make_project) -> Path:
+	root = tmp_path_factory.mktemp("full")
+	config_path, _ = make_project(root, "full", RAW_FILES)
+	d.get_ecohab_data_structure(config_path, fname_prefix="20", padded=["1m"])
+	return config_path
+
+
+def test_append_matches_full_build(tmp_path, make_project, full_build):
+	config_path, data_dir = make_project(tmp_path, "inc", RAW_FILES[:60])
+	d.get_ecohab_data_structure(config_path, fname_prefix="20", padded=["1m"])
+
+	for batch in (RAW_FILES[60:61], RAW_FILES[61:100], RAW_FILES[100:]):
+		for f in batch:
+			shutil.copy(f, data_dir / f.name)
+		d.get_ecohab_data_structure(config_path, fname_prefix="20", append=True, padded=["1m"])
+
+	for key in SORT_KEYS:
+		assert_frame_equal(_load(config_path, key), _load(full_build, key), categorical_as_str=True)
+
+	cfg, cfg_full = d.read_config(config_path), d.read_config(full_build)
+	assert cfg["days_range"] == cfg_full["days_range"]
+	assert cfg["experiment_timeline"] == cfg_full["experiment_timeline"]
+
+
+def test_manifest_lists_every_ingested_file(tmp_path, make_project):
+	config_path, data_dir = make_project(tmp_path, "manifest", RAW_FILES[:10])
+	d.get_ecohab_data_structure(config_path, fname_prefix="20")
+	shutil.copy(RAW_FILES[10], data_dir / RAW_FILES[10].name)
+	d.get_ecohab_data_structure(config_path, fname_prefix="20", append=True)
+
+	results = Path(d.read_config(config_path)["project_location"]) / "results"
+	manifest = pl.read_parquet(results / MANIFEST_FILE)
+	assert manifest["file"].to_list() == [f.name for f in RAW_FILES[:11]]
+	assert (manifest["n_rows"] > 0).all()
+
+
+@pytest.fixture()
+def raw_passes(monkeypatch) -> list[int]:
+	"""Number of rows of every execution of a plan reading raw files, in order."""
+	passes = []
+	scan_raw_files = cds._scan_raw_files
+
+	def counted(source):
+		scan = scan_raw_files(source)
+
+		def read(with_columns, predicate, n_rows, batch_size):
+			lf = scan if with_columns is None else scan.select(with_columns)
+			lf = lf if predicate is None else lf.filter(predicate)
+			df = (lf if n_rows is None else lf.head(n_rows)).collect()
+			passes.append(df.height)
+			yield df
+
+		return register_io_source(read, schema=scan.collect_schema())
+
+	monkeypatch.setattr(cds, "_scan_raw_files", counted)
+	return passes
+
+
+def test_builds_read_raw_files_once(tmp_path, make_project, raw_passes):
+	config_path, data_dir = make_project(tmp_path, "scans", RAW_FILES[:10])
+
+	d.get_ecohab_data_structure(config_path, fname_prefix="20")
+	assert len(raw_passes) == 1
+
+	shutil.copy(RAW_FILES[10], data_dir / RAW_FILES[10].name)
+	d.get_ecohab_data_structure(config_path, fname_prefix="20", append=True)
+	assert len(raw_passes) == 2
+	assert raw_passes[1] < raw_passes[0]  # only the new file is parsed
+
+
+def test_append_without_new_files_leaves_tables_untouched(tmp_path, make_project):
+	config_path, _ = make_project(tmp_path, "noop", RAW_FILES[:10])
+	d.get_ecohab_data_structure(config_path, fname_prefix="20")
+	main_df = Path(d.read_config(config_path)["project_location"]) / "results" / "main_df.parquet"
+	mtime = main_df.stat().st_mtime_ns
+
+	lf = d.get_ecohab_data_structure(config_path, fname_prefix="20", append=True)
+
+	assert isinstance(lf, pl.LazyFrame)
+	assert main_df.stat().st_mtime_ns == mtime
+
+
+def test_append_rebuilds_when_ingested_file_is_removed(tmp_path, make_project):
+	config_path, data_dir = make_project(tmp_path, "removed", RAW_FILES[:10])
+	d.get_ecohab_data_structure(config_path, fname_prefix="20")
+	(data_dir / RAW_FILES[9].name).unlink()
+
+	d.get_ecohab_data_structure(config_path, fname_prefix="20", append=True)
+
+	expected_path, _ = make_project(tmp_path, "expected", RAW_FILES[:9])
+	d.get_ecohab_data_structure(expected_path, fname_prefix="20")
+	assert_frame_equal(
+		_load(config_path, "main_df"), _load(expected_path, "main_df"), categorical_as_str=True
+	)
+
+
+def test_extrapolated_rows_are_flagged(full_build):
+	main_df = d.load_ecohab_data(full_build, "main_df", return_df=True)
+	extrapolated = main_df.filter(pl.col("extrapolated"))
+
+	assert extrapolated.height > 0
+	# Synthesised rows all sit at the experiment end, one per animal at most.
+	assert (extrapolated["datetime"] == main_df["datetime"].max()).all()
+	assert extrapolated["animal_id"].is_unique().all()
+
+
+def test_build_without_padded_df_matches_full_build(tmp_path, make_project, full_build):
+	config_path, data_dir = make_project(tmp_path, "lean", RAW_FILES[:60])
+	d.get_ecohab_data_structure(config_path, fname_prefix="20", padded=False)
+	for f in RAW_FILES[60:]:
+		shutil.copy(f, data_dir / f.name)
+	d.get_ecohab_data_structure(config_path, fname_prefix="20", append=True, padded=False)
+
+	assert d.load_ecohab_data(config_path, "padded_df") is None
+	assert_frame_equal(
+		_load(config_path, "main_df"), _load(full_build, "main_df"), categorical_as_str=True
+	)
+
+	# pairwise meetings pad in memory when no padded_df is stored
+	for path in (config_path, full_build):
+		d.calculate_intervals(path)
+	sort_keys = ["phase", "day", "phase_count", "position", "animal_id", "animal_id_2"]
+	assert_frame_equal(
+		d.calculate_pairwise_meetings(config_path, save_data=False).collect().sort(sort_keys),
+		d.calculate_pairwise_meetings(full_build, save_data=False).collect().sort(sort_keys),
+		categorical_as_str=True,
+	)
+
+
+def test_append_keeps_requested_padding_resolutions(tmp_path, make_project):
+	config_path, data_dir = make_project(tmp_path, "hourly", RAW_FILES[:60])
+	d.get_ecohab_data_structure(config_path, fname_prefix="20")
+	d.get_ecohab_data_structure(config_path, fname_prefix="20", append=True, padded=["1h"])
+	for f in RAW_FILES[60:]:
+		shutil.copy(f, data_dir / f.name)
+	d.get_ecohab_data_structure(config_path, fname_prefix="20", append=True, padded=["1h"])
+
+	expected_path, _ = make_project(tmp_path, "expected", RAW_FILES)
+	d.get_ecohab_data_structure(expected_path, fname_prefix="20", padded=["1h"])
+
+	assert d.load_ecohab_data(config_path, "padded_df@1m") is None
+	assert_frame_equal(
+		_load(config_path, "padded_df@1h"),
+		_load(expected_path, "padded_df@1h"),
+		categorical_as_str=True,
+	)
@@ -0,0 +1,181 @@
+"""Occupancy bouts (the ``intervals`` step) and the minute cutting of pair overlaps.
+
+Bouts must keep every stay's time in the calendar cell it falls into (the same
+totals ``bin_intervals`` gives over the raw stays), merge touching stays in one
+position and come out in sweep order. ``_minute_meetings`` must count exactly the
+per-minute pieces an explicit split of each overlap gives.
+"""
+
+import datetime as dt
+from itertools import pairwise
+from pathlib import Path
+
+import polars as pl
+import pytest
+import strategies as strat
+from hypothesis import given, settings
+from hypothesis import strategies as st
+from polars.testing import assert_frame_equal
+
+import deepecohab as d
+from deepecohab.analysis.antenna_analysis import (
+	_get_intervals,
+	_minute_meetings,
+	_pair_overlaps_join,
+	_pair_overlaps_sweep,
+)
+from deepecohab.core.registries import SORTED_BY_KEY
+from deepecohab.utils import phase_calendar, results_io
+
+BASE = dt.datetime(2023, 3, 25, 22, 0, 0)
+CFG = {"phase": strat.PHASE_CONFIGS[0], "tunnels": {}}
+
+# One animal's stays in order: the position it was in and how long it stayed.
+stays = st.lists(
+	st.tuples(
+		st.sampled_from(strat.CAGES[:2]),
+		st.floats(min_value=0, max_value=5400, allow_nan=False).map(lambda s: round(s, 3)),
+	),
+	min_size=1,
+	max_size=12,
+)
+
+
+def stays_frame(per_animal: dict[str, list[tuple[str, float]]], tz: str) -> pl.LazyFrame:
+	"""main_df-shaped frame: each row ends a stay that began at the previous row."""
+	rows = []
+	for animal, animal_stays in per_animal.items():
+		end = BASE
+		for position, seconds in animal_stays:
+			end += dt.timedelta(seconds=seconds)
+			rows.append((animal, position, end, seconds))
+	animals, positions, ends, spent = zip(*rows, strict=True)
+	return pl.LazyFrame(
+		{
+			"animal_id": pl.Series(animals, dtype=pl.Enum(strat.ANIMALS)),
+			"position": pl.Series(positions, dtype=pl.Categorical),
+			"datetime": strat.aware(list(ends), tz),
+			"time_spent": pl.Series(spent, dtype=pl.Float64),
+		}
+	)
+
+
+@settings(max_examples=100, deadline=None)
+@given(
+	per_animal=st.dictionaries(st.sampled_from(strat.ANIMALS[:3]), stays, min_size=1),
+	tz=strat.timezones,
+)
+def test_bouts_keep_time_per_cell(per_animal, tz):
+	lf = stays_frame(per_animal, tz)
+	keys = ["animal_id", "position", *phase_calendar.CALENDAR_COLUMNS]
+
+	bouts = _get_intervals(lf, CFG).collect()
+	result = bouts.group_by(keys).agg(
+		((pl.col("end") - pl.col("start")).sum() / 1_000_000).alias("seconds")
+	)
+	expected = phase_calendar.bin_intervals(
+		lf.with_columns(
+			(pl.col("datetime") - pl.duration(seconds=pl.col("time_spent"))).alias("start")
+		),
+		CFG,
+		["animal_id", "position"],
+		end="datetime",
+		name="seconds",
+	).filter(pl.col("seconds") > 0)
+
+	assert_frame_equal(
+		result.sort(keys),
+		expected.collect().sort(keys),
+		check_column_order=False,
+		check_dtypes=False,
+		categorical_as_str=True,
+		abs_tol=1e-6,
+	)
+	assert bouts.equals(bouts.sort("position", "start"))
+
+
+def test_touching_stays_merge_and_split_at_hours():
+	"""Two touching stays in cage_1 from 22:00 to 23:20 are one bout, cut at 23:00."""
+	lf = stays_frame({"A": [("cage_1", 0), ("cage_1", 2400), ("cage_1", 2400)]}, "UTC")
+	bouts = _get_intervals(lf, CFG).collect()
+
+	assert bouts["hour"].to_list() == [22, 23]
+	assert ((bouts["end"] - bouts["start"]) / 1_000_000).to_list() == [3600.0, 1200.0]
+
+
+def test_stays_apart_by_rounding_merge():
+	"""With time_spent rounded to 0.01 s the second stay starts 4 ms after the first ends."""
+	lf = stays_frame({"A": [("cage_1", 0), ("cage_1", 600), ("cage_1", 600.004)]}, "UTC")
+	bouts = _get_intervals(lf.with_columns(pl.col("time_spent").round(2)), CFG).collect()
+
+	assert bouts.height == 1
+	assert (bouts["end"] - bouts["start"]).item() == 1_200_004_000
+
+
+@pytest.mark.parametrize("overlaps", [_pair_overlaps_sweep, _pair_overlaps_join])
+def test_meeting_across_a_rounding_gap_is_one_overlap(overlaps):
+	"""A is in cage_1 22:00:00-22:01:40, with a 4 ms gap at 22:00:50 left by the
+	rounding of time_spent; B is there 22:00:10-22:01:30. Their overlap is one,
+	cut at 22:01 into 50 s + 30 s. Unmerged stays gave 40 s, 9.996 s and 30 s.
+	"""
+	lf = stays_frame(
+		{"A": [("cage_1", 50), ("cage_1", 50.004)], "B": [("cage_2", 10), ("cage_1", 80)]},
+		"UTC",
+	)
+	bouts = (
+		_get_intervals(lf.with_columns(pl.col("time_spent").round(2)), CFG)
+		.filter(pl.col("position") == "cage_1")
+		.with_columns(
+			pl.col("start").cast(pl.Datetime("us")).alias("event_start"),
+			pl.col("end").cast(pl.Datetime("us")).alias("event_end"),
+		)
+	)
+	meetings = _minute_meetings(overlaps(bouts), minimum_time=2).collect()
+
+	assert meetings["pairwise_encounters"].sum() == 2
+	assert meetings["time_together"].sum() == 80.0
+
+
+@settings(max_examples=200, deadline=None)
+@given(
+	start=st.integers(min_value=0, max_value=600_000),
+	length=st.integers(min_value=-5_000, max_value=400_000),
+	minimum_time=st.sampled_from([0, 2, 30.5]),
+)
+def test_minute_meetings_match_explicit_pieces(start, length, minimum_time):
+	overlap_start = BASE + dt.timedelta(milliseconds=start)
+	overlap_end = overlap_start + dt.timedelta(milliseconds=length)
+	overlaps = pl.LazyFrame(
+		{"overlap_start": [overlap_start], "overlap_end": [overlap_end]},
+		schema={"overlap_start": pl.Datetime("ms"), "overlap_end": pl.Datetime("ms")},
+	)
+
+	pieces = [round(length / 1000, 3)]
+	if length > 0:
+		bounds = [overlap_start]
+		mark = overlap_start.replace(second=0, microsecond=0) + dt.timedelta(minutes=1)
+		while mark < overlap_end:
+			bounds.append(mark)
+			mark += dt.timedelta(minutes=1)
+		bounds.append(overlap_end)
+		pieces = [round((b - a).total_seconds(), 3) for a, b in pairwise(bounds)]
+	kept = [p for p in pieces if p > minimum_time]
+
+	result = _minute_meetings(overlaps, minimum_time).collect()
+	if not kept:
+		assert result.is_empty()
+	else:
+		assert result["pairwise_encounters"].item() == len(kept)
+		assert result["time_together"].item() == pytest.approx(sum(kept))
+
+
+def test_pipeline_stores_sorted_intervals(project):
+	list(d.df_registry.run_pipeline(project, targets=["pairwise_meetings", "activity_df"]))
+
+	results = Path(d.read_config(project)["project_location"]) / "results"
+	location = results_io.result_location(results, "intervals")
+	assert results_io.result_metadata(location)[SORTED_BY_KEY] == "position,start"
+
+	intervals = results_io.read_result(location)
+	assert intervals.schema["start"] == pl.Int64
+	assert intervals.equals(intervals.sort("position", "start"))
@@ -0,0 +1,150 @@
+"""Arrow IPC results (``ipc_results``): layout, metadata, memory-mapped reads and builds.
+
+Tables listed in a project's ``ipc_results`` must be stored as ``results/<key>.arrow``
+with their metadata alongside, read back exactly as written, and a project storing
+``main_df`` and ``padded_df`` as IPC must build, append and run the pipeline to the
+same tables as a parquet project.
+"""
+
+import shutil
+from pathlib import Path
+
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+import deepecohab as d
+from deepecohab.utils import results_io
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+RAW_FILES = sorted((REPO_ROOT / "examples" / "example_data").glob("*.txt"))[:24]
+
+TABLE = pl.DataFrame(
+	{
+		"day": pl.Series([1, 1, 2, 3, 3], dtype=pl.UInt16),
+		"value": [1, 2, 3, 4, 5],
+	}
+)
+
+
+@pytest.mark.parametrize("compression", ["uncompressed", "lz4"])
+def test_ipc_round_trip_keeps_table_and_metadata(tmp_path, compression):
+	results_io.write_result(
+		TABLE.lazy(), tmp_path, "activity_df", metadata={"k": "v"}, ipc_compression=compression
+	)
+
+	location = results_io.result_location(tmp_path, "activity_df")
+	assert location == tmp_path / "activity_df.arrow"
+	assert_frame_equal(results_io.read_result(location), TABLE)
+	assert_frame_equal(results_io.scan_result(location).collect(), TABLE)
+	assert results_io.result_metadata(location) == {"k": "v"}
+	assert results_io.result_rows(location) == TABLE.height
+	assert list(results_io.list_results(tmp_path)) == ["activity_df"]
+
+
+def test_interrupted_ipc_write_leaves_no_stale_metadata(tmp_path):
+	results_io.write_result(
+		TABLE.lazy(), tmp_path, "activity_df", metadata={"k": "old"}, ipc_compression="lz4"
+	)
+	# Metadata that cannot be serialised fails the write after the data was replaced.
+	with pytest.raises(TypeError):
+		results_io.write_result(
+			TABLE.head(2).lazy(),
+			tmp_path,
+			"activity_df",
+			metadata={"k": object()},
+			ipc_compression="lz4",
+		)
+
+	location = results_io.result_location(tmp_path, "activity_df")
+	assert results_io.read_result(location).height == 2
+	assert results_io.result_metadata(location) == {}
+
+
+def test_switching_to_and_from_ipc_replaces_the_old_table(tmp_path):
+	results_io.write_result(TABLE.lazy(), tmp_path, "activity_df", partitioned=True)
+	results_io.write_result(TABLE.lazy(), tmp_path, "activity_df", ipc_compression="lz4")
+	assert not (tmp_path / "activity_df").exists()
+
+	results_io.write_result(TABLE.lazy(), tmp_path, "activity_df", metadata={"k": "v"})
+	assert sorted(p.name for p in tmp_path.iterdir()) == ["activity_df.parquet"]
+
+	results_io.write_result(TABLE.lazy(), tmp_path, "activity_df", ipc_compression="lz4")
+	results_io.remove_result(tmp_path, "activity_df")
+	assert not any(tmp_path.iterdir())
+
+
+def test_ipc_compression_follows_config():
+	cfg = {"ipc_results": ["main_df", "padded_df"], "ipc_compression": "lz4"}
+
+	assert results_io.ipc_compression(cfg, "main_df") == "lz4"
+	assert results_io.ipc_compression(cfg, "padded_df@1h") == "lz4"
+	assert results_io.ipc_compression(cfg, "activity_df") is None
+	assert results_io.ipc_compression({}, "main_df") is None
+
+
+def _build(root: Path, name: str, files: list[Path], **kwargs) -> tuple[Path, Path]:
+	data_dir = root / f"data_{name}"
+	data_dir.mkdir()
+	for f in files:
+		shutil.copy(f, data_dir / f.name)
+	config_path, _ = d.create_ecohab_project(
+		project_location=root,
+		experiment_name=name,
+		data_path=data_dir,
+		light_phase_start="00:00:00",
+		dark_phase_start="12:00:00",
+		interpolate_positions=True,
+		timezone="Europe/Warsaw",
+		**kwargs,
+	)
+	d.get_ecohab_data_structure(config_path, fname_prefix="20", padded=["1m"])
+	return config_path, data_dir
+
+
+@pytest.fixture(scope="module")
+def parquet_build(tmp_path_factory) -> Path:
+	config_path, _ = _build(tmp_path_factory.mktemp("parquet"), "parquet", RAW_FILES)
+	list(d.df_registry.run_pipeline(config_path, targets=["activity_df", "pairwise_rollup"]))
+	return config_path
+
+
+def test_ipc_project_matches_parquet_project(tmp_path, parquet_build):
+	config_path, data_dir = _build(
+		tmp_path,
+		"ipc",
+		RAW_FILES[:12],
+		ipc_results=["main_df", "padded_df", "intervals"],
+	)
+	for f in RAW_FILES[12:]:
+		shutil.copy(f, data_dir / f.name)
+	d.get_ecohab_data_structure(config_path, fname_prefix="20", append=True, padded=["1m"])
+	targets = ["activity_df", "pairwise_rollup"]
+	list(d.df_registry.run_pipeline(config_path, targets=targets))
+
+	results = Path(d.read_config(config_path)["project_location"]) / "results"
+	for key in ("main_df", "padded_df@1m", "intervals"):
+		assert results_io.result_location(results, key) == results / f"{key}.arrow"
+	assert d.df_registry.stale_steps(config_path, targets=targets) == []
+
+	for key, sort_keys in {
+		"main_df": ["datetime", "animal_id"],
+		"padded_df": ["datetime", "animal_id", "time_spent"],
+		"activity_df": ["animal_id", "position", "phase", "day", "phase_count", "hour"],
+	}.items():
+		assert_frame_equal(
+			d.load_ecohab_data(config_path, key, return_df=True)
+			.drop("row_id", strict=False)
+			.sort(sort_keys),
+			d.load_ecohab_data(parquet_build, key, return_df=True)
+			.drop("row_id", strict=False)
+			.sort(sort_keys),
+			categorical_as_str=True,
+		)
+
+
+def test_unknown_ipc_compression_is_rejected(tmp_path):
+	(tmp_path / "data").mkdir()
+	shutil.copy(RAW_FILES[0], tmp_path / "data" / RAW_FILES[0].name)
+	with pytest.raises(ValueError, match="ipc_compression"):
+		d.create_ecohab_project(tmp_path, tmp_path / "data", ipc_compression="zstd")
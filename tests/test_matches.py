@@ -0,0 +1,136 @@
+"""Tests for calculate_matches (event-level chasing table).
+
+calculate_matches reads main_df via auxfun._get_data, so a small hand-built
+antenna table is injected with monkeypatch and the pure compute body is called
+via ``__wrapped__``. The range join is checked against a brute-force oracle
+that pairs every tunnel read with every other read, with no time bucketing.
+"""
+
+import datetime as dt
+
+import polars as pl
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+from polars.testing import assert_frame_equal
+
+from deepecohab.analysis import antenna_analysis
+
+ANIMALS = ["A", "B", "C"]
+CAGES = ["cage_1", "cage_2"]
+TUNNELS = ["c1_c2", "c2_c1"]
+CFG = {"cages": CAGES, "tunnels": TUNNELS}
+BASE = dt.datetime(2023, 5, 24, 12, 59, 58)
+
+EVENT_COLUMNS = ["winner", "loser", "datetime", "position", "hour", "chasing_length"]
+
+
+def make_main_df(rows: list[tuple[str, str, int]]) -> pl.LazyFrame:
+	"""Build a main_df LazyFrame from (animal_id, position, ms after BASE) tuples."""
+	datetimes = [BASE + dt.timedelta(milliseconds=r[2]) for r in rows]
+	return (
+		pl.LazyFrame(
+			{
+				"animal_id": pl.Series([r[0] for r in rows], dtype=pl.Enum(ANIMALS)),
+				"position": pl.Series([r[1] for r in rows], dtype=pl.Enum(CAGES + TUNNELS)),
+				"datetime": pl.Series(datetimes, dtype=pl.Datetime("ms")),
+			}
+		)
+		.sort("datetime")
+		.with_columns(
+			pl.lit("light_phase").alias("phase"),
+			pl.lit(1).alias("day"),
+			pl.lit(1).alias("phase_count"),
+			pl.col("datetime").dt.hour().alias("hour"),
+		)
+	)
+
+
+def run_matches(monkeypatch, main_df, **kwargs) -> pl.DataFrame:
+	"""Call the pure matches body with main_df injected in place of _get_data."""
+	monkeypatch.setattr(antenna_analysis.auxfun, "_get_data", lambda cfg, key: main_df)
+	result = antenna_analysis.calculate_matches.__wrapped__(CFG, **kwargs)
+	return result.select(EVENT_COLUMNS).collect().sort(EVENT_COLUMNS)
+
+
+def reference_matches(main_df: pl.LazyFrame, window: tuple[float, float]) -> pl.DataFrame:
+	"""Brute force: every tunnel read against every other animal's tunnel entry."""
+	chasing = main_df.with_columns(
+		pl.col("datetime").shift(1).over("animal_id").alias("tunnel_entry"),
+		pl.col("position").shift(1).over("animal_id").alias("prev_position"),
+	)
+	length = (pl.col("datetime") - pl.col("tunnel_entry")).dt.total_seconds(fractional=True)
+	return (
+		main_df.filter(pl.col("position").is_in(TUNNELS))
+		.join(chasing, how="cross", suffix="_chasing")
+		.filter(
+			pl.col("animal_id") != pl.col("animal_id_chasing"),
+			pl.col("position") == pl.col("position_chasing"),
+			pl.col("prev_position").is_in(CAGES),
+			length.is_between(*window, closed="none"),
+			pl.col("datetime") < pl.col("datetime_chasing"),
+		)
+		.select(
+			pl.col("animal_id_chasing").alias("winner"),
+			pl.col("animal_id").alias("loser"),
+			pl.col("datetime_chasing").alias("datetime"),
+			"position",
+			"hour",
+			length.alias("chasing_length"),
+		)
+		.collect()
+		.sort(EVENT_COLUMNS)
+	)
+
+
+def test_chase_straddling_hour_boundary_is_found(monkeypatch):
+	"""Winner enters at 12:59:59.8, loser reads 13:00:00.3: one chase, in the loser's hour."""
+	main_df = make_main_df(
+		[
+			("A", "cage_1", 0),
+			("A", "c1_c2", 2_300),
+			("A", "cage_2", 5_000),
+			("B", "cage_1", 1_800),
+			("B", "c1_c2", 2_600),
+		]
+	)
+	result = run_matches(monkeypatch, main_df)
+
+	assert result.height == 1
+	row = result.row(0, named=True)
+	assert (row["winner"], row["loser"]) == ("B", "A")
+	assert row["hour"] == 13
+	assert row["chasing_length"] == pytest.approx(0.5)
+
+
+def test_window_bounds_are_exclusive(monkeypatch):
+	"""A chasing length equal to either window bound is not a chase."""
+	main_df = make_main_df(
+		[
+			("A", "c1_c2", 1_000),
+			("B", "cage_1", 0),
+			("B", "c1_c2", 3_000),
+		]
+	)
+	assert run_matches(monkeypatch, main_df, chasing_time_window=(1.0, 2.0)).height == 0
+	assert run_matches(monkeypatch, main_df, chasing_time_window=(0.5, 1.0)).height == 0
+	assert run_matches(monkeypatch, main_df, chasing_time_window=(0.5, 1.5)).height == 1
+
+
+read = st.tuples(
+	st.sampled_from(ANIMALS),
+	st.sampled_from(CAGES + TUNNELS),
+	st.integers(min_value=0, max_value=8_000),
+)
+
+
+@settings(max_examples=150, deadline=None)
+@given(
+	rows=st.lists(read, min_size=1, max_size=40),
+	window=st.sampled_from([(0.1, 1.2), (0.0, 3.0), (0.25, 0.5)]),
+)
+def test_matches_equal_brute_force(rows, window):
+	main_df = make_main_df(rows)
+	with pytest.MonkeyPatch.context() as monkeypatch:
+		result = run_matches(monkeypatch, main_df, chasing_time_window=window)
+	assert_frame_equal(result, reference_matches(main_df, window))
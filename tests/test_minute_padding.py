@@ -6,7 +6,13 @@ import pytest
 import strategies as strat
 from hypothesis import given, settings
 from hypothesis import strategies as st
+from polars.testing import assert_frame_equal
 
+from deepecohab.analysis.antenna_analysis import (
+	_TOUCH_TOLERANCE_US,
+	_get_activity,
+	_get_intervals,
+)
 from deepecohab.utils import auxfun
 
 TZ_NAME = "Europe/Warsaw"
@@ -56,7 +62,7 @@ def test_within_minute_not_split():
 	lf = make_lf(
 		[{"end": at(2023, 6, 15, 12, 0, 40), "time_spent": 20, "time_under": MINUTE / 4}]
 	)  # 12:00:20 -> 12:00:40
-	out = auxfun._get_minute_padding(lf, CFG).collect()
+	out = auxfun._get_padding(lf, CFG).collect()
 	assert out.height == 1
 	assert out["interpolated"].to_list() == [False]
 	assert out["time_spent"][0] == pytest.approx(20)
@@ -66,7 +72,7 @@ def test_within_minute_not_split():
 def test_interval_exactly_one_aligned_minute_not_split():
 	"""[12:00:00, 12:01:00) is one aligned minute -> single piece."""
 	lf = make_lf([{"end": at(2023, 6, 15, 12, 1, 0), "time_spent": 60, "time_under": MINUTE}])
-	out = auxfun._get_minute_padding(lf, CFG).collect()
+	out = auxfun._get_padding(lf, CFG).collect()
 	assert out.height == 1
 	assert out["interpolated"].to_list() == [False]
 
@@ -74,7 +80,7 @@ def test_interval_exactly_one_aligned_minute_not_split():
 def test_single_minute_crossing_splits_into_two():
 	"""12:00:40 -> 12:01:20 crosses 12:01:00 -> two 20s pieces, both interpolated."""
 	lf = make_lf([{"end": at(2023, 6, 15, 12, 1, 20), "time_spent": 40, "time_under": MINUTE}])
-	out = auxfun._get_minute_padding(lf, CFG).collect().sort("datetime")
+	out = auxfun._get_padding(lf, CFG).collect().sort("datetime")
 	assert out.height == 2
 	assert out["interpolated"].to_list() == [True, True]
 	assert out["time_spent"].to_list() == pytest.approx([20, 20])
@@ -88,7 +94,7 @@ def test_multi_minute_crossing_piece_count():
 	lf = make_lf(
 		[{"end": at(2023, 6, 15, 12, 3, 20), "time_spent": 40 + 120, "time_under": MINUTE}]
 	)  # 12:00:40 -> 12:03:20 spans minutes 0,1,2,3 -> 4 pieces
-	out = auxfun._get_minute_padding(lf, CFG).collect()
+	out = auxfun._get_padding(lf, CFG).collect()
 	assert out.height == 4
 	assert out["interpolated"].to_list() == [True, True, True, True]
 
@@ -98,14 +104,14 @@ def test_time_spent_conserved():
 	lf = make_lf(
 		[{"end": at(2023, 6, 15, 12, 1, 20), "time_spent": original, "time_under": MINUTE}]
 	)
-	out = auxfun._get_minute_padding(lf, CFG).collect()
+	out = auxfun._get_padding(lf, CFG).collect()
 	assert out["time_spent"].sum() == pytest.approx(original)
 
 
 def test_time_under_conserved():
 	tu = dt.timedelta(seconds=37)
 	lf = make_lf([{"end": at(2023, 6, 15, 12, 1, 20), "time_spent": 40, "time_under": tu}])
-	out = auxfun._get_minute_padding(lf, CFG).collect()
+	out = auxfun._get_padding(lf, CFG).collect()
 	assert out["time_under"].sum() == pytest.approx(tu, abs=dt.timedelta(microseconds=4))
 
 
@@ -113,7 +119,7 @@ def test_no_piece_exceeds_one_minute():
 	lf = make_lf(
 		[{"end": at(2023, 6, 15, 12, 3, 20), "time_spent": 40 + 120, "time_under": MINUTE}]
 	)
-	out = auxfun._get_minute_padding(lf, CFG).collect()
+	out = auxfun._get_padding(lf, CFG).collect()
 	assert (out["time_spent"] <= 60 + 1e-6).all()
 
 
@@ -122,7 +128,7 @@ def test_each_piece_within_single_clock_minute():
 	lf = make_lf(
 		[{"end": at(2023, 6, 15, 12, 3, 20), "time_spent": 40 + 120, "time_under": MINUTE}]
 	)
-	out = auxfun._get_minute_padding(lf, CFG).collect()
+	out = auxfun._get_padding(lf, CFG).collect()
 	starts = piece_starts(out)
 	ends = out["datetime"]
 	start_min = starts.dt.truncate("1m")
@@ -134,17 +140,33 @@ def test_hour_label_from_piece_start():
 	"""Hour column reflects the piece START, not the original interval end."""
 	# 11:59:40 -> 12:00:20 crosses both the minute AND the hour mark at 12:00.
 	lf = make_lf([{"end": at(2023, 6, 15, 12, 0, 20), "time_spent": 40, "time_under": MINUTE}])
-	out = auxfun._get_minute_padding(lf, CFG).collect().sort("datetime")
+	out = auxfun._get_padding(lf, CFG).collect().sort("datetime")
 	assert out.height == 2
 	# first piece 11:59:40-12:00:00 -> hour 11; second 12:00:00-12:00:20 -> hour 12
 	assert out["hour"].cast(pl.Int64).to_list() == [11, 12]
 
 
+def test_phase_count_from_piece_start():
+	"""A visit spanning a whole phase labels each piece with its own phase occurrence."""
+	# 19:59 on day 1 -> 20:01 on day 2 runs through light 1, dark 1, light 2 and dark 2.
+	lf = make_lf(
+		[{"end": at(2023, 6, 16, 20, 1), "time_spent": 24 * 3600 + 120, "time_under": MINUTE}]
+	)
+	out = auxfun._get_padding(lf, CFG).collect().sort("datetime")
+	runs = out.select("phase", "phase_count").unique(maintain_order=True)
+	assert runs.rows() == [
+		("light_phase", 1),
+		("dark_phase", 1),
+		("light_phase", 2),
+		("dark_phase", 2),
+	]
+
+
 def test_zero_duration_row_survives_without_nan():
 	lf = make_lf(
 		[{"end": at(2023, 6, 15, 12, 0, 0), "time_spent": 0, "time_under": dt.timedelta(0)}]
 	)
-	out = auxfun._get_minute_padding(lf, CFG).collect()
+	out = auxfun._get_padding(lf, CFG).collect()
 	assert out.height == 1
 	assert out["interpolated"].to_list() == [False]
 	assert out["time_under"][0] == dt.timedelta(0)
@@ -152,7 +174,7 @@ def test_zero_duration_row_survives_without_nan():
 
 def test_row_id_present_in_output():
 	lf = make_lf([{"end": at(2023, 6, 15, 12, 1, 20), "time_spent": 40, "time_under": MINUTE}])
-	out = auxfun._get_minute_padding(lf, CFG).collect()
+	out = auxfun._get_padding(lf, CFG).collect()
 	assert "row_id" in out.columns
 
 
@@ -164,7 +186,7 @@ def test_row_id_dedup_recovers_original_count():
 		{"end": at(2023, 6, 15, 12, 3, 20), "time_spent": 160, "time_under": MINUTE},  # 4 pieces
 	]
 	lf = make_lf(rows)
-	out = auxfun._get_minute_padding(lf, CFG).collect()
+	out = auxfun._get_padding(lf, CFG).collect()
 
 	# more pieces than originals, but exactly len(rows) distinct row_ids
 	assert out.height > len(rows)
@@ -180,7 +202,7 @@ def test_row_ids_are_contiguous_from_zero():
 		for _ in range(5)
 	]
 	lf = make_lf(rows)
-	out = auxfun._get_minute_padding(lf, CFG).collect()
+	out = auxfun._get_padding(lf, CFG).collect()
 	assert sorted(out["row_id"].unique().to_list()) == list(range(5))
 
 
@@ -194,7 +216,7 @@ def test_dedup_first_piece_holds_piece_values_not_original():
 	lf = make_lf(
 		[{"end": at(2023, 6, 15, 12, 1, 20), "time_spent": 40, "time_under": MINUTE}]
 	)  # splits into 20s + 20s at 12:01:00
-	out = auxfun._get_minute_padding(lf, CFG).collect()
+	out = auxfun._get_padding(lf, CFG).collect()
 	first = out.unique("row_id", keep="first").row(0, named=True)
 	assert first["time_spent"] == pytest.approx(20)  # first piece, not 40
 
@@ -211,7 +233,7 @@ def test_property_conserves_time_spent(v, tz, pcfg):
 	"""However a single visit is split across minute marks, total time_spent is
 	preserved and no piece exceeds one minute, in any timezone / phase config.
 	"""
-	out = auxfun._get_minute_padding(strat.padding_frame([v], tz), {"phase": pcfg}).collect()
+	out = auxfun._get_padding(strat.padding_frame([v], tz), {"phase": pcfg}).collect()
 	assert out["time_spent"].sum() == pytest.approx(v["time_spent"], abs=1e-6)
 	assert (out["time_spent"] <= 60 + 1e-6).all()
 
@@ -227,7 +249,7 @@ def test_property_preserves_identity_and_dedup(rows, tz, pcfg):
 	keep="first") recovers exactly one row per original visit, and every piece
 	keeps the animal_id/position of the visit it came from (row_id i == row i).
 	"""
-	out = auxfun._get_minute_padding(strat.padding_frame(rows, tz), {"phase": pcfg}).collect()
+	out = auxfun._get_padding(strat.padding_frame(rows, tz), {"phase": pcfg}).collect()
 
 	assert out["row_id"].n_unique() == len(rows)
 	assert sorted(out["row_id"].unique().to_list()) == list(range(len(rows)))
@@ -237,3 +259,73 @@ def test_property_preserves_identity_and_dedup(rows, tz, pcfg):
 		pieces = out.filter(pl.col("row_id") == i)
 		assert pieces["animal_id"].unique().to_list() == [r["animal_id"]]
 		assert pieces["position"].unique().to_list() == [r["position"]]
+
+
+@settings(max_examples=150, deadline=None)
+@given(
+	rows=st.lists(strat.visit, min_size=1, max_size=20),
+	tz=strat.timezones,
+	pcfg=strat.phase_configs,
+)
+def test_property_activity_matches_padded_aggregation(rows, tz, pcfg):
+	"""Binning stays straight into calendar cells gives the same dwell times and
+	visit counts as aggregating their per-minute padding pieces.
+	"""
+	cfg = {"phase": pcfg, "tunnels": {}}
+	lf = strat.padding_frame(rows, tz)
+	keys = ["phase", "day", "phase_count", "hour", "position", "animal_id"]
+
+	expected = (
+		auxfun._get_padding(lf, cfg)
+		.group_by(keys)
+		.agg(
+			pl.sum("time_spent").alias("time_in_position"),
+			(~pl.col("interpolated")).sum().alias("visits_to_position"),
+		)
+		.filter(pl.col("time_in_position") > 0)
+		.collect()
+	)
+	result = (
+		_get_activity(lf, _get_intervals(lf, cfg), cfg)
+		.with_columns(pl.col("position").cast(pl.Categorical))
+		.filter(pl.col("time_in_position") > 0)
+		.collect()
+	)
+
+	# Bouts merge stays that overlap by less than the touch tolerance, counting
+	# the overlap once where the padding pieces count it twice.
+	assert_frame_equal(
+		result.sort(keys),
+		expected.sort(keys),
+		check_dtypes=False,
+		check_column_order=False,
+		categorical_as_str=True,
+		abs_tol=len(rows) * _TOUCH_TOLERANCE_US / 1e6,
+	)
+
+
+@pytest.mark.parametrize("resolution", ["10s", "15m", "1h"])
+def test_resolution_sets_piece_boundaries(resolution):
+	"""A long stay is cut at every multiple of the resolution and nowhere else."""
+	lf = make_lf([{"end": at(2024, 1, 10, 14, 0, 5), "time_spent": 7210.0, "time_under": MINUTE}])
+	out = auxfun._get_padding(lf, CFG, resolution).collect().sort("datetime")
+	seconds = auxfun.padding_seconds(resolution)
+
+	marks = out["datetime"][:-1]  # every piece but the last ends on a bin mark
+	assert out["time_spent"].sum() == pytest.approx(7210.0)
+	assert out.height == 7200 // seconds + 2  # 5 s partial bins at both ends
+	assert (out["time_spent"] <= seconds).all()
+	assert (marks.dt.truncate(resolution) == marks).all()
+
+
+@pytest.mark.parametrize("resolution", ["1x", "7m", "0s"])
+def test_unknown_or_uneven_resolutions_raise(resolution):
+	with pytest.raises(ValueError):
+		auxfun.padding_seconds(resolution)
+
+
+def test_resolution_must_align_with_phase_starts():
+	cfg = {"phase": {"light_phase": "07:30:00", "dark_phase": "19:30:00"}}
+	assert auxfun.padding_seconds("30m", cfg) == 1800
+	with pytest.raises(ValueError, match="light_phase"):
+		auxfun.padding_seconds("1h", cfg)
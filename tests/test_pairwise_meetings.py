@@ -0,0 +1,152 @@
+"""Differential tests: the sweep-line pair-overlap engine against the reference self-join.
+
+The sweep must emit exactly the pairs the join keeps for any non-negative
+``minimum_time``, with the same orientation (``animal_id < animal_id_2``) and
+the same ``hour`` attribution, so ``calculate_pairwise_meetings`` is unchanged
+whichever engine runs.
+"""
+
+import datetime as dt
+from pathlib import Path
+
+import polars as pl
+import pytest
+import strategies as strat
+from hypothesis import given, settings
+from hypothesis import strategies as st
+from polars.testing import assert_frame_equal
+
+import deepecohab as d
+from deepecohab.analysis.antenna_analysis import _pair_overlaps_join, _pair_overlaps_sweep
+
+BASE = dt.datetime(2023, 5, 24, 12, 0, 0)
+
+PAIR_COLUMNS = [
+	"phase",
+	"day",
+	"phase_count",
+	"position",
+	"hour",
+	"animal_id",
+	"animal_id_2",
+	"overlap_duration",
+]
+
+# A short window keeps stays dense, so most draws contain nested, staggered and
+# tied intervals.
+stay = st.fixed_dictionaries(
+	{
+		"animal_id": st.sampled_from(strat.ANIMALS),
+		"position": st.sampled_from(strat.CAGES[:2]),
+		"phase_count": st.integers(min_value=1, max_value=2),
+		"hour": st.integers(min_value=0, max_value=1),
+		"start": st.integers(min_value=0, max_value=120_000),
+		"length": st.integers(min_value=0, max_value=60_000),
+	}
+)
+
+
+def stays_frame(rows: list[dict]) -> pl.LazyFrame:
+	"""Cage stays shaped like the frame calculate_pairwise_meetings feeds the engines."""
+	starts = [BASE + dt.timedelta(milliseconds=r["start"]) for r in rows]
+	ends = [s + dt.timedelta(milliseconds=r["length"]) for s, r in zip(starts, rows, strict=True)]
+	return pl.LazyFrame(
+		{
+			"animal_id": pl.Series([r["animal_id"] for r in rows], dtype=pl.Enum(strat.ANIMALS)),
+			"position": pl.Series([r["position"] for r in rows], dtype=pl.Categorical),
+			"phase": ["dark_phase"] * len(rows),
+			"day": [1] * len(rows),
+			"phase_count": [r["phase_count"] for r in rows],
+			"hour": pl.Series([r["hour"] for r in rows], dtype=pl.Int8),
+			"event_start": pl.Series(starts, dtype=pl.Datetime("ms")),
+			"event_end": pl.Series(ends, dtype=pl.Datetime("ms")),
+		}
+	)
+
+
+def kept_pairs(overlaps: pl.LazyFrame, minimum_time: float) -> pl.DataFrame:
+	return (
+		overlaps.filter(pl.col("overlap_duration") > minimum_time)
+		.select(PAIR_COLUMNS)
+		.collect()
+		.sort(PAIR_COLUMNS)
+	)
+
+
+@settings(max_examples=200, deadline=None)
+@given(rows=st.lists(stay, min_size=0, max_size=30), minimum_time=st.sampled_from([0, 0.5, 2]))
+def test_sweep_matches_join(rows, minimum_time):
+	lf = stays_frame(rows)
+	assert_frame_equal(
+		kept_pairs(_pair_overlaps_sweep(lf), minimum_time),
+		kept_pairs(_pair_overlaps_join(lf), minimum_time),
+	)
+
+
+def test_sweep_orients_pairs_and_takes_hour_from_first_animal():
+	"""B enters first in hour 0, A joins in hour 1: the pair is (A, B) in hour 1."""
+	lf = stays_frame(
+		[
+			{
+				"animal_id": "B",
+				"position": "cage_1",
+				"phase_count": 1,
+				"hour": 0,
+				"start": 0,
+				"length": 10_000,
+			},
+			{
+				"animal_id": "A",
+				"position": "cage_1",
+				"phase_count": 1,
+				"hour": 1,
+				"start": 4_000,
+				"length": 10_000,
+			},
+		]
+	)
+	result = _pair_overlaps_sweep(lf).collect()
+
+	assert result.height == 1
+	row = result.row(0, named=True)
+	assert (row["animal_id"], row["animal_id_2"]) == ("A", "B")
+	assert row["hour"] == 1
+	assert row["overlap_duration"] == 6.0
+
+
+# --- calculate_pairwise_meetings on the example project -----------------------
+@pytest.fixture(scope="module")
+def example_project(tmp_path_factory, make_project) -> Path:
+	# Half a day of recordings (the default): the reference join is quadratic in
+	# stays per cage-phase and needs several GB on the full example set.
+	config_path, _ = make_project(tmp_path_factory.mktemp("pairwise"), "pairwise")
+	d.get_ecohab_data_structure(config_path, fname_prefix="20")
+	d.calculate_intervals(config_path)
+	return config_path
+
+
+@pytest.mark.parametrize("minimum_time", [0, 2])
+def test_step_output_identical_between_methods(example_project, minimum_time):
+	keys = ["phase", "day", "phase_count", "hour", "position", "animal_id", "animal_id_2"]
+	results = {
+		method: d.calculate_pairwise_meetings(
+			example_project,
+			save_data=False,
+			overwrite=True,
+			minimum_time=minimum_time,
+			overlap_method=method,
+		)
+		.collect()
+		.sort(keys)
+		for method in ("sweep", "join")
+	}
+
+	assert results["sweep"]["pairwise_encounters"].sum() > 0
+	assert_frame_equal(results["sweep"], results["join"])
+
+
+def test_unknown_method_raises(example_project):
+	with pytest.raises(ValueError, match="overlap_method"):
+		d.calculate_pairwise_meetings(
+			example_project, save_data=False, overwrite=True, overlap_method="bogus"
+		)
@@ -6,11 +6,13 @@ instead of a full oracle we assert structural invariants that must always hold.
 
 import datetime as dt
 
+import polars as pl
 import strategies as strat
 from hypothesis import given, settings
 from hypothesis import strategies as st
+from polars.testing import assert_frame_equal
 
-from deepecohab.utils import auxfun
+from deepecohab.utils import auxfun, phase_calendar
 
 
 @settings(max_examples=150)
@@ -21,7 +23,7 @@ from deepecohab.utils import auxfun
 )
 def test_phase_durations_sum_and_positive_utc(start, span_minutes, pcfg):
 	"""In UTC (no DST), every phase duration is positive and the durations sum to
-	the experiment span within one minute of rounding slack.
+	the experiment span exactly.
 	"""
 	finish = start + dt.timedelta(minutes=span_minutes)
 	cfg = {
@@ -32,7 +34,7 @@ def test_phase_durations_sum_and_positive_utc(start, span_minutes, pcfg):
 	out = auxfun.get_phase_durations(cfg).collect()
 
 	assert (out["duration_seconds"] > 0).all()
-	assert abs(out["duration_seconds"].sum() - span_minutes * 60) <= 60
+	assert out["duration_seconds"].sum() == span_minutes * 60
 
 
 def test_phase_durations_positive_across_dst():
@@ -50,3 +52,63 @@ def test_phase_durations_positive_across_dst():
 	out = auxfun.get_phase_durations(cfg).collect()
 	assert out.height >= 1
 	assert (out["duration_seconds"] > 0).all()
+	assert out["duration_seconds"].sum() == (3 * 24 - 1) * 3600  # one hour skipped
+	# Lights keep the winter clock: light phases stay 13 h long after the change.
+	assert (
+		out.filter(pl.col("phase") == "light_phase")["duration_seconds"].to_list()
+		== [13 * 3600] * 3
+	)
+
+
+@settings(max_examples=100, deadline=None)
+@given(
+	start=strat.naive_datetimes,
+	span_hours=st.integers(min_value=1, max_value=24 * 4),
+	tz=strat.timezones,
+	pcfg=strat.phase_configs,
+)
+def test_calendar_matches_reference_labels(start, span_hours, tz, pcfg):
+	"""On a dense, sorted timeline the calendar's labels equal the reference oracles,
+	DST transitions included: phases keep the clock of the first row.
+	"""
+	times = (
+		pl.datetime_range(
+			start, start + dt.timedelta(hours=span_hours), "7m", time_zone="UTC", eager=True
+		)
+		.dt.convert_time_zone(tz)
+		.alias("datetime")
+	)
+	out = phase_calendar.label_calendar(times.to_frame().lazy(), {"phase": pcfg}).collect()
+
+	dst_shift = times.dt.dst_offset() - times.dt.dst_offset()[0]
+	phases = [strat.expected_phase(t, pcfg) for t in (times - dst_shift).dt.time()]
+	assert out["phase"].to_list() == phases
+	assert out["phase_count"].to_list() == strat.expected_phase_count(phases)
+	assert out["day"].to_list() == strat.expected_day(times.dt.date().to_list())
+	assert out["hour"].to_list() == strat.expected_hour(times.to_list())
+
+
+@settings(max_examples=50, deadline=None)
+@given(seed=st.integers(min_value=0, max_value=2**16), tz=strat.timezones)
+def test_calendar_labels_do_not_depend_on_row_order(seed, tz):
+	"""Labelling a shuffled frame gives every row the same labels as in order."""
+	cfg = {
+		"phase": strat.PHASE_CONFIGS[0],
+		"timezone": tz,
+		"experiment_timeline": {
+			"start_date": "2023-03-24 10:15:00",
+			"finish_date": "2023-04-02 18:00:00",
+		},
+	}
+	times = pl.datetime_range(
+		dt.datetime(2023, 3, 24, 10, 15),
+		dt.datetime(2023, 4, 2, 18),
+		"13m",
+		time_zone=tz,
+		eager=True,
+	).alias("datetime")
+	ordered = phase_calendar.label_calendar(times.to_frame().lazy(), cfg).collect()
+	shuffled = phase_calendar.label_calendar(times.shuffle(seed).to_frame().lazy(), cfg).collect()
+
+	assert_frame_equal(shuffled.sort("datetime"), ordered)
+	assert ordered["phase_count"].min() == 1
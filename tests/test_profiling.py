@@ -0,0 +1,118 @@
+"""Profiling ledger (``results/_profile.parquet``) and ``df_registry.profile_report``.
+
+Every data-structure build and every computed step must append one row with its
+timings, row counts and output size; cached steps and runs kept in memory must
+not, and the report must summarise the ledger per step.
+"""
+
+import datetime as dt
+import json
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+import deepecohab as d
+from deepecohab.core.registries import config_fingerprint
+from deepecohab.utils import profiling, results_io
+
+TARGETS = ["activity_df", "pairwise_rollup"]
+
+
+@pytest.fixture()
+def project_build() -> dict:
+	return {"padded": ["1m"]}
+
+
+def test_builds_and_steps_are_logged(project):
+	list(d.df_registry.run_pipeline(project, targets=TARGETS, minimum_time=3))
+
+	ledger = d.df_registry.profile_report(project, raw=True)
+	results = Path(d.read_config(project)["project_location"]) / "results"
+	assert ledger["step"].to_list() == [
+		"padded_df@1m",
+		"main_df",
+		*d.df_registry.last_report.steps,
+	]
+	assert ledger["wall_seconds"].min() > 0
+	assert ledger["cpu_seconds"].min() >= 0
+	assert ledger["config_fingerprint"].unique().to_list() == [
+		config_fingerprint(d.read_config(project))
+	]
+
+	for row in ledger.iter_rows(named=True):
+		location = results_io.result_location(results, row["step"])
+		assert row["bytes_out"] == results_io.result_size(location), row["step"]
+		assert row["rows_out"] == results_io.read_result(location).height, row["step"]
+
+	main_df = ledger.row(by_predicate=pl.col("step") == "main_df", named=True)
+	meetings = ledger.row(by_predicate=pl.col("step") == "pairwise_meetings", named=True)
+	assert main_df["kind"] == "structure" and main_df["rows_in"] > 0 and main_df["rows_out"] > 0
+	assert meetings["kind"] == "step"
+	assert (
+		meetings["rows_in"]
+		== results_io.read_result(results_io.result_location(results, "intervals")).height
+	)
+	assert json.loads(meetings["kwargs"])["minimum_time"] == 3
+	assert d.df_registry.last_report.step_seconds.keys() == set(d.df_registry.last_report.steps)
+
+
+def test_cached_and_unsaved_runs_are_not_logged(project):
+	list(d.df_registry.run_pipeline(project, targets=TARGETS))
+	logged = d.df_registry.profile_report(project, raw=True).height
+
+	list(d.df_registry.run_pipeline(project, targets=TARGETS))
+	assert d.df_registry.last_report.step_seconds == {}
+	list(d.df_registry.run_pipeline(project, targets=TARGETS, overwrite=True, save_data=False))
+	assert d.df_registry.last_report.step_seconds.keys() == set(TARGETS) | {
+		"intervals",
+		"pairwise_meetings",
+	}
+
+	assert d.df_registry.profile_report(project, raw=True).height == logged
+
+
+def test_ledger_is_written_once_per_run(project, monkeypatch):
+	writes = []
+	append = profiling.append
+	monkeypatch.setattr(
+		profiling,
+		"append",
+		lambda path, records: writes.append(len(records)) or append(path, records),
+	)
+
+	list(d.df_registry.run_pipeline(project, targets=TARGETS, jobs=2))
+	d.get_ecohab_data_structure(project, fname_prefix="20", padded=["1m", "1h"], overwrite=True)
+
+	assert writes == [len(d.df_registry.last_report.steps), 3]
+	assert d.df_registry.profile_report(project, raw=True).height == 2 + sum(writes)
+
+
+def test_fused_run_is_logged_once(project):
+	list(d.df_registry.run_pipeline(project, targets=TARGETS, fused=True))
+
+	fused = d.df_registry.profile_report(project, raw=True).filter(pl.col("kind") == "fused")
+	assert fused.height == 1
+	assert sorted(json.loads(fused["kwargs"].item())["steps"]) == sorted(
+		d.df_registry.last_report.steps
+	)
+
+
+def test_report_summarises_runs_slowest_first(tmp_path):
+	start = dt.datetime(2024, 1, 1, tzinfo=dt.UTC)
+	records = []
+	for i, (step, seconds) in enumerate([("a", 1.0), ("b", 5.0), ("a", 3.0), ("a", 2.0)]):
+		record = profiling.ProfileRecord(step, "step", started=start + dt.timedelta(minutes=i))
+		record.stop()
+		record.wall_seconds, record.rows_out = seconds, i
+		records.append(record)
+	profiling.append(tmp_path, records[:2])
+	profiling.append(tmp_path, records[2:])
+
+	report = profiling.summarise(profiling.read_ledger(tmp_path))
+
+	assert report.select(
+		"step", "runs", "last_wall_seconds", "median_wall_seconds", "total_wall_seconds"
+	).rows() == [("b", 1, 5.0, 5.0, 5.0), ("a", 3, 2.0, 2.0, 6.0)]
+	assert report["last_rows_out"].to_list() == [1, 3]
+	assert list(results_io.list_results(tmp_path)) == []
@@ -0,0 +1,90 @@
+"""ProjectStore: lazy scan handles, (table, filter)-keyed slice LRU, mtime invalidation."""
+
+import os
+
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+from deepecohab.utils.project_store import ProjectStore
+
+TABLE = pl.DataFrame(
+	{
+		"animal_id": ["A", "B", "A", "B", "A", "B"],
+		"phase": ["dark_phase", "light_phase"] * 3,
+		"day": [1, 1, 2, 2, 3, 3],
+		"value": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+	}
+)
+
+
+@pytest.fixture()
+def store(tmp_path) -> ProjectStore:
+	results = tmp_path / "results"
+	results.mkdir()
+	TABLE.write_parquet(results / "activity_df.parquet")
+	TABLE.drop("phase", "day").write_parquet(results / "ranking.parquet")
+	pl.DataFrame({"file": ["a.txt"]}).write_parquet(results / "_ingest_manifest.parquet")
+	return ProjectStore({"project_location": str(tmp_path)}, max_entries=2)
+
+
+def _rewrite(store: ProjectStore, key: str, df: pl.DataFrame) -> None:
+	path = store.results_path / f"{key}.parquet"
+	mtime = path.stat().st_mtime_ns
+	df.write_parquet(path)
+	# Coarse filesystem clocks can leave the mtime unchanged on a fast rewrite.
+	os.utime(path, ns=(mtime + 1_000_000, mtime + 1_000_000))
+
+
+def test_indexing_returns_lazy_scans_of_tables_only(store):
+	assert isinstance(store["activity_df"], pl.LazyFrame)
+	assert list(store) == ["activity_df", "ranking"]
+	assert "main_df" not in store
+	with pytest.raises(KeyError):
+		store["main_df"]
+
+
+def test_slice_filters_and_projects(store):
+	result = store.slice(
+		"activity_df", ["day", "value"], days_range=[2, 3], phase_type=["dark_phase"]
+	)
+
+	expected = TABLE.filter(pl.col("day") >= 2, pl.col("phase") == "dark_phase").select(
+		"day", "value"
+	)
+	assert_frame_equal(result, expected)
+
+
+def test_slice_ignores_filters_on_missing_columns(store):
+	result = store.slice("ranking", days_range=[2, 2], phase_type=["dark_phase"])
+
+	assert_frame_equal(result, TABLE.drop("phase", "day"))
+
+
+def test_slices_are_cached_per_filter_with_lru_bound(store):
+	first = store.slice("activity_df", days_range=[1, 1])
+	assert store.slice("activity_df", days_range=[1, 1]) is first
+	assert store.slice("activity_df", days_range=[1, 2]) is not first
+
+	store.slice("ranking")  # third entry evicts the least recently used one
+	assert store.slice("activity_df", days_range=[1, 1]) is not first
+
+
+def test_rewritten_table_is_reread(store):
+	before = store.slice("activity_df", ["value"])
+	_rewrite(store, "activity_df", TABLE.with_columns(pl.col("value") * 10))
+
+	after = store.slice("activity_df", ["value"])
+
+	assert after is not before
+	assert after["value"].to_list() == [v * 10 for v in TABLE["value"]]
+	assert store["activity_df"].select(pl.max("value")).collect().item() == 60.0
+
+
+def test_deleted_table_disappears(store):
+	store.slice("ranking")
+	(store.results_path / "ranking.parquet").unlink()
+
+	assert "ranking" not in store
+	with pytest.raises(KeyError):
+		store.slice("ranking")
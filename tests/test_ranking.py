@@ -1,18 +1,24 @@
 """Tests for calculate_ranking (Plackett-Luce dominance ranking).
 
 calculate_ranking replays each chasing event in match_df as a one-on-one match
-and emits the full rating trajectory (one row per animal after every match). The
+and stores a sparse trajectory (starting ratings plus the two changed rows per
+match); densify_ranking expands it to one row per animal after every match. The
 step reads match_df via auxfun._get_data, so we monkeypatch that to feed a small,
 hand-built match table and exercise the pure compute body directly via
-``__wrapped__`` (bypassing the lifecycle cache/parquet sink).
+``__wrapped__`` (bypassing the lifecycle cache/parquet sink). The closed-form
+rating kernel is checked against openskill itself.
 """
 
 import datetime as dt
 
+import numpy as np
 import polars as pl
 import pytest
 import tzlocal
+from hypothesis import given, settings
+from hypothesis import strategies as st
 from openskill.models import PlackettLuce
+from polars.testing import assert_frame_equal
 
 from deepecohab.analysis import antenna_analysis
 
@@ -51,7 +57,7 @@ def make_match_df(rows: list[tuple[str, str, dt.datetime]]) -> pl.LazyFrame:
 	)
 
 
-def run_ranking(monkeypatch, match_df, animal_ids, prev_ranking=None) -> pl.DataFrame:
+def run_sparse_ranking(monkeypatch, match_df, animal_ids, prev_ranking=None) -> pl.DataFrame:
 	"""Call the pure ranking body with match_df injected in place of _get_data."""
 	monkeypatch.setattr(antenna_analysis.auxfun, "_get_data", lambda cfg, key: match_df)
 	cfg = {"animal_ids": animal_ids, "phase": PHASE_CFG}
@@ -59,6 +65,33 @@ def run_ranking(monkeypatch, match_df, animal_ids, prev_ranking=None) -> pl.Data
 	return antenna_analysis.calculate_ranking.__wrapped__(cfg, **kwargs).collect()
 
 
+def run_ranking(monkeypatch, match_df, animal_ids, prev_ranking=None) -> pl.DataFrame:
+	"""Dense trajectory: one row per animal after every match."""
+	sparse = run_sparse_ranking(monkeypatch, match_df, animal_ids, prev_ranking)
+	return antenna_analysis.densify_ranking(sparse).collect()
+
+
+def openskill_trajectory(matches, animal_ids) -> pl.DataFrame:
+	"""Reference: replay matches through openskill, one row per animal per match."""
+	ranking = {player: MODEL.rating() for player in animal_ids}
+	rows = []
+	for loser, winner, dtime in matches:
+		new_ratings = MODEL.rate([[ranking[loser]], [ranking[winner]]], ranks=[1, 0])
+		ranking[loser] = new_ratings[0][0]
+		ranking[winner] = new_ratings[1][0]
+		rows += [
+			{
+				"animal_id": animal,
+				"mu": rating.mu,
+				"sigma": rating.sigma,
+				"ordinal": round(rating.ordinal(), 3),
+				"datetime": dtime,
+			}
+			for animal, rating in ranking.items()
+		]
+	return pl.DataFrame(rows, schema_overrides={"datetime": pl.Datetime("us", str(TZ))})
+
+
 def final_block(result: pl.DataFrame) -> dict[str, float]:
 	"""Map animal_id -> ordinal in the last-emitted block (final standings)."""
 	last = result.filter(pl.col("datetime") == result["datetime"].max())
@@ -75,14 +108,29 @@ def test_output_schema(monkeypatch):
 		"sigma",
 		"ordinal",
 		"datetime",
+		"match_id",
 		"phase",
 		"day",
 		"hour",
 	}
 
 
+def test_sparse_stores_start_and_two_rows_per_match(monkeypatch):
+	"""Stored table: one starting row per animal, then only the two players per match."""
+	matches = [
+		("B", "A", at(2023, 5, 24, 12, 0, 0)),
+		("C", "A", at(2023, 5, 24, 12, 1, 0)),
+		("B", "C", at(2023, 5, 24, 12, 2, 0)),
+	]
+	result = run_sparse_ranking(monkeypatch, make_match_df(matches), ["A", "B", "C", "D"])
+
+	assert result.height == 4 + 2 * len(matches)
+	assert result.filter(pl.col("match_id") == 0)["animal_id"].to_list() == ["A", "B", "C", "D"]
+	assert result.filter(pl.col("match_id") == 2)["animal_id"].sort().to_list() == ["A", "C"]
+
+
 def test_one_row_per_animal_per_match(monkeypatch):
-	"""Every match emits one row for every animal (full trajectory)."""
+	"""The densified view has one row for every animal after each match."""
 	matches = [
 		("B", "A", at(2023, 5, 24, 12, 0, 0)),
 		("B", "A", at(2023, 5, 24, 12, 1, 0)),
@@ -209,3 +257,46 @@ def test_round_trip_continues_from_prev(monkeypatch):
 	assert final2["A"] == final1["A"]
 	assert final2["B"] == final1["B"]
 	assert final2["A"] > final2["B"]
+
+
+# --- equivalence with openskill ----------------------------------------------
+
+
+match_pairs = st.lists(
+	st.tuples(st.sampled_from("ABCDE"), st.sampled_from("ABCDE")).filter(lambda p: p[0] != p[1]),
+	min_size=1,
+	max_size=60,
+)
+
+
+@settings(max_examples=50, deadline=None)
+@given(pairs=match_pairs)
+def test_dense_trajectory_matches_openskill(pairs):
+	"""Kernel + densify reproduce openskill's sequential rate() to float tolerance."""
+	animal_ids = list("ABCDE")
+	matches = [
+		(lo, win, at(2023, 5, 24, 12, 0, 0) + dt.timedelta(seconds=i))
+		for i, (lo, win) in enumerate(pairs)
+	]
+	with pytest.MonkeyPatch.context() as monkeypatch:
+		result = run_ranking(monkeypatch, make_match_df(matches), animal_ids)
+
+	expected = openskill_trajectory(matches, animal_ids)
+	assert_frame_equal(result.select(expected.columns), expected, rel_tol=1e-12, abs_tol=1e-9)
+
+
+def test_kernel_matches_openskill_for_extreme_ratings():
+	"""Lopsided and near-converged ratings follow openskill too (sigma floor, upsets)."""
+	cases = [(45.0, 1.0, 5.0, 1.0), (5.0, 8.0, 45.0, 0.5), (25.0, 0.05, 25.0, 0.05)]
+	for mu_w, sigma_w, mu_l, sigma_l in cases:
+		expected = MODEL.rate(
+			[[MODEL.rating(mu=mu_l, sigma=sigma_l)], [MODEL.rating(mu=mu_w, sigma=sigma_w)]],
+			ranks=[1, 0],
+		)
+		got = antenna_analysis._plackett_luce_1v1(
+			np.array([mu_w]), np.array([sigma_w]), np.array([mu_l]), np.array([sigma_l]), MODEL
+		)
+		assert got[0][0] == pytest.approx(expected[1][0].mu, rel=1e-12)
+		assert got[1][0] == pytest.approx(expected[1][0].sigma, rel=1e-12)
+		assert got[2][0] == pytest.approx(expected[0][0].mu, rel=1e-12)
+		assert got[3][0] == pytest.approx(expected[0][0].sigma, rel=1e-12)
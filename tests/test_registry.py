@@ -1,14 +1,25 @@
-"""Tests for DataFrameRegistry dependency resolution (_resolve_order).
+"""Tests for DataFrameRegistry dependency resolution and the pipeline executor.
 
 The topological sort is the one piece of pipeline orchestration that is pure and
 free of I/O, so it is unit-testable in isolation. We build throwaway registries
 with register_step (the lifecycle body never runs here) and assert ordering
-invariants, plus a few checks against the real df_registry.
+invariants, plus a few checks against the real df_registry. The executor tests
+give the throwaway steps bodies that record or synchronise, and run them with
+overwrite=True/save_data=False so no project or results directory is touched.
+The figure-cache tests register counting plots on a throwaway PlotRegistry.
 """
 
+import json
+import threading
+
+import plotly.graph_objects as go
+import polars as pl
 import pytest
 
-from deepecohab.core.registries import DataFrameRegistry, df_registry
+from deepecohab.core.registries import GRID_KEY, DataFrameRegistry, PlotRegistry, df_registry
+from deepecohab.utils import results_io
+from deepecohab.utils.auxfun_plots import PlotConfig
+from deepecohab.utils.project_store import ProjectStore
 
 
 def _make(deps: dict[str, list[str]]) -> DataFrameRegistry:
@@ -83,3 +94,155 @@ def test_real_pipeline_order_respects_dependencies():
 	assert order.index("match_df") < order.index("ranking")
 	for dep in ("chasings_df", "tube_test_df", "pairwise_meetings", "activity_df"):
 		assert order.index(dep) < order.index("feature_df")
+
+
+def test_sparse_steps_record_their_grid(tmp_path):
+	grid = {"columns": ["winner", "loser"], "ordered": True, "positions": None}
+	reg = DataFrameRegistry()
+
+	@reg.register_step("pairs", grid=grid)
+	def _pairs(cfg, **kwargs):
+		return pl.LazyFrame({"winner": ["A"], "loser": ["B"], "n": [1]})
+
+	(tmp_path / "results").mkdir()
+	_pairs({"project_location": str(tmp_path)})
+
+	metadata = results_io.result_metadata(tmp_path / "results" / "pairs.parquet")
+	assert json.loads(metadata[GRID_KEY]) == grid
+	assert reg.grid("pairs") == grid
+	assert df_registry.grid("activity_df") is None
+	assert df_registry.grid("chasings_df")["positions"] == "tunnels_directional"
+
+
+# --- run_pipeline executor ---------------------------------------------------
+
+
+def _make_running(deps: dict[str, list[str]], body) -> DataFrameRegistry:
+	"""Registry whose steps call ``body(name)``; run with overwrite/no saving."""
+	reg = DataFrameRegistry()
+	for name, requires in deps.items():
+
+		@reg.register_step(name, requires=requires)
+		def _step(cfg, _name=name, **kwargs):
+			body(_name)
+			return pl.LazyFrame({"step": [_name]})
+
+	return reg
+
+
+def _run(reg: DataFrameRegistry, jobs: int) -> list[tuple[str, int, int]]:
+	return list(reg.run_pipeline({}, jobs=jobs, overwrite=True, save_data=False))
+
+
+DIAMOND = {"root": [], "left": ["root"], "right": ["root"], "join": ["left", "right"]}
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_pipeline_runs_dependencies_before_dependants(jobs):
+	finished: list[str] = []
+	events = _run(_make_running(DIAMOND, finished.append), jobs)
+
+	assert _is_topo(finished, DIAMOND)
+	# Steps store and profile their result after the body returns, so independent
+	# steps may complete in another order than their bodies ran in.
+	assert _is_topo([name for name, _, _ in events], DIAMOND)
+	assert sorted(name for name, _, _ in events) == sorted(finished)
+	assert [(current, total) for _, current, total in events] == [(i, 4) for i in range(1, 5)]
+
+
+def test_parallel_pipeline_overlaps_independent_steps():
+	# left and right only meet at the barrier if they run at the same time.
+	barrier = threading.Barrier(2, timeout=5)
+
+	def body(name):
+		if name in ("left", "right"):
+			barrier.wait()
+
+	events = _run(_make_running(DIAMOND, body), jobs=2)
+	assert events[-1][0] == "join"
+
+
+def test_parallel_pipeline_reraises_step_failure():
+	def body(name):
+		if name == "left":
+			raise RuntimeError("left failed")
+
+	ran: list[str] = []
+	reg = _make_running(DIAMOND, lambda name: (ran.append(name), body(name)))
+	with pytest.raises(RuntimeError, match="left failed"):
+		_run(reg, jobs=2)
+	assert "join" not in ran
+
+
+# --- PlotRegistry figure cache --------------------------------------------------
+def _make_plots(calls: list, **cache_limits) -> PlotRegistry:
+	reg = PlotRegistry(**cache_limits)
+
+	@reg.register("days")
+	def _days(store: ProjectStore, days_range: list[int]) -> go.Figure:
+		calls.append(tuple(days_range))
+		return go.Figure(go.Bar(y=list(range(days_range[0], days_range[1] + 1))))
+
+	return reg
+
+
+@pytest.fixture()
+def plot_store(tmp_path) -> ProjectStore:
+	(tmp_path / "results").mkdir()
+	pl.DataFrame({"day": [1]}).write_parquet(tmp_path / "results" / "activity_df.parquet")
+	return ProjectStore({"project_location": str(tmp_path)})
+
+
+def test_figure_cache_reuses_figures_per_dependency_values(plot_store):
+	calls: list = []
+	reg = _make_plots(calls)
+
+	first = reg.get_plot("days", PlotConfig(store=plot_store, days_range=[1, 2]))
+	reg.get_plot("days", PlotConfig(store=plot_store, days_range=[1, 3]))
+	# Fields the plot does not declare are not part of the key.
+	again = reg.get_plot("days", PlotConfig(store=plot_store, days_range=[1, 2], agg_switch="mean"))
+
+	assert again is first
+	assert calls == [(1, 2), (1, 3)]
+
+
+def test_figure_cache_misses_after_project_tables_change(plot_store):
+	calls: list = []
+	reg = _make_plots(calls)
+	cfg = PlotConfig(store=plot_store, days_range=[1, 2])
+
+	reg.get_plot("days", cfg)
+	pl.DataFrame({"day": [1, 2]}).write_parquet(plot_store.results_path / "activity_df.parquet")
+	reg.get_plot("days", cfg)
+
+	assert calls == [(1, 2), (1, 2)]
+
+
+def test_figure_cache_evicts_least_recently_used(plot_store):
+	calls: list = []
+	reg = _make_plots(calls, max_cached_figures=2)
+
+	for days in ([1, 1], [1, 2], [1, 1], [1, 3], [1, 2]):
+		reg.get_plot("days", PlotConfig(store=plot_store, days_range=days))
+
+	# [1, 2] was evicted by [1, 3] because [1, 1] was used more recently.
+	assert calls == [(1, 1), (1, 2), (1, 3), (1, 2)]
+
+
+def test_figure_cache_skips_values_without_a_stable_key(plot_store):
+	calls: list = []
+	reg = PlotRegistry()
+
+	@reg.register("onset")
+	def _onset(light_dark_onset: dict[str, float]) -> go.Figure:
+		calls.append(dict(light_dark_onset))
+		return go.Figure()
+
+	# An object() has no stable key (its repr carries its id), so it is not cached.
+	for _ in range(2):
+		reg.get_plot("onset", PlotConfig(light_dark_onset={"light": object()}))
+	reg.get_plot("onset", PlotConfig(light_dark_onset={"light": 7.0}))
+	reg.get_plot("onset", PlotConfig(light_dark_onset={"light": 7.0}))
+
+	assert len(calls) == 3
+	assert list(reg._figures) == [(None, "onset", '{"light_dark_onset": {"light": 7.0}}')]
@@ -0,0 +1,188 @@
+"""Day-partitioned results (``partition_results``): layout, loading, pruning and appends.
+
+Partitioned projects must load exactly the tables a single-file project holds,
+day filters must only open the selected days' files, and an incremental ingest
+must leave the partitions before the first changed day untouched.
+"""
+
+import datetime as dt
+import shutil
+from pathlib import Path
+
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+import deepecohab as d
+from deepecohab.utils import results_io
+from deepecohab.utils.project_store import ProjectStore
+from deepecohab.utils.synthetic import generate_raw_data
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+RAW_FILES = sorted((REPO_ROOT / "examples" / "example_data").glob("*.txt"))
+
+TABLE = pl.DataFrame(
+	{
+		"day": pl.Series([1, 1, 2, 3, 3], dtype=pl.UInt16),
+		"value": [1, 2, 3, 4, 5],
+	}
+)
+
+
+def _results(config_path: Path) -> Path:
+	return Path(d.read_config(config_path)["project_location"]) / "results"
+
+
+def _part_mtimes(directory: Path) -> dict[str, int]:
+	return {p.parent.name: p.stat().st_mtime_ns for p in directory.glob("day=*/*.parquet")}
+
+
+def test_partitioned_write_splits_by_day(tmp_path):
+	results_io.write_result(TABLE.lazy(), tmp_path, "activity_df", partitioned=True)
+
+	location = results_io.result_location(tmp_path, "activity_df")
+	assert location == tmp_path / "activity_df"
+	assert sorted(_part_mtimes(location)) == ["day=1", "day=2", "day=3"]
+	assert_frame_equal(results_io.read_result(location).sort("value"), TABLE)
+
+
+def test_tables_without_day_are_single_files(tmp_path):
+	results_io.write_result(TABLE.drop("day").lazy(), tmp_path, "ranking", partitioned=True)
+
+	assert results_io.result_location(tmp_path, "ranking") == tmp_path / "ranking.parquet"
+
+
+def test_switching_layout_replaces_the_old_one(tmp_path):
+	results_io.write_result(TABLE.lazy(), tmp_path, "activity_df")
+	results_io.write_result(TABLE.lazy(), tmp_path, "activity_df", partitioned=True)
+	assert not (tmp_path / "activity_df.parquet").exists()
+
+	results_io.write_result(TABLE.lazy(), tmp_path, "activity_df")
+	assert not (tmp_path / "activity_df").exists()
+	assert list(results_io.list_results(tmp_path)) == ["activity_df"]
+
+
+def test_day_scoped_write_patches_only_listed_days(tmp_path):
+	results_io.write_result(TABLE.lazy(), tmp_path, "activity_df", partitioned=True)
+	before = _part_mtimes(tmp_path / "activity_df")
+
+	updated = pl.concat([TABLE.filter(pl.col("day") < 3), TABLE.filter(pl.col("day") == 1)])
+	results_io.write_result(
+		updated.with_columns(pl.col("value") * 10).lazy(),
+		tmp_path,
+		"activity_df",
+		partitioned=True,
+		days=[2, 3],
+	)
+
+	after = _part_mtimes(tmp_path / "activity_df")
+	assert after["day=1"] == before["day=1"]
+	assert "day=3" not in after  # listed day without rows is removed
+	result = results_io.read_result(tmp_path / "activity_df").sort("value")
+	assert result["value"].to_list() == [1, 2, 30]
+
+
+def test_day_filter_opens_only_selected_partitions(tmp_path):
+	(tmp_path / "results").mkdir()
+	results_io.write_result(TABLE.lazy(), tmp_path / "results", "activity_df", partitioned=True)
+	store = ProjectStore({"project_location": str(tmp_path)})
+
+	plan = store["activity_df"].filter(pl.col("day") == 2).explain()
+
+	assert "day=2/part.parquet]" in plan
+	assert "day=1" not in plan and "day=3" not in plan
+	assert store.slice("activity_df", days_range=[2, 2])["value"].to_list() == [3]
+
+
+@pytest.fixture(scope="module")
+def file_build(tmp_path_factory, make_project) -> Path:
+	config_path, _ = make_project(tmp_path_factory.mktemp("file"), "file", RAW_FILES)
+	d.get_ecohab_data_structure(config_path, fname_prefix="20", padded=["1m"])
+	return config_path
+
+
+def test_partitioned_append_matches_file_build(tmp_path, make_project, file_build):
+	config_path, data_dir = make_project(tmp_path, "parts", RAW_FILES[:60], partition_results=True)
+	d.get_ecohab_data_structure(config_path, fname_prefix="20", padded=["1m"])
+	results = _results(config_path)
+	assert results_io.result_location(results, "main_df") == results / "main_df"
+
+	first_day = d.load_ecohab_data(config_path, "main_df").select(pl.min("day")).collect().item()
+	before = _part_mtimes(results / "main_df")
+
+	for f in RAW_FILES[60:]:
+		shutil.copy(f, data_dir / f.name)
+	d.get_ecohab_data_structure(config_path, fname_prefix="20", append=True, padded=["1m"])
+
+	assert _part_mtimes(results / "main_df")[f"day={first_day}"] == before[f"day={first_day}"]
+	for key, sort_keys in {
+		"main_df": ["datetime", "animal_id"],
+		"padded_df": ["datetime", "animal_id", "time_spent"],
+	}.items():
+		assert_frame_equal(
+			d.load_ecohab_data(config_path, key, return_df=True)
+			.drop("row_id", strict=False)
+			.sort(sort_keys),
+			d.load_ecohab_data(file_build, key, return_df=True)
+			.drop("row_id", strict=False)
+			.sort(sort_keys),
+			categorical_as_str=True,
+		)
+
+
+def test_partitions_are_read_in_day_order(tmp_path):
+	table = pl.DataFrame({"day": pl.Series(range(1, 13), dtype=pl.UInt16)})
+	results_io.write_result(table.lazy(), tmp_path, "activity_df", partitioned=True)
+
+	location = tmp_path / "activity_df"
+	assert results_io.read_result(location)["day"].to_list() == list(range(1, 13))
+	assert results_io.scan_result(location).collect()["day"].to_list() == list(range(1, 13))
+	assert results_io.result_rows(location) == 12
+
+
+def test_partitioned_append_past_ten_days_matches_file_build(tmp_path, make_project):
+	# Day partitions day=10 onwards sort before day=2 as strings.
+	dataset = generate_raw_data(
+		tmp_path / "synthetic", animals=4, days=12, reads_per_hour=10, start=dt.datetime(2023, 5, 1)
+	)
+	files = sorted(dataset.data_path.glob("*.txt"))
+	builds = {}
+	for name, partitioned, first_batch in [("file", False, files), ("parts", True, files[:200])]:
+		config_path, data_dir = make_project(
+			tmp_path, name, first_batch, partition_results=partitioned
+		)
+		d.get_ecohab_data_structure(config_path, fname_prefix="20", padded=["1m"])
+		builds[name] = config_path
+	for f in files[200:]:
+		shutil.copy(f, data_dir / f.name)
+	d.get_ecohab_data_structure(builds["parts"], fname_prefix="20", append=True, padded=["1m"])
+
+	main_df = d.load_ecohab_data(builds["parts"], "main_df", return_df=True)
+	assert main_df["day"].max() >= 12
+	assert main_df["datetime"].is_sorted()
+	for key, sort_keys in {
+		"main_df": ["datetime", "animal_id"],
+		"padded_df@1m": ["datetime", "animal_id", "time_spent"],
+	}.items():
+		assert_frame_equal(
+			d.load_ecohab_data(builds["parts"], key, return_df=True)
+			.drop("row_id", strict=False)
+			.sort(sort_keys),
+			d.load_ecohab_data(builds["file"], key, return_df=True)
+			.drop("row_id", strict=False)
+			.sort(sort_keys),
+			categorical_as_str=True,
+		)
+
+
+def test_partitioned_pipeline_is_fresh_after_run(tmp_path, make_project):
+	config_path, _ = make_project(tmp_path, "pipeline", RAW_FILES[:12], partition_results=True)
+	d.get_ecohab_data_structure(config_path, fname_prefix="20")
+	list(d.df_registry.run_pipeline(config_path))
+
+	results = _results(config_path)
+	assert results_io.result_location(results, "activity_df") == results / "activity_df"
+	assert results_io.result_location(results, "phase_durations") == (
+		results / "phase_durations.parquet"
+	)
+	assert d.df_registry.stale_steps(config_path) == []
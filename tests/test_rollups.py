@@ -0,0 +1,102 @@
+"""Dashboard rollups: daily totals with prefix sums, and range queries over them.
+
+A random hourly table is rolled up with ``_day_rollup`` and written where a
+ProjectStore finds it; ``_range_totals`` (cumulative difference over two days)
+must equal a direct sum of the hourly rows over the same days and phases.
+"""
+
+import polars as pl
+import strategies as strat
+from hypothesis import given, settings
+from hypothesis import strategies as st
+from polars.testing import assert_frame_equal
+
+from deepecohab.analysis.rollups import _day_rollup
+from deepecohab.utils.auxfun_plots import _range_totals
+from deepecohab.utils.project_store import ProjectStore
+
+ANIMALS = strat.ANIMALS[:3]
+
+cell = st.fixed_dictionaries(
+	{
+		"day": st.integers(min_value=1, max_value=6),
+		"phase": st.sampled_from(strat.PHASE_NAMES),
+		"hour": st.integers(min_value=0, max_value=23),
+		"chaser": st.sampled_from(ANIMALS),
+		"chased": st.sampled_from(ANIMALS),
+		"chasings": st.integers(min_value=0, max_value=5),
+	}
+)
+
+
+def hourly_frame(rows: list[dict]) -> pl.LazyFrame:
+	return pl.LazyFrame(
+		rows,
+		schema={
+			"day": pl.UInt16,
+			"phase": pl.Enum(strat.PHASE_NAMES),
+			"hour": pl.UInt8,
+			"chaser": pl.Enum(ANIMALS),
+			"chased": pl.Enum(ANIMALS),
+			"chasings": pl.UInt32,
+		},
+	)
+
+
+def test_rollup_fills_every_day_and_accumulates():
+	keys = ["day", "phase", "hour", "chaser", "chased", "chasings"]
+	lf = hourly_frame(
+		[
+			dict(zip(keys, row, strict=True))
+			for row in [
+				(1, "dark_phase", 1, "A", "B", 2),
+				(1, "dark_phase", 2, "A", "B", 1),
+				(3, "dark_phase", 1, "A", "B", 4),
+			]
+		]
+	)
+	result = _day_rollup(lf, ["chaser", "chased"], ["chasings"]).collect()
+
+	assert result["day"].to_list() == [1, 2, 3]
+	assert result["chasings"].to_list() == [3, 0, 4]
+	assert result["hours"].to_list() == [2, 0, 1]
+	assert result["chasings_cum"].to_list() == [3, 3, 7]
+
+
+@settings(max_examples=60, deadline=None)
+@given(
+	rows=st.lists(cell, min_size=1, max_size=40),
+	bounds=st.tuples(st.integers(1, 6), st.integers(1, 6)).map(sorted),
+	phases=st.sampled_from([["dark_phase"], ["light_phase"], strat.PHASE_NAMES]),
+)
+def test_range_totals_equal_direct_sums(tmp_path_factory, rows, bounds, phases):
+	root = tmp_path_factory.mktemp("rollup")
+	(root / "results").mkdir()
+	lf = hourly_frame(rows)
+	_day_rollup(lf, ["chaser", "chased"], ["chasings"]).sink_parquet(
+		root / "results" / "chasings_rollup.parquet"
+	)
+	# Range queries are only asked within the experiment's days.
+	last = max(r["day"] for r in rows)
+	days_range = [min(bounds[0], last), min(bounds[1], last)]
+
+	result = _range_totals(
+		ProjectStore({"project_location": str(root)}),
+		"chasings_rollup",
+		["chaser", "chased"],
+		["chasings", "hours"],
+		days_range,
+		phases,
+	).collect()
+
+	expected = (
+		lf.filter(pl.col("day").is_between(*days_range), pl.col("phase").is_in(phases))
+		.group_by("chaser", "chased")
+		.agg(pl.sum("chasings"), pl.len().alias("hours"))
+		.collect()
+	)
+	assert_frame_equal(
+		result.filter(pl.col("hours") > 0).sort("chaser", "chased"),
+		expected.sort("chaser", "chased"),
+		check_dtypes=False,
+	)
@@ -0,0 +1,70 @@
+"""Synthetic raw data (``deepecohab.utils.synthetic``) must ingest like recorded data.
+
+Generated files must be read by ``get_ecohab_data_structure`` for both bundled
+layouts: ghost tags dropped, reads across an autumn DST change placed in order on
+both sides of it, every read kept and every simulated chasing found by ``match_df``.
+"""
+
+import datetime as dt
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+import deepecohab as d
+from deepecohab.utils.synthetic import SyntheticDataset, generate_raw_data
+
+
+def _build(tmp_path: Path, **kwargs) -> tuple[Path, SyntheticDataset]:
+	dataset = generate_raw_data(tmp_path / "data", animals=6, days=2, **kwargs)
+	config_path, _ = d.create_ecohab_project(
+		project_location=tmp_path, experiment_name="synthetic", **dataset.project_kwargs()
+	)
+	d.get_ecohab_data_structure(config_path, padded=False, **dataset.structure_kwargs())
+	return config_path, dataset
+
+
+@pytest.mark.parametrize("boards", [1, 4])
+def test_generated_data_ingests(tmp_path, boards):
+	config_path, dataset = _build(tmp_path, boards=boards, start=dt.datetime(2023, 10, 28, 12))
+	cfg = d.read_config(config_path)
+	main_df = d.load_ecohab_data(config_path, "main_df", return_df=True)
+
+	assert sorted(cfg["animal_ids"]) == sorted(dataset.animal_ids)
+	assert len(cfg["cages"]) == {1: 4, 4: 8}[boards]
+	files = sorted(p.name for p in dataset.data_path.glob("*.txt"))
+	# 48 hours of recording, one of them twice under the same wall-clock name.
+	assert len(files) == dataset.n_files == boards * 47
+	assert files[0].startswith(dataset.fname_prefix)
+
+	# 02:00-03:00 on 2023-10-29 is recorded twice, CEST then CET; both end up in
+	# order, as 00:xx and 01:xx UTC, and no read is lost as a duplicate.
+	utc = main_df.with_columns(pl.col("datetime").dt.convert_time_zone("UTC"))
+	repeated = utc.filter(pl.col("datetime").dt.date() == dt.date(2023, 10, 29))
+	assert {0, 1} <= set(repeated["datetime"].dt.hour())
+	assert utc.group_by("animal_id").agg(pl.col("datetime").is_sorted())["datetime"].all()
+	raw = pl.concat(
+		pl.read_csv(dataset.data_path / f, separator="\t", has_header=False) for f in files
+	)
+	assert (
+		main_df.filter(~pl.col("extrapolated")).height
+		== raw.filter(pl.col("column_6").is_in(dataset.animal_ids)).height
+	)
+
+	list(d.df_registry.run_pipeline(config_path, targets=["match_df"]))
+	matches = d.load_ecohab_data(config_path, "match_df", return_df=True)
+	assert matches.height >= dataset.n_chases > 0
+
+
+def test_generation_is_deterministic(tmp_path):
+	first = generate_raw_data(tmp_path / "a", animals=3, days=0.25, seed=7)
+	second = generate_raw_data(tmp_path / "b", animals=3, days=0.25, seed=7)
+
+	assert first.animal_ids == second.animal_ids
+	for f in first.data_path.iterdir():
+		assert f.read_bytes() == (second.data_path / f.name).read_bytes()
+
+
+def test_unknown_board_count_is_rejected(tmp_path):
+	with pytest.raises(ValueError, match="boards"):
+		generate_raw_data(tmp_path, boards=3)